@@ -1,8 +1,12 @@
+import pytest
 import random
 
 from eth_utils import (
     to_dict,
 )
+from hexbytes import (
+    HexBytes,
+)
 from hypothesis import (
     given,
     strategies as st,
@@ -11,6 +15,9 @@ from hypothesis import (
 from web3._utils.caching import (
     generate_cache_key,
 )
+from web3.datastructures import (
+    AttributeDict,
+)
 
 
 @to_dict
@@ -49,3 +56,52 @@ def test_key_generation_is_deterministic(value):
     left_key = generate_cache_key(left)
     right_key = generate_cache_key(right)
     assert left_key == right_key
+
+
+@given(value=all_st)
+def test_key_generation_treats_attribute_dicts_as_dicts(value):
+    assert generate_cache_key({"value": value}) == generate_cache_key(
+        AttributeDict({"value": value})
+    )
+
+
+def test_key_generation_treats_lists_and_tuples_alike():
+    assert generate_cache_key(["a", 1, [b"\x01"]]) == generate_cache_key(
+        ("a", 1, (b"\x01",))
+    )
+
+
+def test_key_generation_treats_bytes_subclasses_as_bytes():
+    assert generate_cache_key(HexBytes("0x1234")) == generate_cache_key(b"\x12\x34")
+
+
+def test_key_generation_treats_str_subclasses_as_str():
+    class Text(str):
+        pass
+
+    assert generate_cache_key(Text("a")) == generate_cache_key("a")
+    assert generate_cache_key([Text("a"), "b"]) == generate_cache_key(["a", "b"])
+    assert generate_cache_key([Text("a"), 1]) == generate_cache_key(["a", 1])
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    (
+        (1, "1"),
+        (1, True),
+        (0, False),
+        (0, None),
+        (1, 1.0),
+        ("0x01", b"\x01"),
+        ("", b""),
+        ([], {}),
+        (["ab", "c"], ["a", "bc"]),
+        ([[1], 2], [1, [2]]),
+        ({"a": "b"}, ["a", "b"]),
+        ({"a": None}, {"b": None}),
+        (2**256, 2**256 + 1),
+        (-1, 255),
+    ),
+)
+def test_key_generation_does_not_collide_across_types_or_boundaries(left, right):
+    assert generate_cache_key(left) != generate_cache_key(right)
@@ -41,3 +41,15 @@ def test_hasattr(w3, abi, attribute):
 
     assert hasattr(contract_attribute, "Increased") is True
     assert hasattr(contract_attribute, "Decreased") is False
+
+
+@pytest.mark.parametrize("attribute", ("functions", "events", "caller"))
+def test_attributes_are_built_on_first_access(w3, abi, attribute):
+    contract = w3.eth.contract(abi=abi)
+    contract_attribute = getattr(contract, attribute)
+    assert "Increased" not in vars(contract_attribute)
+
+    increased = getattr(contract_attribute, "Increased")
+
+    assert vars(contract_attribute)["Increased"] is increased
+    assert getattr(contract_attribute, "Increased") is increased
@@ -1149,6 +1149,26 @@ def test_changing_default_block_identifier(w3, math_contract):
     assert math_contract.functions.counter().call(block_identifier=None) == 7
 
 
+@pytest.mark.parametrize(
+    "transaction", ({}, {"type": 2}, {"gasPrice": 10**9}, {"value": 0})
+)
+def test_call_sends_only_eth_call(w3, math_contract, transaction):
+    methods = []
+
+    def record_methods(make_request, w3):
+        def middleware(method, params):
+            methods.append(method)
+            return make_request(method, params)
+
+        return middleware
+
+    # otherwise the eth-tester provider looks up the coinbase to fill in "from"
+    w3.eth.default_account = w3.eth.accounts[0]
+    w3.middleware_onion.add(record_methods)
+    assert math_contract.functions.counter().call(transaction) == 0
+    assert methods == ["eth_call"]
+
+
 # -- async -- #
 
 
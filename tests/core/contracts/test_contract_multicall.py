@@ -0,0 +1,287 @@
+import asyncio
+import pytest
+
+from eth_tester.exceptions import (
+    TransactionFailed,
+)
+from eth_utils import (
+    encode_hex,
+    is_same_address,
+    to_checksum_address,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+)
+from web3.utils.multicall import (
+    AGGREGATE3_INPUT_TYPES,
+    AGGREGATE3_OUTPUT_TYPES,
+    MULTICALL3_ADDRESS,
+)
+
+
+def _is_aggregate3_call(method, params):
+    return method == "eth_call" and is_same_address(params[0]["to"], MULTICALL3_ADDRESS)
+
+
+def _inner_calls(w3, params):
+    (calls,) = w3.codec.decode(AGGREGATE3_INPUT_TYPES, HexBytes(params[0]["data"])[4:])
+    for target, allow_failure, call_data in calls:
+        inner_params = [
+            {"to": to_checksum_address(target), "data": encode_hex(call_data)},
+            params[1],
+        ]
+        yield allow_failure, inner_params
+
+
+def _aggregate3_response(w3, results):
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": encode_hex(w3.codec.encode(AGGREGATE3_OUTPUT_TYPES, [results])),
+    }
+
+
+@pytest.fixture
+def aggregate3_requests(w3):
+    """
+    Answer ``aggregate3`` calls to the Multicall3 address like the deployed
+    contract would, by making each call, and record them.
+    """
+    requests = []
+
+    def multicall3_middleware(make_request, w3):
+        def middleware(method, params):
+            if not _is_aggregate3_call(method, params):
+                return make_request(method, params)
+
+            requests.append(params)
+            results = []
+            for allow_failure, inner_params in _inner_calls(w3, params):
+                try:
+                    response = make_request("eth_call", inner_params)
+                except TransactionFailed:
+                    if not allow_failure:
+                        raise ContractLogicError(
+                            "execution reverted: Multicall3: call failed"
+                        )
+                    results.append((False, b""))
+                else:
+                    results.append((True, HexBytes(response["result"])))
+            return _aggregate3_response(w3, results)
+
+        return middleware
+
+    w3.middleware_onion.add(multicall3_middleware)
+    return requests
+
+
+@pytest.fixture
+def async_aggregate3_requests(async_w3):
+    requests = []
+
+    async def async_multicall3_middleware(make_request, w3):
+        async def middleware(method, params):
+            if not _is_aggregate3_call(method, params):
+                return await make_request(method, params)
+
+            requests.append(params)
+            results = []
+            for allow_failure, inner_params in _inner_calls(w3, params):
+                try:
+                    response = await make_request("eth_call", inner_params)
+                except TransactionFailed:
+                    if not allow_failure:
+                        raise ContractLogicError(
+                            "execution reverted: Multicall3: call failed"
+                        )
+                    results.append((False, b""))
+                else:
+                    results.append((True, HexBytes(response["result"])))
+            return _aggregate3_response(w3, results)
+
+        return middleware
+
+    async_w3.middleware_onion.add(async_multicall3_middleware)
+    return requests
+
+
+def test_multicall_results_match_calls(
+    w3, aggregate3_requests, math_contract, revert_contract
+):
+    functions = [
+        math_contract.functions.add(2, 3),
+        math_contract.functions.counter(),
+        math_contract.functions.multiply7(6),
+        revert_contract.functions.normalFunction(),
+    ]
+    multicall = w3.multicall()
+    for function in functions:
+        multicall.add(function)
+
+    results = multicall.call()
+
+    assert results == [5, 0, 42, True]
+    assert results == [function.call() for function in functions]
+    assert len(aggregate3_requests) == 1
+
+
+def test_multicall_allow_failure(
+    w3, aggregate3_requests, math_contract, revert_contract
+):
+    multicall = w3.multicall()
+    multicall.add(math_contract.functions.add(2, 3))
+    multicall.add(revert_contract.functions.revertWithMessage(), allow_failure=True)
+
+    assert multicall.call() == [5, None]
+
+    multicall.add(revert_contract.functions.revertWithMessage())
+    with pytest.raises(ContractLogicError):
+        multicall.call()
+
+
+def test_multicall_undecodable_result(w3, aggregate3_requests, math_contract):
+    no_code_contract = w3.eth.contract(address="0x" + "11" * 20, abi=math_contract.abi)
+    multicall = w3.multicall()
+    multicall.add(no_code_contract.functions.counter(), allow_failure=True)
+    assert multicall.call() == [None]
+
+    multicall.add(no_code_contract.functions.counter())
+    with pytest.raises(BadFunctionCallOutput, match="output_types: \\['uint256'\\]"):
+        multicall.call()
+
+
+def test_multicall_batches_read_the_same_block(w3, aggregate3_requests, math_contract):
+    multicall = w3.multicall(batch_size=2)
+    for value in range(5):
+        multicall.add(math_contract.functions.multiply7(value))
+
+    assert multicall.call() == [0, 7, 14, 21, 28]
+    assert len(aggregate3_requests) == 3
+    block_number = w3.eth.block_number
+    assert {params[1] for params in aggregate3_requests} == {hex(block_number)}
+
+
+def test_multicall_rejects_contract_without_address(w3, math_contract):
+    math_contract_factory = w3.eth.contract(abi=math_contract.abi)
+    with pytest.raises(ValueError, match="has an address"):
+        w3.multicall().add(math_contract_factory.functions.counter())
+
+
+# -- async -- #
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_results_match_calls(
+    async_w3, async_aggregate3_requests, async_math_contract, async_revert_contract
+):
+    multicall = async_w3.multicall()
+    multicall.add(async_math_contract.functions.add(2, 3))
+    multicall.add(async_revert_contract.functions.revertWithMessage(), True)
+    multicall.add(async_revert_contract.functions.normalFunction())
+
+    assert await multicall.call() == [5, None, True]
+    assert len(async_aggregate3_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_load_batches_calls_of_the_same_tick(
+    async_w3, async_aggregate3_requests, async_math_contract, async_revert_contract
+):
+    multicall = async_w3.multicall()
+
+    results = await asyncio.gather(
+        *(
+            multicall.load(async_math_contract.functions.multiply7(value))
+            for value in range(4)
+        ),
+        multicall.load(async_revert_contract.functions.revertWithMessage(), True),
+        multicall.load(async_math_contract.functions.counter(), block_identifier=1),
+    )
+
+    assert results == [0, 7, 14, 21, None, 0]
+    # one aggregate3 call per block identifier
+    assert [params[1] for params in async_aggregate3_requests] == ["latest", "0x1"]
+
+    assert await multicall.load(async_math_contract.functions.add(2, 3)) == 5
+    assert len(async_aggregate3_requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_load_batches_read_the_same_block(
+    async_w3, async_aggregate3_requests, async_math_contract
+):
+    multicall = async_w3.multicall(batch_size=2)
+
+    results = await asyncio.gather(
+        *(
+            multicall.load(async_math_contract.functions.multiply7(value))
+            for value in range(5)
+        )
+    )
+
+    assert results == [0, 7, 14, 21, 28]
+    assert len(async_aggregate3_requests) == 3
+    block_number = await async_w3.eth.block_number
+    assert {params[1] for params in async_aggregate3_requests} == {hex(block_number)}
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_load_propagates_errors(
+    async_w3, async_aggregate3_requests, async_math_contract, async_revert_contract
+):
+    multicall = async_w3.multicall()
+
+    results = await asyncio.gather(
+        multicall.load(async_math_contract.functions.add(2, 3)),
+        multicall.load(async_revert_contract.functions.revertWithMessage()),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ContractLogicError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_load_sets_decoding_errors_on_futures(
+    async_w3, async_aggregate3_requests, async_math_contract, monkeypatch
+):
+    multicall = async_w3.multicall()
+
+    def _decode_result(call, success, return_data):
+        if call.call_plan.fn_abi["name"] == "counter":
+            raise ValueError("cannot decode")
+        return "decoded"
+
+    monkeypatch.setattr(multicall, "_decode_result", _decode_result)
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            multicall.load(async_math_contract.functions.counter()),
+            multicall.load(async_math_contract.functions.add(2, 3)),
+            return_exceptions=True,
+        ),
+        timeout=5,
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert results[1] == "decoded"
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_load_without_multicall3_deployed(
+    async_w3, async_math_contract
+):
+    multicall = async_w3.multicall()
+    with pytest.raises(BadFunctionCallOutput, match="is Multicall3 deployed"):
+        await multicall.load(async_math_contract.functions.counter())
+
+
+def test_multicall_without_multicall3_deployed(w3, math_contract):
+    multicall = w3.multicall()
+    multicall.add(math_contract.functions.counter())
+
+    with pytest.raises(BadFunctionCallOutput, match="is Multicall3 deployed"):
+        multicall.call()
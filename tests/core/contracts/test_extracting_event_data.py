@@ -13,6 +13,8 @@ from web3._utils.events import (
 )
 from web3.exceptions import (
     LogTopicError,
+    MismatchedABI,
+    NoABIEventsFound,
     Web3ValidationError,
 )
 from web3.logs import (
@@ -21,6 +23,9 @@ from web3.logs import (
     STRICT,
     WARN,
 )
+from web3.utils.events import (
+    EventLogDecoder,
+)
 
 
 @pytest.fixture()
@@ -1160,3 +1165,45 @@ def test_get_all_entries_with_nested_tuple_event_non_strict(
     assert log_entry.blockNumber == txn_receipt["blockNumber"]
     assert log_entry.transactionIndex == txn_receipt["transactionIndex"]
     assert is_same_address(log_entry.address, non_strict_emitter.address)
+
+
+def test_contract_events_process_receipt(event_contract, dup_txn_receipt):
+    events = event_contract.events.process_receipt(dup_txn_receipt)
+
+    assert [event.event for event in events] == ["LogSingleWithIndex", "LogSingleArg"]
+    assert [event.args for event in events] == [{"arg0": 12345}, {"arg0": 12345}]
+    assert events == event_contract.events.process_logs(dup_txn_receipt["logs"])
+
+
+def test_contract_events_process_receipt_with_errors(
+    indexed_event_contract, dup_txn_receipt
+):
+    contract_events = indexed_event_contract.events
+
+    with pytest.raises(LogTopicError, match="Expected 1 log topics.  Got 0"):
+        contract_events.process_receipt(dup_txn_receipt, errors=STRICT)
+    events = contract_events.process_receipt(dup_txn_receipt, errors=IGNORE)
+    assert [event.get("event") for event in events] == [None, "LogSingleArg"]
+    assert isinstance(events[0].errors, LogTopicError)
+
+
+def test_contract_events_process_receipt_without_events(w3, dup_txn_receipt):
+    with pytest.raises(NoABIEventsFound):
+        w3.eth.contract(abi=[]).events.process_receipt(dup_txn_receipt)
+
+
+def test_event_log_decoder(
+    w3, event_contract, indexed_event_contract, dup_txn_receipt, emitter
+):
+    decoder = EventLogDecoder(w3.codec, indexed_event_contract.abi, event_contract.abi)
+
+    # ``LogSingleWithIndex`` is indexed in only one of the ABIs
+    events = decoder.process_receipt(dup_txn_receipt)
+    assert [event.event for event in events] == ["LogSingleWithIndex", "LogSingleArg"]
+    assert events[0].args == {"arg0": 12345}
+
+    txn_hash = emitter.functions.logStruct(1, (2, 3, (4,))).transact()
+    emitter_receipt = w3.eth.wait_for_transaction_receipt(txn_hash)
+    assert decoder.process_receipt(emitter_receipt, errors=DISCARD) == ()
+    with pytest.raises(MismatchedABI, match="did not match any event"):
+        decoder.process_receipt(emitter_receipt, errors=STRICT)
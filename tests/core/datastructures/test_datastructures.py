@@ -1,9 +1,15 @@
 import pytest
+import json
+import pickle
 import random
 import re
 
+from web3._utils.encoding import (
+    to_json,
+)
 from web3.datastructures import (
     AttributeDict,
+    CompactAttributeDict,
     tupleize_lists_nested,
 )
 
@@ -207,3 +213,77 @@ def test_AttributeDict_hashing_backwards_compatibility(input, error):
             assert hash(tuple(sorted(input.items()))) == hash(input)
     else:
         assert hash(tuple(sorted(input.items()))) == hash(input)
+
+
+def _to_dict(value):
+    if isinstance(value, AttributeDict):
+        return {key: _to_dict(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_to_dict(item) for item in value)
+    return value
+
+
+def test_compact_attribute_dict_matches_attribute_dict_random():
+    for _ in range(1000):
+        random_dict = _to_dict(generate_random_dict())
+        compact = CompactAttributeDict.recursive(random_dict)
+        attrdict = AttributeDict.recursive(random_dict)
+        assert hash(compact) == hash(attrdict)
+        assert compact == attrdict
+        assert attrdict == compact
+        assert compact == random_dict
+        assert list(compact.items()) == list(attrdict.items())
+
+
+def test_compact_attribute_dict_wraps_nested_values_lazily():
+    raw = {"a": 1, "b": {"c": [{"d": 2}, ({"e": 3},)]}}
+    compact = CompactAttributeDict.recursive(raw)
+
+    assert compact.a == 1
+    assert isinstance(compact.b, CompactAttributeDict)
+    assert compact.b is compact["b"]
+    assert isinstance(compact.b.c, list)
+    assert isinstance(compact.b.c[0], CompactAttributeDict)
+    assert isinstance(compact.b.c[1], tuple)
+    assert compact.b.c[1][0].e == 3
+    # the wrapped mapping is never modified
+    assert raw == {"a": 1, "b": {"c": [{"d": 2}, ({"e": 3},)]}}
+
+
+def test_compact_attribute_dict_mapping_interface():
+    compact = CompactAttributeDict({"a": 1}, b=2)
+    assert len(compact) == 2
+    assert list(compact) == ["a", "b"]
+    assert "b" in compact and "c" not in compact
+    assert compact.get("c") is None
+    assert repr(compact) == "CompactAttributeDict({'a': 1, 'b': 2})"
+    with pytest.raises(KeyError):
+        compact["c"]
+    with pytest.raises(AttributeError, match="no attribute 'c'"):
+        compact.c
+    with pytest.raises(TypeError):
+        compact.a = 3
+    with pytest.raises(TypeError):
+        del compact.a
+
+
+def test_compact_attribute_dict_pickles():
+    compact = CompactAttributeDict.recursive({"a": [{"b": 1}]})
+    unpickled = pickle.loads(pickle.dumps(compact))
+    assert isinstance(unpickled, CompactAttributeDict)
+    assert unpickled == compact
+    assert hash(unpickled) == hash(compact)
+
+
+def test_compact_attribute_dict_to_json():
+    raw = {"a": 1, "b": {"c": [{"d": 2}, ({"e": 3},)]}}
+    compact = CompactAttributeDict.recursive(raw)
+
+    assert json.loads(to_json(compact)) == {"a": 1, "b": {"c": [{"d": 2}, [{"e": 3}]]}}
+    assert to_json(compact) == to_json(AttributeDict.recursive(raw))
+
+
+def test_compact_attribute_dict_unhashable_value():
+    compact = CompactAttributeDict({"myset": {1, 2, 3}})
+    with pytest.raises(TypeError, match="unhashable type: 'set'"):
+        hash(compact)
@@ -10,6 +10,9 @@ from hexbytes import (
 from web3._utils.rpc_abi import (
     RPC,
 )
+from web3.datastructures import (
+    LazyAttributeDict,
+)
 from web3.middleware import (
     construct_result_generator_middleware,
 )
@@ -26,6 +29,27 @@ def test_uses_default_block(w3, extra_accounts, wait_for_transaction):
     assert w3.eth.default_block == w3.eth.block_number
 
 
+def test_get_block_with_lazy_results(w3):
+    block = w3.eth.get_block("latest", True)
+
+    w3.eth.lazy_results = True
+    lazy_block = w3.eth.get_block("latest", True)
+
+    assert isinstance(lazy_block, LazyAttributeDict)
+    assert lazy_block.number == block.number
+    assert lazy_block == block
+
+
+def test_get_block_with_lazy_results_to_json(w3):
+    block = w3.eth.get_block("latest", True)
+
+    w3.eth.lazy_results = True
+    lazy_block = w3.eth.get_block("latest", True)
+
+    # no field has been read yet
+    assert w3.to_json(lazy_block) == w3.to_json(block)
+
+
 def test_get_block_formatters_with_null_values(w3):
     null_values_block = {
         "baseFeePerGas": None,
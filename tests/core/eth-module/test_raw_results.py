@@ -0,0 +1,121 @@
+import pytest
+
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    BlockNotFound,
+)
+from web3.method import (
+    Method,
+)
+from web3.middleware import (
+    construct_result_generator_middleware,
+)
+from web3.module import (
+    Module,
+    raw_results_mode,
+)
+
+RAW_BLOCK = {
+    "number": "0x2a",
+    "hash": "0x759bc3c1221beb27a7074dbf33faded2276b04df6aaf225d51c426b8c481e935",
+    "miner": "0x0deadbeefdeadbeef72211ad2c21deadbeeffeed",
+    "gasLimit": "0x1c9c380",
+    "transactions": [],
+}
+
+
+@pytest.fixture
+def raw_block_w3(w3):
+    result_middleware = construct_result_generator_middleware(
+        {
+            RPC.eth_getBlockByNumber: lambda *_: dict(RAW_BLOCK),
+            RPC.eth_blockNumber: lambda *_: RAW_BLOCK["number"],
+        }
+    )
+    w3.middleware_onion.inject(result_middleware, "result_middleware", layer=0)
+    return w3
+
+
+def test_raw_results_per_instance(raw_block_w3):
+    w3 = raw_block_w3
+    w3.eth.raw_results = True
+    assert w3.eth.get_block("latest") == RAW_BLOCK
+    assert type(w3.eth.get_block("latest")) is dict
+
+    w3.eth.raw_results = False
+    block = w3.eth.get_block("latest")
+    assert isinstance(block, AttributeDict)
+    assert block.number == 42
+
+
+def test_raw_results_per_call(raw_block_w3):
+    w3 = raw_block_w3
+    with raw_results_mode():
+        block_number = w3.eth.block_number
+        block = w3.eth.get_block("latest")
+
+    assert block_number == "0x2a"
+    assert block == RAW_BLOCK
+    assert type(block) is dict
+    assert w3.eth.block_number == 42
+
+
+def test_method_callers_are_only_wrapped_in_raw_results_mode(w3):
+    assert not hasattr(w3.eth._get_block, "__wrapped__")
+    with raw_results_mode():
+        assert hasattr(w3.eth._get_block, "__wrapped__")
+
+
+class ModuleWithResultFormatters(Module):
+    get_block_number = Method(
+        RPC.eth_blockNumber,
+        result_formatters=lambda method, module: lambda result: int(result, 16),
+    )
+
+
+def test_raw_results_skips_explicit_result_formatters(raw_block_w3):
+    w3 = raw_block_w3
+    w3.attach_modules({"custom": ModuleWithResultFormatters})
+
+    assert w3.custom.get_block_number() == 42
+    with raw_results_mode():
+        assert w3.custom.get_block_number() == "0x2a"
+
+
+def test_raw_results_keeps_error_handling(w3):
+    with raw_results_mode():
+        with pytest.raises(BlockNotFound):
+            w3.eth.get_block(1000000)
+
+
+def test_raw_results_formats_requests_made_by_middleware(w3):
+    # validation and gas estimation request ``chain_id`` and ``get_block``
+    # while serving the raw call, which must still see formatted results
+    w3.eth.raw_results = True
+    tx_hash = w3.eth.send_transaction(
+        {
+            "from": w3.eth.accounts[0],
+            "to": w3.eth.accounts[1],
+            "value": 1,
+            "chainId": 131277322940537,
+        }
+    )
+    assert isinstance(tx_hash, str)
+    assert type(w3.eth.get_transaction_receipt(tx_hash)) is dict
+
+
+@pytest.mark.asyncio
+async def test_async_raw_results(async_w3):
+    with raw_results_mode():
+        block = await async_w3.eth.get_block("latest")
+    assert type(block) is dict
+
+    async_w3.eth.raw_results = True
+    assert type(await async_w3.eth.get_block("latest")) is dict
+    async_w3.eth.raw_results = False
+    assert isinstance(await async_w3.eth.get_block("latest"), AttributeDict)
@@ -0,0 +1,153 @@
+import pytest
+import time
+
+from web3.instrumentation import (
+    CallbackSink,
+    Histogram,
+    MiddlewareRecord,
+    PrometheusSink,
+    RequestInstrumentation,
+    RequestMetrics,
+    report_response_size,
+)
+from web3.manager import (
+    RequestManager,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+
+class DummyProvider(BaseProvider):
+    def make_request(self, method, params):
+        report_response_size(42)
+        if method == "fail":
+            raise ValueError("provider failure")
+        if method == "error":
+            return {"error": {"code": -32000, "message": "error"}}
+        return {"result": method}
+
+
+def sleeping_middleware(before, after=0.0):
+    def middleware(make_request, w3):
+        def middleware_fn(method, params):
+            time.sleep(before)
+            response = make_request(method, params)
+            time.sleep(after)
+            return response
+
+        return middleware_fn
+
+    return middleware
+
+
+@pytest.fixture
+def metrics():
+    return RequestMetrics()
+
+
+@pytest.fixture
+def manager(metrics):
+    manager = RequestManager(
+        None,
+        DummyProvider(),
+        middlewares=[
+            (sleeping_middleware(0.02, 0.01), "outer"),
+            (sleeping_middleware(0.0), "inner"),
+        ],
+    )
+    manager.instrumentation = RequestInstrumentation(metrics)
+    return manager
+
+
+def test_histogram_buckets():
+    histogram = Histogram((1, 2))
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == 6
+    assert histogram.mean == 1.5
+
+
+def test_instrumentation_records_requests(manager, metrics):
+    assert manager.request_blocking("eth_method", []) == "eth_method"
+    assert manager.request_blocking("eth_method", []) == "eth_method"
+
+    eth_method = metrics.methods["eth_method"]
+    assert eth_method.requests == 2
+    assert eth_method.errors == 0
+    assert eth_method.response_bytes == 84
+    assert eth_method.latency.count == 2
+    assert eth_method.latency.sum >= 0.06
+
+
+def test_instrumentation_records_middleware_self_time(manager, metrics):
+    manager.request_blocking("eth_method", [])
+
+    assert set(metrics.middlewares) == {"outer", "inner", "provider"}
+    assert all(h.count == 1 for h in metrics.middlewares.values())
+    assert metrics.middlewares["outer"].sum >= 0.03
+    assert metrics.middlewares["inner"].sum < 0.01
+    total = sum(h.sum for h in metrics.middlewares.values())
+    assert total == pytest.approx(metrics.methods["eth_method"].latency.sum, abs=1e-3)
+
+
+def test_instrumentation_records_errors(manager, metrics):
+    with pytest.raises(ValueError):
+        manager.request_blocking("error", [])
+    with pytest.raises(ValueError, match="provider failure"):
+        manager.request_blocking("fail", [])
+
+    assert metrics.methods["error"].errors == 1
+    assert metrics.methods["fail"].errors == 1
+    assert metrics.methods["fail"].requests == 1
+
+
+def test_instrumentation_callback_sink(manager):
+    requests, middlewares = [], []
+    manager.instrumentation = RequestInstrumentation(
+        CallbackSink(requests.append, middlewares.append)
+    )
+    manager.request_blocking("eth_method", [])
+
+    (request,) = requests
+    assert request.method == "eth_method"
+    assert request.error is False
+    assert request.response_bytes == 42
+    assert [record.name for record in middlewares] == ["provider", "inner", "outer"]
+    assert all(isinstance(record, MiddlewareRecord) for record in middlewares)
+
+
+def test_instrumentation_names_default_middlewares(w3, metrics):
+    w3.manager.instrumentation = RequestInstrumentation(metrics)
+    w3.eth.block_number
+
+    assert metrics.methods["eth_blockNumber"].requests == 1
+    assert metrics.methods["eth_blockNumber"].response_bytes == 0
+    assert {"attrdict", "validation", "gas_estimate", "provider"} <= set(
+        metrics.middlewares
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_instrumentation(async_w3, metrics):
+    async_w3.manager.instrumentation = RequestInstrumentation(metrics)
+    await async_w3.eth.block_number
+    await async_w3.eth.get_block("latest")
+
+    assert metrics.methods["eth_blockNumber"].requests == 1
+    assert metrics.methods["eth_getBlockByNumber"].requests == 1
+    assert metrics.middlewares["provider"].count == 2
+
+
+def test_prometheus_sink():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    manager = RequestManager(None, DummyProvider(), middlewares=[])
+    manager.instrumentation = RequestInstrumentation(PrometheusSink(registry))
+    manager.request_blocking("eth_method", [])
+
+    labels = {"method": "eth_method"}
+    assert registry.get_sample_value("web3_requests_total", labels) == 1
+    assert registry.get_sample_value("web3_response_bytes_total", labels) == 42
@@ -7,11 +7,14 @@ from web3 import (
 )
 from web3.datastructures import (
     AttributeDict,
+    CompactAttributeDict,
 )
 from web3.middleware import (
     async_attrdict_middleware,
+    async_compact_attrdict_middleware,
     async_construct_result_generator_middleware,
     attrdict_middleware,
+    compact_attrdict_middleware,
     construct_result_generator_middleware,
 )
 from web3.providers.eth_tester import (
@@ -69,6 +72,29 @@ def test_attrdict_middleware_is_recursive(w3):
     w3.middleware_onion.remove("result_gen")
 
 
+def test_compact_attrdict_middleware():
+    w3 = Web3(EthereumTesterProvider())
+    w3.middleware_onion.replace("attrdict", compact_attrdict_middleware)
+    w3.middleware_onion.inject(
+        construct_result_generator_middleware(
+            {RPCEndpoint("fake_endpoint"): lambda *_: GENERATED_NESTED_DICT_RESULT}
+        ),
+        "result_gen",
+        layer=0,
+    )
+    response = w3.manager.request_blocking("fake_endpoint", [])
+
+    result = response["result"]
+    assert isinstance(result, CompactAttributeDict)
+    assert isinstance(result.b.b2.b2b, CompactAttributeDict)
+    assert result.b.b2.b2b.b2b2.test == "fin"
+    assert result == AttributeDict.recursive(GENERATED_NESTED_DICT_RESULT["result"])
+
+    block = w3.eth.get_block("latest")
+    assert isinstance(block, CompactAttributeDict)
+    assert block.number == 0
+
+
 def test_no_attrdict_middleware_does_not_convert_dicts_to_attrdict():
     w3 = Web3(EthereumTesterProvider())
 
@@ -131,6 +157,25 @@ async def test_async_attrdict_middleware_is_recursive(async_w3):
     async_w3.middleware_onion.remove("result_gen")
 
 
+@pytest.mark.asyncio
+async def test_async_compact_attrdict_middleware():
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    async_w3.middleware_onion.replace("attrdict", async_compact_attrdict_middleware)
+    async_w3.middleware_onion.inject(
+        await async_construct_result_generator_middleware(
+            {RPCEndpoint("fake_endpoint"): lambda *_: GENERATED_NESTED_DICT_RESULT}
+        ),
+        "result_gen",
+        layer=0,
+    )
+    response = await async_w3.manager.coro_request("fake_endpoint", [])
+
+    result = response["result"]
+    assert isinstance(result, CompactAttributeDict)
+    assert result.b.b2.b2b.b2b2.test == "fin"
+    assert result == AttributeDict.recursive(GENERATED_NESTED_DICT_RESULT["result"])
+
+
 @pytest.mark.asyncio
 async def test_no_async_attrdict_middleware_does_not_convert_dicts_to_attrdict():
     async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
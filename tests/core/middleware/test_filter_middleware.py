@@ -1,5 +1,8 @@
 import pytest
 
+from eth_utils.toolz import (
+    concat,
+)
 from hexbytes import (
     HexBytes,
 )
@@ -23,9 +26,12 @@ from web3.middleware import (
     local_filter_middleware,
 )
 from web3.middleware.filter import (
+    async_get_logs_adaptive,
     async_iter_latest_block_ranges,
     block_ranges,
+    get_logs_adaptive,
     iter_latest_block_ranges,
+    shrink_log_range,
 )
 from web3.providers.async_base import (
     AsyncBaseProvider,
@@ -257,6 +263,118 @@ def test_local_filter_middleware(w3, iter_block_number):
     assert len(filter_ids) == len(set(filter_ids))
 
 
+ADAPTIVE_LOG_BLOCKS = [1, 2, 3, 4, 5, 60]
+
+
+def adaptive_get_logs(requests, max_logs=None, max_blocks=None):
+    def get_logs(method, params):
+        from_block = int(params[0]["fromBlock"], 16)
+        to_block = int(params[0]["toBlock"], 16)
+        requests.append((from_block, to_block))
+        if max_blocks is not None and to_block - from_block + 1 > max_blocks:
+            raise ValueError({"code": -32600, "message": "block range too large"})
+        logs = [
+            AttributeDict({**FILTER_LOG[0], "blockNumber": block_number})
+            for block_number in ADAPTIVE_LOG_BLOCKS
+            if from_block <= block_number <= to_block
+        ]
+        if max_logs is not None and len(logs) > max_logs:
+            raise ValueError(
+                {"code": -32005, "message": "query returned more than 10000 results"}
+            )
+        return logs
+
+    return get_logs
+
+
+def adaptive_w3(w3_base, get_logs):
+    w3_base.middleware_onion.add(
+        construct_result_generator_middleware({"eth_getLogs": get_logs})
+    )
+    return w3_base
+
+
+def test_get_logs_adaptive_splits_ranges_with_too_many_logs(w3_base):
+    requests = []
+    w3 = adaptive_w3(w3_base, adaptive_get_logs(requests, max_logs=2))
+
+    logs = list(get_logs_adaptive(w3, 0, 99, initial_blocks=4, target_logs=2))
+
+    assert requests == [
+        (0, 3),
+        (0, 1),
+        (2, 5),
+        (2, 3),
+        (4, 5),
+        (6, 7),
+        (8, 11),
+        (12, 19),
+        (20, 35),
+        (36, 67),
+        (68, 99),
+    ]
+    assert [[log.blockNumber for log in range_logs] for range_logs in logs] == [
+        [1],
+        [2, 3],
+        [4, 5],
+        [],
+        [],
+        [],
+        [],
+        [60],
+        [],
+    ]
+
+
+def test_get_logs_adaptive_keeps_ranges_under_the_node_limit(w3_base):
+    requests = []
+    w3 = adaptive_w3(w3_base, adaptive_get_logs(requests, max_blocks=8))
+
+    logs = list(concat(get_logs_adaptive(w3, 0, 35, initial_blocks=4)))
+
+    assert requests == [(0, 3), (4, 11), (12, 27), (12, 19), (20, 27), (28, 35)]
+    assert [log.blockNumber for log in logs] == [1, 2, 3, 4, 5]
+
+
+def test_get_logs_adaptive_errors(w3_base):
+    requests = []
+    w3 = adaptive_w3(w3_base, adaptive_get_logs(requests, max_logs=0))
+
+    with pytest.raises(ValueError, match="query returned more than"):
+        list(get_logs_adaptive(w3, 0, 3, initial_blocks=4))
+    assert requests == [(0, 3), (0, 1), (0, 0), (1, 2), (1, 1)]
+    with pytest.raises(ValueError, match="positive integers"):
+        list(get_logs_adaptive(w3, 0, 3, initial_blocks=0))
+
+
+@pytest.mark.parametrize(
+    "message,shrunk",
+    (
+        ("query returned more than 10000 results", (4, 100)),
+        ("block range too large", (4, 4)),
+        ("exceed maximum block range: 5000", (4, 4)),
+        ("Block range limit exceeded. Maximum allowed is 5000", (4, 4)),
+    ),
+)
+def test_shrink_log_range(message, shrunk):
+    error = ValueError({"code": -32000, "message": message})
+    assert shrink_log_range(error, 8, 100) == shrunk
+    with pytest.raises(ValueError, match=message.split(".")[0]):
+        shrink_log_range(error, 1, 100)
+
+
+@pytest.mark.parametrize(
+    "message",
+    (
+        "invalid block range params",
+        "block range extends beyond current head block",
+    ),
+)
+def test_shrink_log_range_raises_errors_that_arent_limits(message):
+    with pytest.raises(ValueError, match=message):
+        shrink_log_range(ValueError({"code": -32000, "message": message}), 8, 100)
+
+
 # --- async --- #
 
 
@@ -368,6 +486,38 @@ async def test_async_iter_latest_block_ranges(
         assert actual_tuple == expected_tuple
 
 
+@pytest.mark.asyncio
+async def test_async_get_logs_adaptive(async_w3_base):
+    requests = []
+    get_logs = adaptive_get_logs(requests, max_logs=2, max_blocks=16)
+    async_w3_base.middleware_onion.add(
+        await async_construct_result_generator_middleware({"eth_getLogs": get_logs})
+    )
+
+    logs = [
+        range_logs
+        async for range_logs in async_get_logs_adaptive(
+            async_w3_base, 0, 63, initial_blocks=4, target_logs=2
+        )
+    ]
+
+    assert requests == [
+        (0, 3),
+        (0, 1),
+        (2, 5),
+        (2, 3),
+        (4, 5),
+        (6, 7),
+        (8, 11),
+        (12, 19),
+        (20, 35),
+        (36, 63),
+        (36, 49),
+        (50, 63),
+    ]
+    assert [log.blockNumber for log in concat(logs)] == ADAPTIVE_LOG_BLOCKS
+
+
 @pytest.mark.asyncio
 async def test_async_local_filter_middleware(async_w3, iter_block_number):
     block_filter = await async_w3.eth.filter("latest")
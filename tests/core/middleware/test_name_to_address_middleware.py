@@ -1,7 +1,11 @@
 import pytest
+import time
 
 import pytest_asyncio
 
+from ens import (
+    ENS,
+)
 from web3 import (
     AsyncWeb3,
     Web3,
@@ -14,6 +18,8 @@ from web3.middleware import (
     name_to_address_middleware,
 )
 from web3.middleware.names import (
+    _ENSAddressCache,
+    _may_contain_ens_names,
     async_name_to_address_middleware,
 )
 from web3.providers.eth_tester import (
@@ -32,6 +38,16 @@ class TempENS:
         return self.registry.get(name, None)
 
 
+class CountingENS(TempENS):
+    def __init__(self, name_addr_pairs):
+        super().__init__(name_addr_pairs)
+        self.lookups = 0
+
+    def address(self, name):
+        self.lookups += 1
+        return super().address(name)
+
+
 @pytest.fixture
 def _w3_setup():
     return Web3(provider=EthereumTesterProvider(), middlewares=[])
@@ -101,6 +117,103 @@ def test_fail_name_resolver(w3):
         w3.eth.get_balance("ethereum.eth")
 
 
+@pytest.mark.parametrize(
+    "method,params,expected",
+    (
+        ("eth_getBalance", [NAME, "latest"], True),
+        ("eth_getBalance", ["0x" + "00" * 20, "latest"], False),
+        ("eth_getBalance", ["0X" + "Ab" * 20, "latest"], False),
+        ("eth_getBalance", ["ab" * 20, "latest"], True),
+        ("eth_getBalance", ["0xnot-hex.eth", "latest"], True),
+        ("eth_getStorageAt", ["0x" + "00" * 20, "latest", NAME], False),
+        ("eth_call", [{"to": "0x" + "00" * 20, "data": "0x12"}, "latest"], False),
+        ("eth_call", [{"to": NAME, "data": "0x12"}, "latest"], True),
+        ("eth_getLogs", [{"address": ["0x" + "00" * 20]}], False),
+        ("eth_getLogs", [{"address": ["0x" + "00" * 20, NAME]}], True),
+        ("eth_getLogs", [{"address": None}], False),
+        ("eth_blockNumber", [], False),
+    ),
+)
+def test_may_contain_ens_names(method, params, expected):
+    assert _may_contain_ens_names(method, params) is expected
+
+
+def test_name_resolver_skips_requests_without_names(w3, ens_mapped_address):
+    w3.ens = CountingENS({})
+    w3.eth.get_balance(ens_mapped_address)
+    w3.eth.send_transaction(
+        {"from": ens_mapped_address, "to": ens_mapped_address, "value": 1, "gas": 21000}
+    )
+    assert w3.ens.lookups == 0
+
+
+def test_name_resolver_caches_resolved_names(w3, ens_mapped_address):
+    w3.ens = CountingENS({NAME: ens_mapped_address})
+    w3.eth.get_balance(NAME)
+    w3.eth.get_balance(NAME)
+    assert w3.ens.lookups == 1
+
+    # a new ENS instance is not served from the cache
+    w3.ens = CountingENS({NAME: ens_mapped_address})
+    w3.eth.get_balance(NAME)
+    assert w3.ens.lookups == 1
+
+
+def test_name_resolver_caches_names_resolved_with_default_ens(
+    _w3_setup, ens_mapped_address, monkeypatch
+):
+    lookups = []
+
+    def address(ens, name):
+        lookups.append(name)
+        return ens_mapped_address
+
+    # ``w3.ens`` is a new ``ENS`` instance on every access
+    monkeypatch.setattr(ENS, "address", address)
+    _w3_setup.middleware_onion.add(name_to_address_middleware(_w3_setup))
+    _w3_setup.eth.get_balance(NAME)
+    _w3_setup.eth.get_balance(NAME)
+    assert lookups == [NAME]
+
+    # nor is a name resolved through another provider
+    _w3_setup.provider = EthereumTesterProvider()
+    _w3_setup.eth.get_balance(NAME)
+    assert lookups == [NAME, NAME]
+
+
+def test_name_resolver_cache_ttl(_w3_setup, ens_mapped_address):
+    _w3_setup.ens = CountingENS({NAME: ens_mapped_address})
+    _w3_setup.middleware_onion.add(
+        name_to_address_middleware(_w3_setup, ens_cache_ttl=0)
+    )
+    _w3_setup.eth.get_balance(NAME)
+    _w3_setup.eth.get_balance(NAME)
+    assert _w3_setup.ens.lookups == 2
+
+
+def test_ens_address_cache_tolerates_entries_dropped_by_other_threads(
+    ens_mapped_address,
+):
+    class EntriesDroppedOnGet(dict):
+        # the entry is dropped by another thread once it has been read
+        def get(self, name, default=None):
+            entry = super().get(name, default)
+            self.pop(name, None)
+            return entry
+
+    cache = _ENSAddressCache(ttl=0.01, size=1)
+    cache._entries = EntriesDroppedOnGet()
+    resolver_key = object()
+    cache.set(resolver_key, NAME, ens_mapped_address)
+    time.sleep(0.02)
+    assert cache.get(resolver_key, NAME) is None
+
+    cache._entries = {}
+    cache.set(resolver_key, NAME, ens_mapped_address)
+    cache.set(resolver_key, "other.eth", ens_mapped_address)
+    assert list(cache._entries) == ["other.eth"]
+
+
 # --- async --- #
 
 
@@ -109,6 +222,11 @@ class AsyncTempENS(TempENS):
         return self.registry.get(name, None)
 
 
+class AsyncCountingENS(CountingENS):
+    async def address(self, name):
+        return super().address(name)
+
+
 @pytest_asyncio.fixture
 async def _async_w3_setup():
     return AsyncWeb3(provider=AsyncEthereumTesterProvider(), middlewares=[])
@@ -180,3 +298,14 @@ async def test_async_pass_name_resolver_send_transaction_dict_args(
 async def test_async_fail_name_resolver(async_w3):
     with pytest.raises(NameNotFound, match=r".*ethereum\.eth.*"):
         await async_w3.eth.get_balance("ethereum.eth")
+
+
+@pytest.mark.asyncio
+async def test_async_name_resolver_caches_resolved_names(
+    async_w3, async_ens_mapped_address
+):
+    async_w3.ens = AsyncCountingENS({NAME: async_ens_mapped_address})
+    await async_w3.eth.get_balance(NAME)
+    await async_w3.eth.get_balance(NAME)
+    await async_w3.eth.get_balance(async_ens_mapped_address)
+    assert async_w3.ens.lookups == 1
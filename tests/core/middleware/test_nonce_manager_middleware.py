@@ -0,0 +1,221 @@
+import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import pytest
+
+from eth_account import (
+    Account,
+)
+
+from web3 import (
+    EthereumTesterProvider,
+    Web3,
+)
+from web3.middleware import (
+    NonceManager,
+    async_construct_nonce_manager_middleware,
+    construct_nonce_manager_middleware,
+    construct_sign_and_send_raw_middleware,
+)
+
+ACCOUNT = "0x" + "aa" * 20
+
+
+class FakeNode:
+    def __init__(self, transaction_count=5):
+        self.transaction_count = transaction_count
+        self.requests = []
+        self.sent_nonces = []
+        self.send_errors = []
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == "eth_getTransactionCount":
+            return {"result": hex(self.transaction_count)}
+        if method == "eth_sendTransaction":
+            if self.send_errors:
+                return {"error": {"code": -32000, "message": self.send_errors.pop()}}
+            self.sent_nonces.append(params[0]["nonce"])
+            self.transaction_count += 1
+            return {"result": "0x" + "00" * 32}
+        if method == "eth_blockNumber":
+            return {"result": params[0]}
+        if method == "eth_getBlockByNumber":
+            return {"result": params[0]}
+        raise AssertionError(f"unexpected method {method}")
+
+    async def async_make_request(self, method, params):
+        await asyncio.sleep(0)
+        return self.make_request(method, params)
+
+
+def send(middleware, nonce=None):
+    transaction = {"from": ACCOUNT, "to": ACCOUNT, "value": 1}
+    if nonce is not None:
+        transaction["nonce"] = nonce
+    return middleware("eth_sendTransaction", [transaction])
+
+
+@pytest.fixture
+def node():
+    return FakeNode()
+
+
+@pytest.fixture
+def nonce_manager():
+    return NonceManager()
+
+
+@pytest.fixture
+def middleware(node, nonce_manager):
+    return construct_nonce_manager_middleware(nonce_manager)(node.make_request, None)
+
+
+def test_nonce_manager_seeds_once(node, middleware):
+    for _ in range(3):
+        send(middleware)
+
+    assert node.sent_nonces == [5, 6, 7]
+    assert node.requests.count("eth_getTransactionCount") == 1
+
+
+def test_nonce_manager_unique_nonces_across_threads(node, middleware):
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: send(middleware), range(100)))
+
+    assert sorted(node.sent_nonces) == list(range(5, 105))
+    assert node.requests.count("eth_getTransactionCount") == 1
+
+
+@pytest.mark.parametrize(
+    "message", ("nonce too low", "replacement transaction underpriced")
+)
+def test_nonce_manager_resyncs_after_error(node, middleware, message):
+    send(middleware)
+    node.transaction_count = 10
+    node.send_errors.append(message)
+
+    assert "error" in send(middleware)
+    send(middleware)
+
+    assert node.sent_nonces == [5, 10]
+    assert node.requests.count("eth_getTransactionCount") == 2
+
+
+def test_nonce_manager_explicit_nonce(node, middleware):
+    send(middleware)
+    send(middleware, nonce=9)
+    send(middleware)
+
+    assert node.sent_nonces == [5, 9, 10]
+
+
+def test_nonce_manager_reset(node, middleware, nonce_manager):
+    send(middleware)
+    node.transaction_count = 3
+    nonce_manager.reset(ACCOUNT.upper().replace("0X", "0x"))
+    send(middleware)
+
+    assert node.sent_nonces == [5, 3]
+
+
+@pytest.mark.parametrize(
+    "method,first,second",
+    (
+        ("eth_blockNumber", "0x10", "0xf"),
+        (
+            "eth_getBlockByNumber",
+            {"number": "0x10", "hash": "0x01"},
+            {"number": "0x10", "hash": "0x02"},
+        ),
+        (
+            "eth_getBlockByNumber",
+            {"number": "0x10", "hash": "0x01"},
+            {"number": "0x11", "hash": "0x03", "parentHash": "0x02"},
+        ),
+    ),
+)
+def test_nonce_manager_resyncs_after_reorg(node, middleware, method, first, second):
+    send(middleware)
+    middleware(method, [first])
+    send(middleware)
+    assert node.requests.count("eth_getTransactionCount") == 1
+
+    middleware(method, [second])
+    send(middleware)
+    assert node.requests.count("eth_getTransactionCount") == 2
+
+
+def test_nonce_manager_with_eth_tester():
+    w3 = Web3(EthereumTesterProvider())
+    w3.middleware_onion.add(construct_nonce_manager_middleware())
+    account = w3.eth.accounts[0]
+
+    tx_hashes = [
+        w3.eth.send_transaction({"from": account, "to": account, "value": 1})
+        for _ in range(3)
+    ]
+
+    nonces = [w3.eth.get_transaction(tx_hash)["nonce"] for tx_hash in tx_hashes]
+    assert nonces == [0, 1, 2]
+
+
+def test_nonce_manager_with_signing_middleware():
+    w3 = Web3(EthereumTesterProvider())
+    account = Account.create()
+    w3.eth.send_transaction(
+        {"from": w3.eth.accounts[0], "to": account.address, "value": 10**18}
+    )
+    requests = []
+
+    def record_requests(make_request, _w3):
+        def middleware(method, params):
+            requests.append(method)
+            return make_request(method, params)
+
+        return middleware
+
+    w3.middleware_onion.inject(record_requests, "record_requests", layer=0)
+    w3.middleware_onion.add(construct_sign_and_send_raw_middleware(account))
+    # added last, so that it fills the nonce before the transaction is signed
+    w3.middleware_onion.add(construct_nonce_manager_middleware())
+
+    tx_hashes = [
+        w3.eth.send_transaction(
+            {"from": account.address, "to": account.address, "value": 1}
+        )
+        for _ in range(3)
+    ]
+
+    nonces = [w3.eth.get_transaction(tx_hash)["nonce"] for tx_hash in tx_hashes]
+    assert nonces == [0, 1, 2]
+    assert requests.count("eth_getTransactionCount") == 1
+    assert requests.count("eth_sendRawTransaction") == 3
+
+
+@pytest.mark.asyncio
+async def test_async_nonce_manager_unique_nonces(node):
+    middleware = await (await async_construct_nonce_manager_middleware())(
+        node.async_make_request, None
+    )
+
+    await asyncio.gather(*(send(middleware) for _ in range(20)))
+
+    assert sorted(node.sent_nonces) == list(range(5, 25))
+    assert node.requests.count("eth_getTransactionCount") == 1
+
+
+@pytest.mark.asyncio
+async def test_async_nonce_manager_resyncs_after_error(node):
+    middleware = await (await async_construct_nonce_manager_middleware())(
+        node.async_make_request, None
+    )
+
+    await send(middleware)
+    node.transaction_count = 10
+    node.send_errors.append("nonce too low")
+    assert "error" in await send(middleware)
+    await send(middleware)
+
+    assert node.sent_nonces == [5, 10]
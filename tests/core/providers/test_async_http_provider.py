@@ -22,6 +22,10 @@ from web3.geth import (
     AsyncGethPersonal,
     AsyncGethTxPool,
 )
+from web3.instrumentation import (
+    RequestInstrumentation,
+    RequestMetrics,
+)
 from web3.middleware import (
     async_attrdict_middleware,
     async_buffered_gas_estimate_middleware,
@@ -32,6 +36,9 @@ from web3.middleware import (
 from web3.net import (
     AsyncNet,
 )
+from web3.providers import (
+    async_rpc,
+)
 from web3.providers.async_rpc import (
     AsyncHTTPProvider,
 )
@@ -107,3 +114,19 @@ async def test_async_user_provided_session() -> None:
     cached_session = await provider.cache_async_session(session)
     assert len(request._async_session_cache) == 1
     assert cached_session == session
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_reports_response_size(monkeypatch):
+    raw_response = b'{"jsonrpc": "2.0", "id": 0, "result": "0x2a"}'
+
+    async def make_post_request(*_, **__):
+        return raw_response
+
+    monkeypatch.setattr(async_rpc, "async_make_post_request", make_post_request)
+    w3 = AsyncWeb3(AsyncHTTPProvider(endpoint_uri=URI), middlewares=[])
+    metrics = RequestMetrics()
+    w3.manager.instrumentation = RequestInstrumentation(metrics)
+
+    assert await w3.eth.block_number == 42
+    assert metrics.methods["eth_blockNumber"].response_bytes == len(raw_response)
@@ -25,6 +25,10 @@ from web3.geth import (
     GethPersonal,
     GethTxPool,
 )
+from web3.instrumentation import (
+    RequestInstrumentation,
+    RequestMetrics,
+)
 from web3.middleware import (
     abi_middleware,
     attrdict_middleware,
@@ -38,6 +42,7 @@ from web3.net import (
 )
 from web3.providers import (
     HTTPProvider,
+    rpc,
 )
 
 URI = "http://mynode.local:8545"
@@ -110,3 +115,14 @@ def test_user_provided_session():
     assert isinstance(adapter, HTTPAdapter)
     assert adapter._pool_connections == 20
     assert adapter._pool_maxsize == 20
+
+
+def test_http_provider_reports_response_size(monkeypatch):
+    raw_response = b'{"jsonrpc": "2.0", "id": 0, "result": "0x2a"}'
+    monkeypatch.setattr(rpc, "make_post_request", lambda *_, **__: raw_response)
+    w3 = Web3(HTTPProvider(endpoint_uri=URI), middlewares=[])
+    metrics = RequestMetrics()
+    w3.manager.instrumentation = RequestInstrumentation(metrics)
+
+    assert w3.eth.block_number == 42
+    assert metrics.methods["eth_blockNumber"].response_bytes == len(raw_response)
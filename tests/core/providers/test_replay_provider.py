@@ -0,0 +1,117 @@
+import json
+import pytest
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.providers import (
+    AsyncBaseProvider,
+    AsyncRecordingProvider,
+    AsyncReplayProvider,
+    BaseProvider,
+    EthereumTesterProvider,
+    RecordingProvider,
+    ReplayProvider,
+)
+
+ADDRESS = "0x" + "11" * 20
+
+
+class CountingProvider(BaseProvider):
+    def __init__(self):
+        self.block_number = 0
+
+    def make_request(self, method, params):
+        if method == "eth_blockNumber":
+            self.block_number += 1
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block_number)}
+        if method == "eth_getBalance":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(10**18)}
+        return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "no"}}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+
+class AsyncCountingProvider(AsyncBaseProvider):
+    def __init__(self):
+        self._provider = CountingProvider()
+
+    async def make_request(self, method, params):
+        return self._provider.make_request(method, params)
+
+    async def is_connected(self, show_traceback=False):
+        return True
+
+
+@pytest.fixture
+def recording_path(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    provider = RecordingProvider(CountingProvider(), path)
+    w3 = Web3(provider)
+    for _ in range(3):
+        w3.eth.block_number
+    w3.eth.get_balance(ADDRESS)
+    provider.close()
+    return path
+
+
+def test_recording_provider_writes_json_lines(recording_path):
+    entries = [json.loads(line) for line in recording_path.read_text().splitlines()]
+
+    assert [entry["method"] for entry in entries] == [
+        "eth_blockNumber",
+        "eth_blockNumber",
+        "eth_blockNumber",
+        "eth_getBalance",
+    ]
+    assert entries[-1]["params"] == [ADDRESS, "latest"]
+    assert entries[-1]["response"]["result"] == hex(10**18)
+    assert all(entry["elapsed"] >= 0 for entry in entries)
+
+
+def test_replay_provider_serves_responses_in_order(recording_path):
+    provider = ReplayProvider(recording_path)
+    w3 = Web3(provider)
+
+    assert [w3.eth.block_number for _ in range(4)] == [1, 2, 3, 3]
+    assert w3.eth.get_balance(ADDRESS) == 10**18
+
+    provider.reset()
+    assert w3.eth.block_number == 1
+
+
+def test_replay_provider_unrecorded_request(recording_path):
+    w3 = Web3(ReplayProvider(recording_path))
+    with pytest.raises(ValueError, match="No recorded response for eth_getBalance"):
+        w3.eth.get_balance(ADDRESS, "earliest")
+
+
+def test_replay_provider_latency(recording_path):
+    w3 = Web3(ReplayProvider(recording_path, latency=0.05))
+    start = time.perf_counter()
+    w3.eth.block_number
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_recording_provider_keeps_provider_middlewares(tmp_path):
+    tester_provider = EthereumTesterProvider()
+    w3 = Web3(RecordingProvider(tester_provider, tmp_path / "recording.jsonl"))
+
+    assert w3.provider.middlewares == tester_provider.middlewares
+    assert w3.eth.get_block("latest")["number"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_record_and_replay(tmp_path):
+    path = tmp_path / "recording.jsonl"
+    recording_provider = AsyncRecordingProvider(AsyncCountingProvider(), path)
+    async_w3 = AsyncWeb3(recording_provider)
+    recorded = [await async_w3.eth.block_number for _ in range(2)]
+    recording_provider.close()
+
+    async_w3 = AsyncWeb3(AsyncReplayProvider(path, latency=0.01))
+    assert [await async_w3.eth.block_number for _ in range(2)] == recorded
+    assert await async_w3.is_connected()
@@ -17,6 +17,10 @@ from web3.exceptions import (
     ProviderConnectionError,
     Web3ValidationError,
 )
+from web3.instrumentation import (
+    RequestInstrumentation,
+    RequestMetrics,
+)
 from web3.providers.websocket import (
     WebsocketProvider,
 )
@@ -84,3 +88,21 @@ def test_restricted_websocket_kwargs():
     re_exc_message = f".*found: {set(invalid_kwargs)!r}*"
     with pytest.raises(Web3ValidationError, match=re_exc_message):
         WebsocketProvider(websocket_kwargs=invalid_kwargs)
+
+
+def test_websocket_provider_reports_response_size_in_bytes(monkeypatch):
+    raw_response = '{"jsonrpc": "2.0", "id": 0, "result": "héllo wörld"}'
+
+    async def _make_request(request_data):
+        return raw_response
+
+    provider = WebsocketProvider()
+    monkeypatch.setattr(provider, "_make_request", _make_request)
+    w3 = Web3(provider, middlewares=[])
+    metrics = RequestMetrics()
+    w3.manager.instrumentation = RequestInstrumentation(metrics)
+
+    assert w3.manager.request_blocking("web3_clientVersion", []) == "héllo wörld"
+    assert metrics.methods["web3_clientVersion"].response_bytes == len(
+        raw_response.encode("utf-8")
+    )
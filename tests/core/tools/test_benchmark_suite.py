@@ -0,0 +1,110 @@
+import json
+import logging
+import pytest
+
+from web3.tools.benchmark.suite import (
+    BENCHMARK_GROUPS,
+    compare,
+    load_results,
+    main,
+    run_suite,
+    to_csv,
+    to_json,
+)
+
+LOGGER = logging.getLogger("test_benchmark_suite")
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return run_suite(LOGGER, only=["events", "cache_keys"], scale=0.001)
+
+
+def test_run_suite_rows(rows):
+    assert {row["group"] for row in rows} == {"events", "cache_keys"}
+    assert {"group": "events", "case": "Transfer", "variant": "process_log"} in [
+        {key: row[key] for key in ("group", "case", "variant")} for row in rows
+    ]
+    assert all(row["value"] > 0 for row in rows)
+    assert all(row["num_calls"] >= 1 for row in rows)
+
+
+@pytest.mark.parametrize("group", BENCHMARK_GROUPS, ids=lambda group: group.name)
+def test_each_benchmark_group_runs(group):
+    results = group.run(LOGGER, 1)
+    assert results
+    assert all(variants for variants in results.values())
+
+
+@pytest.mark.parametrize("serialize", (to_json, to_csv), ids=("json", "csv"))
+def test_results_round_trip(tmp_path, rows, serialize):
+    path = tmp_path / "results"
+    path.write_text(serialize(rows))
+    assert load_results(str(path)) == rows
+
+
+def test_compare_flags_regressions():
+    baseline = [
+        {"group": "abi", "case": "call", "variant": "encode", "value": 1.0},
+        {"group": "abi", "case": "call", "variant": "decode", "value": 1.0},
+    ]
+    rows = [
+        {"group": "abi", "case": "call", "variant": "encode", "value": 1.05},
+        {"group": "abi", "case": "call", "variant": "decode", "value": 1.5},
+        {"group": "abi", "case": "new", "variant": "encode", "value": 1.0},
+    ]
+
+    comparison = compare(rows, baseline, threshold=0.1)
+
+    assert [(row["variant"], row["regression"]) for row in comparison] == [
+        ("encode", False),
+        ("decode", True),
+    ]
+    assert comparison[1]["ratio"] == 1.5
+
+
+def test_compare_rejects_baseline_with_different_num_calls():
+    baseline = [
+        {
+            "group": "abi",
+            "case": "call",
+            "variant": "encode",
+            "num_calls": 10,
+            "value": 1.0,
+        },
+    ]
+    rows = [
+        {
+            "group": "abi",
+            "case": "call",
+            "variant": "encode",
+            "num_calls": 100,
+            "value": 10.0,
+        },
+    ]
+
+    with pytest.raises(ValueError, match="abi/call/encode: 100 calls, 10 in the"):
+        compare(rows, baseline, threshold=0.1)
+
+
+def test_main_baseline_exit_status(tmp_path):
+    output = tmp_path / "results.json"
+    argv = ["--only", "cache_keys", "--scale", "0.001", "--format", "json"]
+    assert main(LOGGER, argv + ["--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert results["metadata"]["scale"] == 0.001
+
+    slow_baseline = tmp_path / "slow.csv"
+    slow_baseline.write_text(
+        to_csv([dict(row, value=row["value"] * 100) for row in results["results"]])
+    )
+    assert main(LOGGER, argv + ["--baseline", str(slow_baseline)]) == 0
+
+    fast_baseline = tmp_path / "fast.csv"
+    fast_baseline.write_text(
+        to_csv([dict(row, value=row["value"] / 100) for row in results["results"]])
+    )
+    assert main(LOGGER, argv + ["--baseline", str(fast_baseline)]) == 1
+
+    other_scale = ["--only", "cache_keys", "--scale", "0.01", "--format", "json"]
+    assert main(LOGGER, other_scale + ["--baseline", str(output)]) == 2
@@ -0,0 +1,88 @@
+import pytest
+import time
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    HTTPProvider,
+    IPCProvider,
+    Web3,
+    WebsocketProvider,
+    WebsocketProviderV2,
+)
+from web3.exceptions import (
+    MethodUnavailable,
+)
+from web3.tools.benchmark.stub_node import (
+    BLOCK_NUMBER,
+    CHAIN_ID,
+    StubNode,
+    StubResponder,
+)
+
+
+@pytest.fixture(scope="module")
+def stub_node():
+    with StubNode(StubResponder(payload_size=10_000)) as node:
+        yield node
+
+
+@pytest.mark.parametrize(
+    "make_provider",
+    (
+        lambda node: HTTPProvider(node.endpoint_uri),
+        lambda node: IPCProvider(node.ipc_path),
+        lambda node: WebsocketProvider(node.websocket_uri),
+    ),
+    ids=("http", "ipc", "websocket"),
+)
+def test_stub_node_serves_providers(stub_node, make_provider):
+    w3 = Web3(make_provider(stub_node))
+
+    assert w3.is_connected()
+    assert w3.eth.chain_id == CHAIN_ID
+    block = w3.eth.get_block("latest")
+    assert block["number"] == BLOCK_NUMBER
+    assert 9_000 < len(block["transactions"]) * 69 <= 10_000
+    assert len(w3.eth.get_logs({"fromBlock": 0})) == 10_000 // 620
+
+
+@pytest.mark.asyncio
+async def test_stub_node_serves_async_providers(stub_node):
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(stub_node.endpoint_uri))
+    assert await async_w3.eth.block_number == BLOCK_NUMBER
+
+    async with AsyncWeb3.persistent_websocket(
+        WebsocketProviderV2(stub_node.websocket_uri)
+    ) as async_w3:
+        assert await async_w3.eth.chain_id == CHAIN_ID
+
+
+def test_stub_node_custom_results_latency_and_errors():
+    responder = StubResponder(
+        results={"eth_blockNumber": lambda params: "0x7"},
+        latency=0.05,
+        error_rate=0.5,
+        seed=1,
+    )
+    with StubNode(responder) as node:
+        w3 = Web3(HTTPProvider(node.endpoint_uri))
+        start = time.perf_counter()
+        outcomes = []
+        for _ in range(10):
+            try:
+                outcomes.append(w3.eth.block_number)
+            except ValueError as error:
+                outcomes.append(str(error))
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.5
+    assert responder.request_count == 10
+    assert 7 in outcomes
+    assert any("stub node error" in str(outcome) for outcome in outcomes)
+
+
+def test_stub_node_unknown_method(stub_node):
+    w3 = Web3(HTTPProvider(stub_node.endpoint_uri))
+    with pytest.raises(MethodUnavailable):
+        w3.manager.request_blocking("eth_unknownMethod", [])
@@ -0,0 +1,76 @@
+import copy
+import json
+import pytest
+
+from ens import (
+    ENS,
+)
+from web3._utils.abi_cache import (
+    get_cached_abi,
+    get_validated_abi,
+)
+from web3._utils.contract_sources.contract_data.math_contract import (
+    MATH_CONTRACT_ABI,
+)
+from web3._utils.normalizers import (
+    normalize_abi,
+    normalize_contract_address,
+)
+
+ADDRESS_1 = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+ADDRESS_2 = "0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf"
+
+
+def test_abis_with_the_same_contents_are_shared():
+    abi = copy.deepcopy(MATH_CONTRACT_ABI)
+    cached_abi = get_cached_abi(abi)
+
+    assert get_cached_abi(abi) is cached_abi
+    assert get_cached_abi(copy.deepcopy(MATH_CONTRACT_ABI)) is cached_abi
+    assert cached_abi.function_names >= {"add", "counter", "multiply7"}
+
+
+def test_normalize_abi_returns_the_shared_validated_abi():
+    abi = get_validated_abi(copy.deepcopy(MATH_CONTRACT_ABI))
+
+    assert get_cached_abi(abi).is_validated
+    assert normalize_abi(copy.deepcopy(MATH_CONTRACT_ABI)) is abi
+    assert normalize_abi(json.dumps(MATH_CONTRACT_ABI)) is abi
+
+
+def test_invalid_abi_is_rejected_every_time():
+    function_abi = {"type": "function", "name": "f", "inputs": [], "outputs": []}
+    abi = [function_abi, dict(function_abi)]
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Abi contains functions"):
+            normalize_abi(abi)
+
+
+def test_contracts_share_function_and_event_classes(w3):
+    math_contract_1 = w3.eth.contract(address=ADDRESS_1, abi=MATH_CONTRACT_ABI)
+    math_contract_2 = w3.eth.contract(
+        address=ADDRESS_2, abi=copy.deepcopy(MATH_CONTRACT_ABI)
+    )
+
+    add_1 = math_contract_1.functions.add
+    add_2 = math_contract_2.functions.add
+    assert type(add_1) is type(add_2)
+    assert (add_1.address, add_2.address) == (ADDRESS_1, ADDRESS_2)
+    assert add_1(1, 2).address == ADDRESS_1
+
+    increased_1 = math_contract_1.events.Increased
+    increased_2 = math_contract_2.events.Increased
+    assert increased_1.__bases__ == increased_2.__bases__
+    assert (increased_1.address, increased_2.address) == (ADDRESS_1, ADDRESS_2)
+
+
+def test_normalize_contract_address_only_builds_ens_for_names(w3, monkeypatch):
+    def from_web3(*args, **kwargs):
+        raise AssertionError("ENS should not be built")
+
+    monkeypatch.setattr(ENS, "from_web3", from_web3)
+    assert normalize_contract_address(w3, ADDRESS_1) == ADDRESS_1
+
+    with pytest.raises(AssertionError, match="ENS should not be built"):
+        normalize_contract_address(w3, "tester.eth")
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from eth_typing import (
@@ -95,3 +96,110 @@ async def test_async_fill_transaction_defaults_for_zero_gas_price(async_w3):
         "value": 0,
         "gasPrice": 0,
     }
+
+
+@pytest.mark.asyncio
+async def test_async_fill_transaction_defaults_fills_nonce_of_sender(async_w3):
+    sender = async_w3.eth.default_account
+    nonce = await async_w3.eth.get_transaction_count(sender, "pending")
+
+    for transaction in ({"from": sender}, {"from": sender, "nonce": None}):
+        default_transaction = await async_fill_transaction_defaults(
+            async_w3, transaction
+        )
+        assert default_transaction["nonce"] == nonce
+    default_transaction = await async_fill_transaction_defaults(
+        async_w3, {"from": sender, "nonce": nonce + 1, "gas": 21000}
+    )
+    assert default_transaction["nonce"] == nonce + 1
+
+
+@pytest.mark.asyncio
+async def test_async_fill_transaction_defaults_without_sender(async_w3):
+    requests = []
+
+    async def record_requests(make_request, _async_w3):
+        async def middleware(method, params):
+            requests.append(method)
+            return await make_request(method, params)
+
+        return middleware
+
+    async_w3.middleware_onion.inject(record_requests, "record_requests", layer=0)
+    default_transaction = await async_fill_transaction_defaults(async_w3, {})
+
+    assert "nonce" not in default_transaction
+    assert "eth_getTransactionCount" not in requests
+
+
+@pytest.mark.asyncio
+async def test_async_fill_transaction_defaults_estimates_gas_with_fees_set(async_w3):
+    estimate_gas_params = []
+
+    async def record_estimate_gas(make_request, _async_w3):
+        async def middleware(method, params):
+            if method == "eth_estimateGas":
+                estimate_gas_params.append(params[0])
+            return await make_request(method, params)
+
+        return middleware
+
+    async_w3.middleware_onion.inject(
+        record_estimate_gas, "record_estimate_gas", layer=0
+    )
+    sender = async_w3.eth.default_account
+    default_transaction = await async_fill_transaction_defaults(
+        async_w3, {"from": sender}
+    )
+
+    (params,) = estimate_gas_params
+    for key in ("maxFeePerGas", "maxPriorityFeePerGas", "nonce"):
+        assert int(params[key], 16) == default_transaction[key]
+    assert default_transaction["gas"] == await async_w3.eth.estimate_gas(params)
+
+
+@pytest.fixture
+def async_w3_with_request_delay(async_w3):
+    in_flight = {"current": 0, "max": 0}
+
+    async def delay_requests(make_request, _async_w3):
+        async def middleware(method, params):
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            try:
+                await asyncio.sleep(0.01)
+                return await make_request(method, params)
+            finally:
+                in_flight["current"] -= 1
+
+        return middleware
+
+    async_w3.middleware_onion.inject(delay_requests, "delay_requests", layer=0)
+    return async_w3, in_flight
+
+
+@pytest.mark.asyncio
+async def test_async_fill_transaction_defaults_fetches_concurrently(
+    async_w3_with_request_delay,
+):
+    async_w3, in_flight = async_w3_with_request_delay
+    default_transaction = await async_fill_transaction_defaults(async_w3, {})
+
+    assert set(default_transaction) == {
+        "chainId",
+        "data",
+        "gas",
+        "maxFeePerGas",
+        "maxPriorityFeePerGas",
+        "value",
+    }
+    assert in_flight["max"] > 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_buffered_gas_estimate_fetches_concurrently(
+    async_w3_with_request_delay,
+):
+    async_w3, in_flight = async_w3_with_request_delay
+    await get_buffered_gas_estimate(async_w3, {"data": b"0x1"})
+    assert in_flight["max"] == 2
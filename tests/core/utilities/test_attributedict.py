@@ -1,7 +1,11 @@
 import pytest
 
+from web3._utils.encoding import (
+    to_json,
+)
 from web3.datastructures import (
     AttributeDict,
+    LazyAttributeDict,
 )
 
 
@@ -107,3 +111,44 @@ def test_attributedict_set_in_recursive_dict():
     data = {"mydict": {"myset": {"found"}}}
     attrdict = AttributeDict.recursive(data)
     assert "found" in attrdict.mydict.myset
+
+
+def test_lazy_attributedict_formats_on_first_access():
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    container = LazyAttributeDict({"a": 1, "b": 2}, {"a": double, "b": double})
+    assert "a" in container and len(container) == 2
+    assert calls == []
+    assert container.a == 2
+    assert container["a"] == 2
+    assert calls == [1]
+
+
+def test_lazy_attributedict_behaves_like_attributedict():
+    raw = {"a": 1, "b": {"c": 3}}
+    container = LazyAttributeDict(raw, {"a": str, "b": AttributeDict})
+    expected = AttributeDict({"a": "1", "b": AttributeDict({"c": 3})})
+    assert container == expected
+    assert hash(container) == hash(expected)
+    assert list(container.items()) == list(expected.items())
+    assert eval(repr(container)) == expected
+    with pytest.raises(TypeError):
+        container.a = 2
+    with pytest.raises(AttributeError):
+        container.missing
+
+
+def test_lazy_attributedict_to_json():
+    container = LazyAttributeDict({"a": 1, "b": {"c": 3}}, {"a": str})
+    container.b
+    assert to_json(container) == '{"a": "1", "b": {"c": 3}}'
+
+
+def test_lazy_attributedict_raises_on_access():
+    container = LazyAttributeDict({"a": "not a number"}, {"a": int})
+    with pytest.raises(ValueError, match="as field 'a'"):
+        container.a
@@ -0,0 +1,153 @@
+import gc
+import itertools
+import pytest
+import weakref
+
+from web3 import (
+    Web3,
+)
+from web3._utils.abi import (
+    get_abi_output_types,
+    map_abi_data,
+)
+from web3._utils.call_plans import (
+    _ens_input_normalizers,
+    _get_ens_input_normalizer,
+    compose_normalizers,
+    get_call_plan,
+    get_flat_types,
+)
+from web3._utils.contract_sources.contract_data.math_contract import (
+    MATH_CONTRACT_DATA,
+)
+from web3._utils.contracts import (
+    prepare_transaction,
+)
+from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+)
+
+ADDRESS = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+BALANCE_OF_ABI = {
+    "name": "balanceOf",
+    "type": "function",
+    "inputs": [{"name": "owner", "type": "address"}],
+    "outputs": [{"name": "", "type": "uint"}],
+}
+GET_RESERVES_ABI = {
+    "name": "getReserves",
+    "type": "function",
+    "inputs": [],
+    "outputs": [
+        {"name": "reserve0", "type": "uint112"},
+        {"name": "reserve1", "type": "uint112"},
+        {"name": "blockTimestampLast", "type": "uint32"},
+    ],
+}
+QUOTE_ABI = {
+    "name": "quote",
+    "type": "function",
+    "inputs": [
+        {
+            "name": "params",
+            "type": "tuple",
+            "components": [
+                {"name": "token", "type": "address"},
+                {"name": "amount", "type": "uint256"},
+            ],
+        },
+        {"name": "path", "type": "address[]"},
+    ],
+    "outputs": [{"name": "", "type": "address[]"}],
+}
+
+
+@pytest.mark.parametrize(
+    "fn_abi,args,outputs",
+    (
+        (BALANCE_OF_ABI, [ADDRESS], [10**18]),
+        (GET_RESERVES_ABI, [], [1, 2, 3]),
+        (QUOTE_ABI, [(ADDRESS, 5), [ADDRESS] * 2], [[ADDRESS.lower()] * 2]),
+    ),
+    ids=("flat", "no inputs", "tuple and array"),
+)
+def test_call_plan_matches_prepare_transaction_and_map_abi_data(
+    w3, fn_abi, args, outputs
+):
+    plan = get_call_plan(fn_abi)
+    output_types = get_abi_output_types(fn_abi)
+    return_data = w3.codec.encode(output_types, outputs)
+
+    assert plan.prepare_transaction(ADDRESS, w3, {}, args) == prepare_transaction(
+        ADDRESS, w3, fn_abi["name"], fn_abi=fn_abi, transaction={}, fn_args=args
+    )
+    expected = map_abi_data(
+        itertools.chain(BASE_RETURN_NORMALIZERS, ()),
+        output_types,
+        w3.codec.decode(output_types, return_data),
+    )
+    if len(expected) == 1:
+        expected = expected[0]
+    assert plan.decode_output(w3.codec, return_data) == expected
+
+
+def test_call_plan_rejects_arguments_that_cant_be_encoded(w3):
+    with pytest.raises(TypeError, match="Expected types are: address"):
+        get_call_plan(BALANCE_OF_ABI).encode_input(w3, [1])
+
+
+def test_call_plans_are_cached_per_function_abi_and_normalizers():
+    plan = get_call_plan(BALANCE_OF_ABI)
+
+    assert get_call_plan(BALANCE_OF_ABI) is plan
+    assert get_call_plan(dict(BALANCE_OF_ABI)) is not plan
+    assert get_call_plan(BALANCE_OF_ABI, (lambda t, d: (t, d),)) is not plan
+    assert plan.selector == "0x70a08231"
+    assert plan.input_types == ["address"]
+
+
+def test_get_flat_types():
+    assert get_flat_types(["uint", "address", "bytes32"]) == [
+        "uint",
+        "address",
+        "bytes32",
+    ]
+    assert get_flat_types(["uint", "address[]"]) is None
+    assert get_flat_types(["(uint256,bool)"]) is None
+
+
+def test_compose_normalizers_stops_at_untyped_data():
+    normalizer = compose_normalizers(
+        (
+            lambda abi_type, data: (abi_type, data + 1),
+            lambda abi_type, data: (None, data * 2),
+            lambda abi_type, data: (abi_type, data + 100),
+        )
+    )
+    assert normalizer("uint256", 1) == (None, 4)
+
+
+def test_contract_call_uses_call_plan(w3):
+    math_contract = w3.eth.contract(**MATH_CONTRACT_DATA)
+    tx_hash = math_contract.constructor().transact()
+    address = w3.eth.get_transaction_receipt(tx_hash)["contractAddress"]
+    add = w3.eth.contract(address=address, **MATH_CONTRACT_DATA).functions.add
+
+    assert add(2, 3).call() == 5
+    plan = get_call_plan(add(2, 3).abi)
+    assert add(7, -4).call() == 3
+    assert get_call_plan(add(7, -4).abi) is plan
+
+
+def test_ens_input_normalizer_is_cached_per_web3(w3):
+    normalizer = _get_ens_input_normalizer(w3)
+    assert _get_ens_input_normalizer(w3) is normalizer
+
+    other_w3 = Web3(w3.provider)
+    assert _get_ens_input_normalizer(other_w3) is not normalizer
+    assert other_w3 in _ens_input_normalizers
+    # the cached normalizer doesn't keep its ``Web3`` instance alive
+    other_w3_ref = weakref.ref(other_w3)
+    del other_w3
+    gc.collect()
+    assert other_w3_ref() is None
@@ -0,0 +1,169 @@
+import pytest
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.async_transactions import (
+    async_fill_transaction_defaults,
+    get_buffered_gas_estimate as async_get_buffered_gas_estimate,
+)
+from web3._utils.chain_constants import (
+    async_get_chain_id,
+    cache_block_gas_limit,
+    clear_chain_constants,
+    get_chain_constants,
+    get_chain_id,
+)
+from web3._utils.transactions import (
+    fill_transaction_defaults,
+    get_block_gas_limit,
+    get_buffered_gas_estimate,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+from web3.utils import (
+    get_head_tracker,
+)
+
+TRANSACTION = {"to": "0x" + "00" * 20, "gas": 21000, "gasPrice": 10**9}
+
+
+@pytest.fixture
+def chain_id_requests():
+    return []
+
+
+@pytest.fixture
+def counting_w3(chain_id_requests):
+    def count_chain_id_requests(make_request, w3):
+        def middleware(method, params):
+            if method == "eth_chainId":
+                chain_id_requests.append(method)
+            return make_request(method, params)
+
+        return middleware
+
+    w3 = Web3(EthereumTesterProvider())
+    w3.middleware_onion.add(count_chain_id_requests)
+    return w3
+
+
+def test_chain_id_is_cached_per_provider(counting_w3, chain_id_requests):
+    w3 = counting_w3
+    assert get_chain_id(w3) == w3.eth.chain_id
+    assert get_chain_id(w3) == w3.eth.chain_id
+    assert len(chain_id_requests) == 3
+
+    w3.provider = EthereumTesterProvider()
+    get_chain_id(w3)
+    assert len(chain_id_requests) == 4
+
+
+def test_clear_chain_constants(counting_w3, chain_id_requests):
+    get_chain_id(counting_w3)
+    clear_chain_constants(counting_w3.provider)
+    assert get_chain_constants(counting_w3.provider) == {}
+
+    get_chain_id(counting_w3)
+    assert len(chain_id_requests) == 2
+
+
+def test_clear_chain_constants_drops_head_tracker(counting_w3):
+    head_tracker = get_head_tracker(counting_w3)
+    head_tracker.latest(counting_w3)
+    clear_chain_constants(counting_w3.provider)
+    assert get_head_tracker(counting_w3) is not head_tracker
+
+
+def test_transactions_fetch_chain_id_once(counting_w3, chain_id_requests):
+    w3 = counting_w3
+    transaction = dict(TRANSACTION, **{"from": w3.eth.accounts[0]})
+    for _ in range(3):
+        assert fill_transaction_defaults(w3, transaction)["chainId"] == 131277322940537
+        w3.eth.send_transaction(transaction)
+    assert len(chain_id_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_chain_id_is_cached():
+    chain_id_requests = []
+
+    async def count_chain_id_requests(make_request, async_w3):
+        async def middleware(method, params):
+            if method == "eth_chainId":
+                chain_id_requests.append(method)
+            return await make_request(method, params)
+
+        return middleware
+
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    async_w3.middleware_onion.add(count_chain_id_requests)
+    accounts = await async_w3.eth.accounts
+    transaction = dict(TRANSACTION, **{"from": accounts[0]})
+    for _ in range(3):
+        filled = await async_fill_transaction_defaults(async_w3, transaction)
+        assert filled["chainId"] == await async_get_chain_id(async_w3)
+        await async_w3.eth.send_transaction(transaction)
+    assert len(chain_id_requests) == 1
+
+
+def test_block_gas_limit_is_cached_per_block():
+    methods = []
+
+    def record_methods(make_request, w3):
+        def middleware(method, params):
+            methods.append(method)
+            return make_request(method, params)
+
+        return middleware
+
+    w3 = Web3(EthereumTesterProvider())
+    w3.middleware_onion.add(record_methods)
+    # the head is never current, so it is looked up on every read
+    get_head_tracker(w3).poll_interval = 0
+    gas_limit = w3.eth.get_block("latest")["gasLimit"]
+    methods.clear()
+
+    for _ in range(3):
+        assert get_buffered_gas_estimate(w3, {"to": TRANSACTION["to"]}) <= gas_limit
+    assert methods.count("eth_getBlockByNumber") == 1
+    assert methods.count("eth_blockNumber") == 2
+
+    w3.provider.ethereum_tester.mine_blocks(1)
+    get_block_gas_limit(w3)
+    assert methods.count("eth_getBlockByNumber") == 2
+
+
+def test_block_gas_limit_from_head():
+    w3 = Web3(EthereumTesterProvider())
+    head = w3.eth.get_block("latest")
+    cache_block_gas_limit(
+        w3.provider, {"number": hex(head["number"]), "gasLimit": hex(12345)}
+    )
+    assert get_block_gas_limit(w3) == 12345
+
+    # an older block does not replace the newest one
+    cache_block_gas_limit(w3.provider, {"number": head["number"] - 1, "gasLimit": 1})
+    get_head_tracker(w3).poll_interval = 0
+    assert get_block_gas_limit(w3) == 12345
+
+
+@pytest.mark.asyncio
+async def test_async_block_gas_limit_is_cached_per_block():
+    methods = []
+
+    async def record_methods(make_request, async_w3):
+        async def middleware(method, params):
+            methods.append(method)
+            return await make_request(method, params)
+
+        return middleware
+
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    async_w3.middleware_onion.add(record_methods)
+    for _ in range(3):
+        await async_get_buffered_gas_estimate(async_w3, {"to": TRANSACTION["to"]})
+    assert methods.count("eth_getBlockByNumber") == 1
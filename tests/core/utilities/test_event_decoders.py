@@ -0,0 +1,289 @@
+import pytest
+
+from eth_abi.codec import (
+    ABICodec,
+)
+from eth_abi.exceptions import (
+    InsufficientDataBytes,
+    NonEmptyPaddingBytes,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+    keccak,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.abi import (
+    build_strict_registry,
+)
+from web3._utils.events import (
+    get_event_data,
+    get_event_decoder,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    InvalidEventABI,
+    LogTopicError,
+    MismatchedABI,
+)
+from web3.utils.events import (
+    decode_logs_columnar,
+)
+
+ADDRESS = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+TRANSFER_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Transfer",
+    "type": "event",
+}
+ORDER_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "name", "type": "string"},
+        {
+            "indexed": False,
+            "name": "order",
+            "type": "tuple",
+            "components": [
+                {"name": "maker", "type": "address"},
+                {"name": "amounts", "type": "uint256[]"},
+            ],
+        },
+    ],
+    "name": "Order",
+    "type": "event",
+}
+DUPLICATE_NAMES_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "value", "type": "uint256"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Duplicate",
+    "type": "event",
+}
+SWAP_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "sender", "type": "address"},
+        {"indexed": False, "name": "amount", "type": "int256"},
+        {"indexed": False, "name": "price", "type": "uint160"},
+        {"indexed": False, "name": "exactInput", "type": "bool"},
+        {"indexed": False, "name": "pool", "type": "bytes4"},
+    ],
+    "name": "Swap",
+    "type": "event",
+}
+
+
+def _topic(w3, abi_type, value):
+    return HexBytes(w3.codec.encode([abi_type], [value]))
+
+
+def _log(topics, data):
+    return AttributeDict(
+        {
+            "address": ADDRESS,
+            "topics": topics,
+            "data": HexBytes(data),
+            "logIndex": 0,
+            "transactionIndex": 0,
+            "transactionHash": HexBytes(b"\x01" * 32),
+            "blockHash": HexBytes(b"\x02" * 32),
+            "blockNumber": 1,
+        }
+    )
+
+
+def test_decoder_decodes_logs(w3):
+    transfer_log = _log(
+        [
+            HexBytes(event_abi_to_log_topic(TRANSFER_ABI)),
+            _topic(w3, "address", ADDRESS.lower()),
+            _topic(w3, "address", "0x" + "00" * 20),
+        ],
+        w3.codec.encode(["uint256"], [10]),
+    )
+    decoder = get_event_decoder(w3.codec, TRANSFER_ABI)
+
+    event = decoder.decode(transfer_log)
+
+    assert event == get_event_data(w3.codec, TRANSFER_ABI, transfer_log)
+    assert event.event == "Transfer"
+    assert event.args == {
+        "from": ADDRESS,
+        "to": "0x0000000000000000000000000000000000000000",
+        "value": 10,
+    }
+    # logs from list results, which the attrdict middleware doesn't wrap
+    assert decoder.decode(dict(transfer_log)).args.value == 10
+
+
+def test_decoder_decodes_logs_with_nested_types(w3):
+    order_log = _log(
+        [HexBytes(event_abi_to_log_topic(ORDER_ABI)), HexBytes(keccak(text="a"))],
+        w3.codec.encode(["(address,uint256[])"], [(ADDRESS.lower(), [1, 2])]),
+    )
+
+    event = get_event_data(w3.codec, ORDER_ABI, order_log)
+
+    assert event.args == {
+        "name": keccak(text="a"),
+        "order": {"maker": ADDRESS, "amounts": [1, 2]},
+    }
+
+
+def test_decoders_are_cached_per_codec_and_event_abi(w3):
+    decoder = get_event_decoder(w3.codec, TRANSFER_ABI)
+
+    assert get_event_decoder(w3.codec, TRANSFER_ABI) is decoder
+    assert get_event_decoder(w3.codec, ORDER_ABI) is not decoder
+    other_codec = ABICodec(build_strict_registry())
+    assert get_event_decoder(other_codec, TRANSFER_ABI) is not decoder
+
+
+def test_decoder_errors(w3):
+    decoder = get_event_decoder(w3.codec, DUPLICATE_NAMES_ABI)
+    data = w3.codec.encode(["uint256"], [1])
+    topic = HexBytes(event_abi_to_log_topic(DUPLICATE_NAMES_ABI))
+
+    with pytest.raises(MismatchedABI, match="1 or more topics"):
+        decoder.decode(_log([], data))
+    with pytest.raises(MismatchedABI, match="did not match"):
+        decoder.decode(_log([HexBytes(b"\x00" * 32)], data))
+    with pytest.raises(LogTopicError, match="Expected 1 log topics.  Got 0"):
+        decoder.decode(_log([topic], data))
+    with pytest.raises(InvalidEventABI, match="duplicated"):
+        decoder.decode(_log([topic, _topic(w3, "uint256", 1)], data))
+
+
+def _transfer_log(w3, value, log_index):
+    log = _log(
+        [
+            HexBytes(event_abi_to_log_topic(TRANSFER_ABI)),
+            _topic(w3, "address", ADDRESS.lower()),
+            _topic(w3, "address", "0x" + "00" * 19 + "01"),
+        ],
+        w3.codec.encode(["uint256"], [value]),
+    )
+    return AttributeDict({**log, "logIndex": log_index})
+
+
+def test_decoder_decodes_columns(w3):
+    logs = [_transfer_log(w3, value, i) for i, value in enumerate([1, 2**255, 3])]
+
+    columns = decode_logs_columnar(w3.codec, TRANSFER_ABI, logs)
+
+    events = [get_event_data(w3.codec, TRANSFER_ABI, log) for log in logs]
+    assert columns == {
+        "from": [bytes.fromhex(event.args["from"][2:]) for event in events],
+        "to": [bytes.fromhex(event.args["to"][2:]) for event in events],
+        "value": [event.args.value for event in events],
+        "address": [bytes.fromhex(ADDRESS[2:])] * 3,
+        "blockHash": [b"\x02" * 32] * 3,
+        "blockNumber": [1] * 3,
+        "logIndex": [0, 1, 2],
+        "transactionHash": [b"\x01" * 32] * 3,
+        "transactionIndex": [0] * 3,
+    }
+
+
+def test_decoder_decodes_columns_of_other_types(w3):
+    swap_log = _log(
+        [HexBytes(event_abi_to_log_topic(SWAP_ABI)), _topic(w3, "address", ADDRESS)],
+        w3.codec.encode(
+            ["int256", "uint160", "bool", "bytes4"],
+            [-5, 2**159, True, b"\x01\x02\x00\x00"],
+        ),
+    )
+    order_log = _log(
+        [HexBytes(event_abi_to_log_topic(ORDER_ABI)), HexBytes(keccak(text="a"))],
+        w3.codec.encode(["(address,uint256[])"], [(ADDRESS.lower(), [1, 2])]),
+    )
+
+    swap_columns = decode_logs_columnar(w3.codec, SWAP_ABI, [swap_log])
+    order_columns = decode_logs_columnar(w3.codec, ORDER_ABI, [order_log])
+
+    assert swap_columns["sender"] == [bytes.fromhex(ADDRESS[2:])]
+    assert swap_columns["amount"] == [-5]
+    assert swap_columns["price"] == [2**159]
+    assert swap_columns["exactInput"] == [True]
+    assert swap_columns["pool"] == [b"\x01\x02\x00\x00"]
+    assert order_columns["name"] == [keccak(text="a")]
+    assert order_columns["order"] == [(ADDRESS.lower(), (1, 2))]
+
+
+def test_decoder_columns_errors(w3):
+    topic = HexBytes(event_abi_to_log_topic(SWAP_ABI))
+    data = w3.codec.encode(
+        ["int256", "uint160", "bool", "bytes4"], [-5, 1, True, b"\x01\x00\x00\x00"]
+    )
+
+    with pytest.raises(MismatchedABI, match="did not match"):
+        decode_logs_columnar(w3.codec, SWAP_ABI, [_log([HexBytes(b"\x00" * 32)], data)])
+    with pytest.raises(NonEmptyPaddingBytes):
+        decode_logs_columnar(
+            w3.codec, SWAP_ABI, [_log([topic, HexBytes(b"\x01" * 32)], data)]
+        )
+    sender = _topic(w3, "address", ADDRESS)
+    for invalid_data in (
+        data[:64] + HexBytes(b"\x00" * 31 + b"\x02") + data[96:],
+        data[:96] + HexBytes(b"\x01" * 32),
+        data[:32] + HexBytes(b"\x01" * 32) + data[64:],
+    ):
+        with pytest.raises(NonEmptyPaddingBytes):
+            decode_logs_columnar(
+                w3.codec, SWAP_ABI, [_log([topic, sender], invalid_data)]
+            )
+    with pytest.raises(InsufficientDataBytes):
+        decode_logs_columnar(w3.codec, SWAP_ABI, [_log([topic, sender], data[:64])])
+
+    block_number_abi = {
+        "anonymous": False,
+        "inputs": [{"indexed": False, "name": "blockNumber", "type": "uint256"}],
+        "name": "Checkpoint",
+        "type": "event",
+    }
+    with pytest.raises(InvalidEventABI, match="names of log fields: 'blockNumber'"):
+        decode_logs_columnar(w3.codec, block_number_abi, [])
+
+
+def test_decode_logs_columnar_as_numpy(w3):
+    numpy = pytest.importorskip("numpy")
+    logs = [_transfer_log(w3, value, i) for i, value in enumerate([1, 2, 3])]
+    swap_log = _log(
+        [HexBytes(event_abi_to_log_topic(SWAP_ABI)), _topic(w3, "address", ADDRESS)],
+        w3.codec.encode(
+            ["int256", "uint160", "bool", "bytes4"],
+            [-5, 2**63, True, b"\x01\x02\x00\x00"],
+        ),
+    )
+
+    columns = decode_logs_columnar(w3.codec, TRANSFER_ABI, logs, as_numpy=True)
+    big_values = decode_logs_columnar(
+        w3.codec, TRANSFER_ABI, [_transfer_log(w3, 2**64, 0)], as_numpy=True
+    )["value"]
+    swap_columns = decode_logs_columnar(w3.codec, SWAP_ABI, [swap_log], as_numpy=True)
+
+    assert columns["from"].dtype == numpy.dtype("S20")
+    assert columns["from"].tobytes() == bytes.fromhex(ADDRESS[2:]) * 3
+    assert columns["transactionHash"].dtype == numpy.dtype("S32")
+    assert columns["value"].dtype == numpy.int64
+    assert columns["value"].tolist() == [1, 2, 3]
+    assert columns["logIndex"].tolist() == [0, 1, 2]
+    assert big_values.dtype == object
+    assert big_values.tolist() == [2**64]
+    assert swap_columns["amount"].dtype == numpy.int64
+    assert swap_columns["price"].dtype == numpy.uint64
+    assert swap_columns["exactInput"].dtype == bool
+    assert swap_columns["pool"].dtype == numpy.dtype("S4")
+    assert swap_columns["pool"].tolist() == [b"\x01\x02"]
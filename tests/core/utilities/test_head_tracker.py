@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.async_transactions import (
+    get_buffered_gas_estimate as async_get_buffered_gas_estimate,
+)
+from web3._utils.transactions import (
+    get_block_gas_limit,
+    get_buffered_gas_estimate,
+)
+from web3.middleware import (
+    make_stalecheck_middleware,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+from web3.utils import (
+    AsyncHeadTracker,
+    HeadTracker,
+    get_async_head_tracker,
+    get_head_tracker,
+)
+
+TRANSACTION = {"to": "0x" + "00" * 20}
+
+
+@pytest.fixture
+def methods():
+    return []
+
+
+@pytest.fixture
+def w3(methods):
+    def record_methods(make_request, w3):
+        def middleware(method, params):
+            methods.append(method)
+            return make_request(method, params)
+
+        return middleware
+
+    w3 = Web3(EthereumTesterProvider())
+    w3.middleware_onion.add(record_methods)
+    return w3
+
+
+def test_head_tracker_is_shared_per_provider(w3):
+    head_tracker = get_head_tracker(w3)
+    assert isinstance(head_tracker, HeadTracker)
+    assert get_head_tracker(w3) is head_tracker
+
+    w3.provider = EthereumTesterProvider()
+    assert get_head_tracker(w3) is not head_tracker
+
+
+def test_head_tracker_polls_once_per_interval(w3, methods):
+    head_tracker = get_head_tracker(w3)
+    head_tracker.poll_interval = 0.05
+
+    head = head_tracker.latest(w3)
+    assert head_tracker.latest(w3) is head
+    assert methods.count("eth_getBlockByNumber") == 1
+
+    w3.provider.ethereum_tester.mine_blocks(1)
+    time.sleep(0.05)
+    assert head_tracker.latest(w3)["number"] == head["number"] + 1
+    assert methods.count("eth_getBlockByNumber") == 2
+
+
+def test_head_tracker_update_from_subscription(w3, methods):
+    head_tracker = get_head_tracker(w3)
+    head = dict(w3.eth.get_block("latest"), gasLimit=12345)
+    methods.clear()
+
+    head_tracker.update(head)
+    assert head_tracker.latest(w3) is head
+    assert get_block_gas_limit(w3) == 12345
+    assert methods == []
+
+
+def test_gas_estimates_share_latest_block(w3, methods):
+    for _ in range(3):
+        get_buffered_gas_estimate(w3, TRANSACTION)
+    assert methods.count("eth_getBlockByNumber") == 1
+    assert "eth_blockNumber" not in methods
+
+
+def test_stalecheck_reads_shared_head(w3, methods):
+    w3.middleware_onion.add(make_stalecheck_middleware(60 * 60 * 24 * 365 * 100))
+    get_head_tracker(w3).update(w3.eth.get_block("latest"))
+    methods.clear()
+
+    w3.eth.chain_id
+    get_buffered_gas_estimate(w3, TRANSACTION)
+    assert "eth_getBlockByNumber" not in methods
+
+
+@pytest.mark.asyncio
+async def test_async_head_tracker_fetches_once_for_concurrent_readers():
+    methods = []
+
+    async def record_methods(make_request, async_w3):
+        async def middleware(method, params):
+            methods.append(method)
+            return await make_request(method, params)
+
+        return middleware
+
+    async_w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    async_w3.middleware_onion.add(record_methods)
+    head_tracker = get_async_head_tracker(async_w3)
+    assert isinstance(head_tracker, AsyncHeadTracker)
+
+    heads = await asyncio.gather(*(head_tracker.latest(async_w3) for _ in range(5)))
+    assert all(head is heads[0] for head in heads)
+
+    await async_get_buffered_gas_estimate(async_w3, TRANSACTION)
+    assert methods.count("eth_getBlockByNumber") == 1
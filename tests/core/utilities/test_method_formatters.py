@@ -1,12 +1,39 @@
 import pytest
 
+from eth_utils.curried import (
+    apply_formatter_to_array,
+    apply_one_of_formatters,
+)
+from eth_utils.toolz import (
+    assoc,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.formatters import (
+    is_array_of_dicts,
+    is_array_of_strings,
+)
 from web3._utils.method_formatters import (
+    BLOCK_FORMATTERS,
+    LOG_ENTRY_FORMATTERS,
+    RECEIPT_FORMATTERS,
+    TRANSACTION_RESULT_FORMATTERS,
+    block_formatter,
+    compile_formatter,
     get_error_formatters,
     raise_contract_logic_error_on_revert,
+    receipt_formatter,
+    to_hexbytes,
+    type_aware_apply_formatters_to_dict,
 )
 from web3._utils.rpc_abi import (
     RPC,
 )
+from web3.datastructures import (
+    AttributeDict,
+)
 from web3.exceptions import (
     ContractLogicError,
 )
@@ -192,3 +219,190 @@ def test_get_error_formatters() -> None:
     with pytest.raises(ContractLogicError):
         formatters(REVERT_WITHOUT_MSG)
     assert formatters(OTHER_ERROR) == OTHER_ERROR
+
+
+RAW_TRANSACTION = {
+    "blockHash": "0x" + "11" * 32,
+    "blockNumber": "0x12a05f2",
+    "from": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+    "gas": "0x5208",
+    "gasPrice": "0x6fc23ac00",
+    "maxFeePerGas": "0x9502f9000",
+    "maxPriorityFeePerGas": "0x3b9aca00",
+    "hash": "0x" + "22" * 32,
+    "input": "0xa9059cbb" + "00" * 64,
+    "nonce": "0x1",
+    "to": "0xdac17f958d2ee523a2206206994597c13d831ec7",
+    "transactionIndex": "0x0",
+    "value": "0xde0b6b3a7640000",
+    "type": "0x2",
+    "accessList": [
+        {
+            "address": "0xdac17f958d2ee523a2206206994597c13d831ec7",
+            "storageKeys": ["0x" + "00" * 31 + "01"],
+        }
+    ],
+    "chainId": "0x1",
+    "v": "0x1",
+    "r": "0x" + "33" * 31,
+    "s": "0x" + "44" * 32,
+    "yParity": "0x1",
+}
+
+RAW_BLOCK = {
+    "baseFeePerGas": "0x6c088e200",
+    "difficulty": "0x0",
+    "extraData": "0x6265617665726275696c642e6f7267",
+    "gasLimit": "0x1c9c380",
+    "gasUsed": "0xbc614e",
+    "hash": "0x" + "11" * 32,
+    "logsBloom": "0x" + "00" * 256,
+    "miner": "0x95222290dd7278aa3ddd389cc1e1d165cc4bafe5",
+    "mixHash": "0x" + "55" * 32,
+    "nonce": "0x0000000000000000",
+    "number": "0x12a05f2",
+    "parentHash": "0x" + "66" * 32,
+    "size": "0x249f0",
+    "timestamp": "0x6553f100",
+    "totalDifficulty": "0xc70d815d562d3cfa955",
+    "transactions": [RAW_TRANSACTION, assoc(RAW_TRANSACTION, "to", None)],
+    "uncles": [],
+    "withdrawals": [
+        {
+            "index": "0x1",
+            "validatorIndex": "0x186a0",
+            "address": "0xb9d7934878b5fb9610b3fe8a5e441e8fad7e293f",
+            "amount": "0xe4e1c0",
+        }
+    ],
+    "withdrawalsRoot": None,
+}
+
+RAW_RECEIPT = {
+    "blockHash": "0x" + "11" * 32,
+    "blockNumber": "0x12a05f2",
+    "contractAddress": None,
+    "cumulativeGasUsed": "0x12d687",
+    "effectiveGasPrice": "0x6fc23ac00",
+    "from": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+    "gasUsed": "0xfde8",
+    "logs": [
+        {
+            "address": "0xdac17f958d2ee523a2206206994597c13d831ec7",
+            "blockHash": "0x" + "11" * 32,
+            "blockNumber": "0x12a05f2",
+            "data": "0x" + "00" * 31 + "01",
+            "logIndex": "0x0",
+            "removed": False,
+            "topics": ["0x" + "00" * 28 + "ddf252ad", "0x" + "00" * 31 + "02"],
+            "transactionHash": "0x" + "22" * 32,
+            "transactionIndex": "0x0",
+        }
+    ],
+    "logsBloom": "0x" + "00" * 256,
+    "status": "0x1",
+    "to": "0xdac17f958d2ee523a2206206994597c13d831ec7",
+    "transactionHash": "0x" + "22" * 32,
+    "transactionIndex": "0x0",
+    "type": "0x2",
+}
+
+declarative_block_formatter = type_aware_apply_formatters_to_dict(
+    assoc(
+        BLOCK_FORMATTERS,
+        "transactions",
+        apply_one_of_formatters(
+            (
+                (
+                    is_array_of_dicts,
+                    apply_formatter_to_array(
+                        type_aware_apply_formatters_to_dict(
+                            TRANSACTION_RESULT_FORMATTERS
+                        )
+                    ),
+                ),
+                (is_array_of_strings, apply_formatter_to_array(to_hexbytes(32))),
+            )
+        ),
+    )
+)
+declarative_receipt_formatter = type_aware_apply_formatters_to_dict(
+    assoc(
+        RECEIPT_FORMATTERS,
+        "logs",
+        apply_formatter_to_array(
+            type_aware_apply_formatters_to_dict(LOG_ENTRY_FORMATTERS)
+        ),
+    )
+)
+
+
+@pytest.mark.parametrize(
+    "compiled,declarative,value",
+    (
+        (block_formatter, declarative_block_formatter, RAW_BLOCK),
+        (
+            block_formatter,
+            declarative_block_formatter,
+            assoc(RAW_BLOCK, "transactions", ["0x" + "22" * 32]),
+        ),
+        (
+            block_formatter,
+            declarative_block_formatter,
+            AttributeDict.recursive(RAW_BLOCK),
+        ),
+        (receipt_formatter, declarative_receipt_formatter, RAW_RECEIPT),
+        (
+            receipt_formatter,
+            declarative_receipt_formatter,
+            AttributeDict.recursive(RAW_RECEIPT),
+        ),
+    ),
+)
+def test_compiled_formatters_match_declarative_formatters(compiled, declarative, value):
+    formatted = compiled(value)
+    assert formatted == declarative(value)
+    assert type(formatted) is type(declarative(value))
+    # formatting is idempotent
+    assert compiled(formatted) == formatted
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "0x" + "00" * 32,
+        "0x" + "00" * 33,
+        "0x" + "01" + "00" * 32,
+        "0x" + "00" * 31,
+        "0x0",
+        "0x 1" + "00" * 31,
+        "00" * 32,
+        b"\x01" * 32,
+        1,
+        None,
+    ),
+)
+def test_compiled_to_hexbytes_matches_to_hexbytes(value):
+    compiled = compile_formatter(to_hexbytes(32))
+    try:
+        expected = to_hexbytes(32, value)
+    except Exception as exc:
+        with pytest.raises(type(exc)):
+            compiled(value)
+    else:
+        assert compiled(value) == expected
+        assert type(compiled(value)) is HexBytes
+
+
+def test_compiled_formatter_errors_name_the_field():
+    with pytest.raises(ValueError, match="as field 'hash'"):
+        block_formatter(assoc(RAW_BLOCK, "hash", "0x" + "11" * 33))
+    with pytest.raises(TypeError, match="as field 'miner'"):
+        block_formatter(assoc(RAW_BLOCK, "miner", 1.5))
+
+
+def test_compile_formatter_returns_unknown_formatters_unchanged():
+    def formatter(value):
+        return value
+
+    assert compile_formatter(formatter) is formatter
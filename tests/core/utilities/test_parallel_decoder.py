@@ -0,0 +1,127 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import pytest
+
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.events import (
+    get_event_data,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    MismatchedABI,
+)
+from web3.utils.decoding import (
+    ParallelDecoder,
+)
+
+ADDRESS = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+TRANSFER_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Transfer",
+    "type": "event",
+}
+GET_RESERVES_ABI = {
+    "inputs": [],
+    "name": "getReserves",
+    "outputs": [
+        {"name": "reserve0", "type": "uint112"},
+        {"name": "reserve1", "type": "uint112"},
+        {"name": "pair", "type": "address"},
+    ],
+    "stateMutability": "view",
+    "type": "function",
+}
+BALANCE_OF_ABI = {
+    "inputs": [{"name": "owner", "type": "address"}],
+    "name": "balanceOf",
+    "outputs": [{"name": "", "type": "uint256"}],
+    "stateMutability": "view",
+    "type": "function",
+}
+
+
+def _transfer_log(w3, value):
+    return AttributeDict(
+        {
+            "address": ADDRESS,
+            "topics": [
+                HexBytes(event_abi_to_log_topic(TRANSFER_ABI)),
+                HexBytes(w3.codec.encode(["address"], [ADDRESS])),
+                HexBytes(w3.codec.encode(["address"], ["0x" + "00" * 20])),
+            ],
+            "data": HexBytes(w3.codec.encode(["uint256"], [value])),
+            "logIndex": value,
+            "transactionIndex": 0,
+            "transactionHash": HexBytes(b"\x01" * 32),
+            "blockHash": HexBytes(b"\x02" * 32),
+            "blockNumber": 1,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def decoder(w3):
+    with ParallelDecoder(w3, max_workers=2, chunk_size=3) as decoder:
+        yield decoder
+
+
+def test_parallel_decoder_decodes_logs_in_order(w3, decoder):
+    logs = [_transfer_log(w3, value) for value in range(10)]
+
+    events = decoder.decode_logs(TRANSFER_ABI, logs)
+
+    assert events == [get_event_data(w3.codec, TRANSFER_ABI, log) for log in logs]
+    assert [event.args.value for event in events] == list(range(10))
+    assert decoder.decode_logs(TRANSFER_ABI, []) == []
+
+
+def test_parallel_decoder_decodes_call_results_in_order(w3, decoder):
+    reserves = [
+        w3.codec.encode(["uint112", "uint112", "address"], [i, 2 * i, ADDRESS])
+        for i in range(7)
+    ]
+    balances = [HexBytes(w3.codec.encode(["uint256"], [i])) for i in range(7)]
+
+    assert decoder.decode_call_results(GET_RESERVES_ABI, reserves) == [
+        [i, 2 * i, ADDRESS] for i in range(7)
+    ]
+    assert decoder.decode_call_results(BALANCE_OF_ABI, balances) == list(range(7))
+
+
+def test_parallel_decoder_errors(w3, decoder):
+    log = _transfer_log(w3, 1)
+    other_log = AttributeDict({**log, "topics": [HexBytes(b"\x00" * 32)]})
+
+    with pytest.raises(MismatchedABI, match="did not match"):
+        decoder.decode_logs(TRANSFER_ABI, [log, other_log])
+    with pytest.raises(BadFunctionCallOutput, match="getReserves"):
+        decoder.decode_call_results(GET_RESERVES_ABI, [b"\x01"])
+    with pytest.raises(ValueError, match="chunk_size"):
+        ParallelDecoder(w3, chunk_size=0)
+
+
+def test_parallel_decoder_with_executor(w3):
+    logs = [_transfer_log(w3, value) for value in range(5)]
+
+    with ThreadPoolExecutor(2) as executor:
+        with ParallelDecoder(w3, chunk_size=2, executor=executor) as decoder:
+            events = decoder.decode_logs(TRANSFER_ABI, logs)
+        # the executor isn't shut down with the decoder
+        assert executor.submit(len, logs).result() == 5
+
+    assert [event.args.value for event in events] == list(range(5))
@@ -0,0 +1,217 @@
+"""
+The parts of contract classes derived from the contract ABI, shared by all the
+contracts with the same ABI.
+
+Contract factories are usually made for many addresses that share one ABI, e.g.
+ERC-20 tokens. A ``CachedABI`` validates the ABI once, and holds the function
+and event ABIs and the function and event classes, so contracts with the same
+ABI only set their ``w3`` and address. ABIs are cached by the hash of their
+contents, and by the identity of the ABI object, which is the same for every
+contract made by a factory.
+
+Contracts build their functions and events on first access, using the name
+index, so their cost scales with the functions and events used rather than with
+the size of the ABI.
+"""
+
+from collections import (
+    OrderedDict,
+)
+import json
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import (
+    encode_hex,
+    keccak,
+)
+
+from web3._utils.abi import (
+    filter_by_type,
+)
+from web3._utils.datatypes import (
+    PropertyCheckingFactory,
+)
+from web3._utils.validation import (
+    validate_abi,
+)
+from web3.types import (
+    ABI,
+    ABIEvent,
+    ABIFunction,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.contract.base_contract import (  # noqa: F401
+        BaseContractEvent,
+        BaseContractFunction,
+    )
+
+MAX_CACHED_ABIS = 256
+
+
+def hash_abi(abi: ABI) -> HexStr:
+    return encode_hex(
+        keccak(text=json.dumps(abi, sort_keys=True, separators=(",", ":")))
+    )
+
+
+class CachedABI:
+    """
+    The parts of contract classes derived from ``abi``. Get them with
+    ``get_cached_abi``, which caches them.
+    """
+
+    def __init__(self, abi: ABI, abi_hash: HexStr) -> None:
+        self.abi = abi
+        self.abi_hash = abi_hash
+        self.is_validated = False
+        self.functions: List[ABIFunction] = filter_by_type("function", abi)
+        self.events: List[ABIEvent] = filter_by_type("event", abi)
+        self.function_names = frozenset(fn_abi["name"] for fn_abi in self.functions)
+        self.event_names = frozenset(event_abi["name"] for event_abi in self.events)
+        self._function_classes: Dict[
+            Tuple[Type["BaseContractFunction"], str, bool],
+            Type["BaseContractFunction"],
+        ] = {}
+        self._event_classes: Dict[
+            Tuple[Type["BaseContractEvent"], str], Type["BaseContractEvent"]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def validate(self) -> None:
+        if not self.is_validated:
+            validate_abi(self.abi)
+            self.is_validated = True
+
+    def function_class(
+        self,
+        contract_function_class: Type["BaseContractFunction"],
+        function_name: str,
+        decode_tuples: Optional[bool] = False,
+    ) -> Type["BaseContractFunction"]:
+        """
+        The ``contract_function_class`` subclass for the function named
+        ``function_name``. Instances set their ``w3`` and ``address``.
+        """
+        key = (contract_function_class, function_name, bool(decode_tuples))
+        with self._lock:
+            if key not in self._function_classes:
+                self._function_classes[key] = PropertyCheckingFactory(
+                    function_name,
+                    (contract_function_class,),
+                    {
+                        "contract_abi": self.abi,
+                        "function_identifier": function_name,
+                        "decode_tuples": decode_tuples,
+                    },
+                )
+            return self._function_classes[key]
+
+    def event_class(
+        self,
+        contract_event_class: Type["BaseContractEvent"],
+        event_name: str,
+    ) -> Type["BaseContractEvent"]:
+        """
+        The ``contract_event_class`` subclass for the event named ``event_name``.
+        Events are used as classes, so each contract subclasses it to set its
+        ``w3`` and ``address``.
+        """
+        key = (contract_event_class, event_name)
+        with self._lock:
+            if key not in self._event_classes:
+                self._event_classes[key] = PropertyCheckingFactory(
+                    event_name,
+                    (contract_event_class,),
+                    {"contract_abi": self.abi, "event_name": event_name},
+                )
+            return self._event_classes[key]
+
+    def make_function(
+        self,
+        contract_function_class: Type["BaseContractFunction"],
+        function_name: str,
+        w3: Union["AsyncWeb3", "Web3"],
+        address: Optional[ChecksumAddress] = None,
+        decode_tuples: Optional[bool] = False,
+    ) -> Any:
+        function = self.function_class(
+            contract_function_class, function_name, decode_tuples
+        )()
+        function.w3 = w3
+        function.address = address
+        return function
+
+    def make_event(
+        self,
+        contract_event_class: Type["BaseContractEvent"],
+        event_name: str,
+        w3: Union["AsyncWeb3", "Web3"],
+        address: Optional[ChecksumAddress] = None,
+    ) -> Type["BaseContractEvent"]:
+        event_class = self.event_class(contract_event_class, event_name)
+        return type(event_name, (event_class,), {"w3": w3, "address": address})
+
+
+_abis_by_hash: "OrderedDict[HexStr, CachedABI]" = OrderedDict()
+_abis_by_id: "OrderedDict[int, Tuple[ABI, CachedABI]]" = OrderedDict()
+_abis_lock = threading.Lock()
+
+
+def _cache(key: Any, value: Any, cache: "OrderedDict[Any, Any]") -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_CACHED_ABIS:
+        cache.popitem(last=False)
+
+
+def get_cached_abi(abi: ABI) -> CachedABI:
+    """
+    Return the ``CachedABI`` for ``abi``, building it on first use. ABIs with
+    the same contents share one ``CachedABI``, whose ``abi`` is the first of
+    them, and the ``MAX_CACHED_ABIS`` most recently used ones are kept.
+    """
+    with _abis_lock:
+        # the cache keeps ``abi`` alive, so the id can't be reused by another
+        # object while it is cached
+        abi_and_cached_abi = _abis_by_id.get(id(abi))
+        if abi_and_cached_abi is not None and abi_and_cached_abi[0] is abi:
+            _abis_by_id.move_to_end(id(abi))
+            return abi_and_cached_abi[1]
+
+    abi_hash = hash_abi(abi)
+    with _abis_lock:
+        cached_abi = _abis_by_hash.get(abi_hash)
+        if cached_abi is None:
+            cached_abi = CachedABI(abi, abi_hash)
+        _cache(abi_hash, cached_abi, _abis_by_hash)
+        _cache(id(abi), (abi, cached_abi), _abis_by_id)
+    return cached_abi
+
+
+def get_validated_abi(abi: ABI) -> ABI:
+    """
+    Validate ``abi``, once per ABI contents, and return the ABI object shared by
+    the contracts with the same ABI.
+    """
+    cached_abi = get_cached_abi(abi)
+    cached_abi.validate()
+    return cached_abi.abi
@@ -1,52 +1,132 @@
+import asyncio
+import inspect
 from typing import TYPE_CHECKING, Optional, cast
 from eth_typing import ChecksumAddress
-from eth_utils.toolz import assoc, merge
+from eth_utils.toolz import assoc, dissoc, merge
 from hexbytes import HexBytes
+from web3._utils.chain_constants import async_get_chain_id, cache_block_gas_limit, get_cached_block_gas_limit, has_cached_block_gas_limit
 from web3._utils.transactions import prepare_replacement_transaction
 from web3._utils.utility_methods import any_in_dict
 from web3.constants import DYNAMIC_FEE_TXN_PARAMS
 from web3.types import BlockIdentifier, TxData, TxParams, Wei, _Hash32
+from web3.utils.head_tracker import get_async_head_tracker
 if TYPE_CHECKING:
     from web3.eth import AsyncEth
     from web3.main import AsyncWeb3
+
+
+async def _estimate_gas(async_w3: 'AsyncWeb3', tx: TxParams) ->int:
+    return await async_w3.eth.estimate_gas(tx)
+
+
+async def _max_fee_per_gas(async_w3: 'AsyncWeb3', _tx: TxParams) ->Wei:
+    block, max_priority_fee = await asyncio.gather(async_w3.eth.get_block(
+        'latest'), async_w3.eth.max_priority_fee)
+    return Wei(max_priority_fee + 2 * block['baseFeePerGas'])
+
+
+async def _max_priority_fee_gas(async_w3: 'AsyncWeb3', _tx: TxParams) ->Wei:
+    return await async_w3.eth.max_priority_fee
+
+
+async def _chain_id(async_w3: 'AsyncWeb3', _tx: TxParams) ->int:
+    return await async_get_chain_id(async_w3)
+
+
 TRANSACTION_DEFAULTS = {'value': 0, 'data': b'', 'gas': _estimate_gas,
     'gasPrice': lambda async_w3, tx: async_w3.eth.generate_gas_price(tx),
     'maxFeePerGas': _max_fee_per_gas, 'maxPriorityFeePerGas':
     _max_priority_fee_gas, 'chainId': _chain_id}
 
 
+async def _await_defaults(defaults: TxParams) ->None:
+    pending_keys = [key for key, val in defaults.items() if inspect.isawaitable(val)]
+    if pending_keys:
+        pending_values = await asyncio.gather(*(defaults[key] for key in
+            pending_keys))
+        defaults.update(zip(pending_keys, pending_values))
+
+
+async def get_block_gas_limit(web3_eth: 'AsyncEth', block_identifier:
+    Optional[BlockIdentifier]=None) ->int:
+    if block_identifier is None:
+        async_w3 = web3_eth.w3
+        head_tracker = get_async_head_tracker(async_w3)
+        if not head_tracker.is_current() and has_cached_block_gas_limit(
+            async_w3.provider):
+            # the gas limit is still cached if the head has not moved since
+            gas_limit = get_cached_block_gas_limit(async_w3.provider,
+                await web3_eth.block_number)
+            if gas_limit is not None:
+                return gas_limit
+        head = await head_tracker.latest(async_w3)
+        cache_block_gas_limit(async_w3.provider, head)
+        return head['gasLimit']
+    block = await web3_eth.get_block(block_identifier)
+    return block['gasLimit']
+
+
+async def get_buffered_gas_estimate(async_w3: 'AsyncWeb3', transaction:
+    TxParams, gas_buffer: int=100000) ->int:
+    gas_estimate_transaction = cast(TxParams, dict(**transaction))
+    gas_estimate, gas_limit = await asyncio.gather(async_w3.eth.
+        estimate_gas(gas_estimate_transaction), get_block_gas_limit(
+        async_w3.eth))
+    if gas_estimate > gas_limit:
+        raise ValueError(
+            f'Contract does not appear to be deployable within the current network gas limits.  Estimated: {gas_estimate}. Current gas limit: {gas_limit}'
+            )
+    return min(gas_limit, gas_estimate + gas_buffer)
+
+
 async def async_fill_transaction_defaults(async_w3: 'AsyncWeb3',
     transaction: TxParams) ->TxParams:
     """
     if async_w3 is None, fill as much as possible while offline
     """
-    filled_transaction = cast(TxParams, {})
+    if 'nonce' in transaction and transaction['nonce'] is None:
+        # filled in like a missing nonce, rather than sent as is
+        transaction = cast(TxParams, dissoc(transaction, 'nonce'))
+
+    strategy_based_gas_price = async_w3.eth.generate_gas_price(transaction)
+    is_dynamic_fee_transaction = strategy_based_gas_price is None and (
+        'gasPrice' not in transaction or any_in_dict(DYNAMIC_FEE_TXN_PARAMS,
+        transaction))
+
+    defaults = cast(TxParams, {})
+    estimate_gas = False
     for key, default_getter in TRANSACTION_DEFAULTS.items():
         if key not in transaction:
+            if (is_dynamic_fee_transaction and key == 'gasPrice' or not
+                is_dynamic_fee_transaction and key in DYNAMIC_FEE_TXN_PARAMS):
+                # do not set default max fees if legacy txn or
+                # gas price if dynamic fee txn
+                continue
+
             if callable(default_getter):
                 if async_w3 is None:
+                    raise ValueError(
+                        f"You must specify a '{key}' value in the transaction")
+                if key == 'gas':
+                    # estimated below, once the other defaults are set
+                    estimate_gas = True
                     continue
-                default_val = (
-                    await default_getter(async_w3, transaction)
-                    if key in DYNAMIC_FEE_TXN_PARAMS
-                    else await default_getter(async_w3, filled_transaction)
-                )
+                # `generate_gas_price()` is on the `BaseEth` class and does not
+                # need to be awaited, the other defaults are awaited below
+                default_val = default_getter(async_w3, transaction)
             else:
                 default_val = default_getter
-            filled_transaction[key] = default_val
-    
-    filled_transaction = merge(filled_transaction, transaction)
-    
-    if async_w3 is not None:
-        if 'from' not in filled_transaction:
-            filled_transaction['from'] = await async_w3.eth.default_account
-        
-        if filled_transaction.get('nonce') is None:
-            filled_transaction['nonce'] = await async_w3.eth.get_transaction_count(
-                filled_transaction['from']
-            )
-        
-        if 'chainId' not in filled_transaction:
-            filled_transaction['chainId'] = await async_w3.eth.chain_id
-    
-    return filled_transaction
+            defaults[key] = default_val
+
+    sender = transaction.get('from')
+    if async_w3 is not None and sender and 'nonce' not in transaction:
+        defaults['nonce'] = async_w3.eth.get_transaction_count(sender,
+            'pending')
+
+    # the fee fields, chain id and nonce do not depend on each other, so they
+    # are fetched concurrently, then gas is estimated with them set
+    await _await_defaults(defaults)
+    if estimate_gas:
+        defaults['gas'] = await _estimate_gas(async_w3, merge(defaults,
+            transaction))
+    return merge(defaults, transaction)
@@ -1,31 +1,110 @@
+from array import array
 import collections
 import hashlib
 from typing import TYPE_CHECKING, Any, Callable, List, Tuple
-from eth_utils import is_boolean, is_bytes, is_dict, is_list_like, is_null, is_number, is_text, to_bytes
 if TYPE_CHECKING:
     from web3.types import RPCEndpoint
 
 
+def _encode_text_sequence(value: Any, chunks: List[str]) -> None:
+    # all lengths are packed at C speed into a fixed-width run of latin-1
+    # characters so the texts themselves can be concatenated without separators
+    lengths = array("Q", map(len, value)).tobytes().decode("latin-1")
+    chunks.append(f"S{len(value)}:{lengths}{''.join(value)}")
+
+
+def _encode_mapping(value: Any, chunks: List[str]) -> None:
+    if all(type(key) is str for key in value):
+        chunks.append(f"m{len(value)}:")
+        for key in sorted(value):
+            chunks.append(f"s{len(key)}:{key}")
+            _encode_value(value[key], chunks)
+    else:
+        # keys are sorted by their encoding, which is unique per key, so the
+        # ordering never falls through to comparing the values
+        encoded_items = []
+        for key, item in value.items():
+            key_chunks: List[str] = []
+            _encode_value(key, key_chunks)
+            encoded_items.append(("".join(key_chunks), item))
+        encoded_items.sort(key=lambda encoded_item: encoded_item[0])
+        chunks.append(f"m{len(encoded_items)}:")
+        for encoded_key, item in encoded_items:
+            chunks.append(encoded_key)
+            _encode_value(item, chunks)
+
+
+def _encode_sequence(value: Any, chunks: List[str]) -> None:
+    if value:
+        item_types = set(map(type, value))
+        if item_types == {str} or all(issubclass(t, str) for t in item_types):
+            _encode_text_sequence(value, chunks)
+            return
+
+    chunks.append(f"l{len(value)}:")
+    for item in value:
+        if type(item) is str:
+            chunks.append(f"s{len(item)}:{item}")
+        else:
+            _encode_value(item, chunks)
+
+
+def _encode_value(value: Any, chunks: List[str]) -> None:
+    """
+    Append a canonical encoding of ``value`` to ``chunks``.
+
+    Every encoded value starts with a type tag and every variable length value
+    carries its length, so values of different types or with different nesting
+    can never produce the same encoding.
+    """
+    value_type = type(value)
+    if value_type is str:
+        chunks.append(f"s{len(value)}:{value}")
+    elif value_type is list or value_type is tuple:
+        _encode_sequence(value, chunks)
+    elif value_type is dict:
+        _encode_mapping(value, chunks)
+    elif value is None:
+        chunks.append("n")
+    elif value_type is bool:
+        chunks.append("t" if value else "f")
+    elif value_type is int:
+        chunks.append(f"i{value};")
+    elif value_type is bytes:
+        chunks.append(f"b{len(value)}:{value.hex()}")
+    # subclasses (``HexBytes``, ``AttributeDict``, ``Wei``...) and everything else
+    elif isinstance(value, bool):
+        chunks.append("t" if value else "f")
+    elif isinstance(value, int):
+        chunks.append(f"i{int(value)};")
+    elif isinstance(value, float):
+        chunks.append(f"d{float(value).hex()};")
+    elif isinstance(value, str):
+        _encode_value(str(value), chunks)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        _encode_value(bytes(value), chunks)
+    elif isinstance(value, collections.abc.Mapping):
+        _encode_mapping(value, chunks)
+    elif isinstance(value, (list, tuple, collections.abc.Generator)):
+        _encode_sequence(tuple(value), chunks)
+    else:
+        text = str(value)
+        chunks.append(f"o{len(text)}:{text}")
+
+
 def generate_cache_key(value: Any) -> str:
     """
     Generates a cache key for the *args and **kwargs
+
+    The value is walked once into a canonical encoding which is hashed, rather
+    than hashing its ``repr``. Mappings are compared by content, so a ``dict``
+    and an ``AttributeDict`` with the same items, in any order, share a key.
     """
-    if is_null(value):
-        return "null"
-    elif is_boolean(value):
-        return "bool:%s" % str(value).lower()
-    elif is_number(value):
-        return "num:%d" % value
-    elif is_text(value):
-        return "text:%s" % value
-    elif is_bytes(value):
-        return "bytes:%s" % hashlib.md5(value).hexdigest()
-    elif is_list_like(value):
-        return "list:%s" % hashlib.md5(to_bytes(str(value))).hexdigest()
-    elif is_dict(value):
-        return "dict:%s" % hashlib.md5(to_bytes(str(sorted(value.items())))).hexdigest()
-    else:
-        return "obj:%s" % hashlib.md5(to_bytes(str(value))).hexdigest()
+    chunks: List[str] = []
+    _encode_value(value, chunks)
+    return hashlib.sha1(
+        "".join(chunks).encode("utf-8", "surrogatepass")
+    ).hexdigest()
 
 
 class RequestInformation:
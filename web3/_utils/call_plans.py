@@ -0,0 +1,253 @@
+"""
+Precompiled plans for calling contract functions.
+
+Encoding the arguments of a contract call and decoding its result only depend
+on the function ABI and on the normalizers applied to the data, but
+``prepare_transaction`` and ``map_abi_data`` work them out again on every call.
+A ``CallPlan`` does that work once per function ABI: it holds the selector, the
+input and output types and the normalizers composed into one function, so each
+call only aligns, normalizes and encodes its arguments, and decodes and
+normalizes the result.
+"""
+
+from collections import (
+    OrderedDict,
+)
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+import weakref
+
+from eth_abi.codec import (
+    ABICodec,
+)
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import (
+    encode_hex,
+    function_abi_to_4byte_selector,
+)
+
+from web3._utils.abi import (
+    get_abi_input_types,
+    get_abi_output_types,
+    get_aligned_abi_inputs,
+    merge_args_and_kwargs,
+    named_tree,
+    recursive_dict_to_namedtuple,
+)
+from web3._utils.contracts import (
+    validate_payable,
+)
+from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+    Normalizer,
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_ens_resolver,
+    abi_string_to_text,
+    compose_normalizers,
+    get_flat_types,
+    normalize_data,
+)
+from web3.types import (
+    ABIFunction,
+    TxParams,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+# the normalizers ``encode_abi`` applies to arguments, except the ENS resolver,
+# which depends on the ``Web3`` instance
+INPUT_NORMALIZERS: Tuple[Normalizer, ...] = (
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_string_to_text,
+)
+MAX_CALL_PLANS = 1024
+
+
+class CallPlan:
+    """
+    Everything needed to encode a call to the function described by ``fn_abi``
+    and to decode its result that does not depend on the arguments. Get plans
+    with ``get_call_plan``, which caches them.
+    """
+
+    def __init__(
+        self,
+        fn_abi: ABIFunction,
+        return_normalizers: Sequence[Normalizer] = (),
+    ) -> None:
+        self.fn_abi = fn_abi
+        self.return_normalizers = tuple(return_normalizers)
+        if fn_abi["type"] in ("fallback", "receive"):
+            self.selector = HexStr("0x")
+        else:
+            self.selector = encode_hex(function_abi_to_4byte_selector(fn_abi))
+        self.input_types = get_abi_input_types(fn_abi)
+        self.output_types = get_abi_output_types(fn_abi) if "outputs" in fn_abi else []
+        self._selector_bytes = bytes.fromhex(self.selector[2:])
+        self._flat_input_types = get_flat_types(self.input_types)
+        self._flat_output_types = get_flat_types(self.output_types)
+        self._input_normalizer = compose_normalizers(INPUT_NORMALIZERS)
+        self._output_normalizer = compose_normalizers(
+            tuple(BASE_RETURN_NORMALIZERS) + self.return_normalizers
+        )
+
+    def prepare_transaction(
+        self,
+        address: ChecksumAddress,
+        w3: Union["AsyncWeb3", "Web3"],
+        transaction: Optional[TxParams] = None,
+        args: Optional[Sequence[Any]] = None,
+        kwargs: Optional[Any] = None,
+    ) -> TxParams:
+        """
+        ``web3._utils.contracts.prepare_transaction`` for this function.
+        """
+        validate_payable(transaction, self.fn_abi)
+
+        if transaction is None:
+            prepared_transaction: TxParams = {}
+        else:
+            prepared_transaction = cast(TxParams, dict(**transaction))
+
+        if "data" in prepared_transaction:
+            raise ValueError("Transaction parameter may not contain a 'data' key")
+
+        if address:
+            prepared_transaction.setdefault("to", address)
+
+        prepared_transaction["data"] = self.encode_input(w3, args, kwargs)
+        return prepared_transaction
+
+    def encode_input(
+        self,
+        w3: Union["AsyncWeb3", "Web3"],
+        args: Optional[Sequence[Any]] = None,
+        kwargs: Optional[Any] = None,
+    ) -> HexStr:
+        """
+        Return the call data for ``args`` and ``kwargs``: the selector followed
+        by the normalized and encoded arguments.
+        """
+        if "inputs" not in self.fn_abi:
+            # the fallback and receive functions take no arguments
+            return self.selector
+
+        arguments = merge_args_and_kwargs(self.fn_abi, args or (), kwargs or {})
+        _, aligned_arguments = get_aligned_abi_inputs(self.fn_abi, arguments)
+        codec = w3.codec
+        if not all(
+            codec.is_encodable(_type, arg)
+            for _type, arg in zip(self.input_types, aligned_arguments)
+        ):
+            raise TypeError(
+                "One or more arguments could not be encoded to the necessary "
+                f"ABI type. Expected types are: {', '.join(self.input_types)}"
+            )
+
+        if w3.eth.is_async:
+            normalizer = self._input_normalizer
+        else:
+            normalizer = _get_ens_input_normalizer(w3)
+        normalized_arguments = normalize_data(
+            normalizer, self.input_types, self._flat_input_types, aligned_arguments
+        )
+        return encode_hex(
+            self._selector_bytes + codec.encode(self.input_types, normalized_arguments)
+        )
+
+    def decode_output(
+        self, codec: ABICodec, return_data: bytes, decode_tuples: bool = False
+    ) -> Any:
+        """
+        Decode and normalize the result of the call. A single output is
+        returned as is, several as a list. Raises ``DecodingError`` if
+        ``return_data`` can't be decoded.
+        """
+        output_data = codec.decode(self.output_types, return_data)
+        normalized_data = normalize_data(
+            self._output_normalizer,
+            self.output_types,
+            self._flat_output_types,
+            output_data,
+        )
+
+        if decode_tuples:
+            decoded = named_tree(self.fn_abi["outputs"], normalized_data)
+            normalized_data = recursive_dict_to_namedtuple(decoded)
+
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
+
+
+_ens_input_normalizers: "weakref.WeakKeyDictionary[Web3, Normalizer]" = (
+    weakref.WeakKeyDictionary()
+)
+_ens_input_normalizers_lock = threading.Lock()
+
+
+def _get_ens_input_normalizer(w3: "Web3") -> Normalizer:
+    """
+    Return the input normalizers composed with the ENS resolver of ``w3``,
+    building them on first use. They are cached for as long as ``w3`` lives.
+    """
+    with _ens_input_normalizers_lock:
+        normalizer = _ens_input_normalizers.get(w3)
+    if normalizer is None:
+        # the resolver holds a proxy to ``w3``, as the cached normalizer would
+        # otherwise keep its key alive
+        normalizer = compose_normalizers(
+            INPUT_NORMALIZERS + (abi_ens_resolver(weakref.proxy(w3)),)
+        )
+        with _ens_input_normalizers_lock:
+            _ens_input_normalizers[w3] = normalizer
+    return normalizer
+
+
+_call_plans: "OrderedDict[Tuple[int, Tuple[Normalizer, ...]], CallPlan]" = OrderedDict()
+_call_plans_lock = threading.Lock()
+
+
+def get_call_plan(
+    fn_abi: ABIFunction,
+    return_normalizers: Sequence[Normalizer] = (),
+) -> CallPlan:
+    """
+    Return the cached ``CallPlan`` for ``fn_abi`` and ``return_normalizers``,
+    building it on first use. Plans are cached by the identity of ``fn_abi``,
+    which is the same dict for every call to a function of a contract, and the
+    ``MAX_CALL_PLANS`` most recently used ones are kept.
+    """
+    return_normalizers = tuple(return_normalizers)
+    # a cached plan keeps its ``fn_abi`` alive, so the id can't be reused by
+    # another dict while the plan is cached
+    key = (id(fn_abi), return_normalizers)
+    with _call_plans_lock:
+        plan = _call_plans.get(key)
+        if plan is not None:
+            _call_plans.move_to_end(key)
+            return plan
+
+    plan = CallPlan(fn_abi, return_normalizers)
+    with _call_plans_lock:
+        _call_plans[key] = plan
+        while len(_call_plans) > MAX_CALL_PLANS:
+            _call_plans.popitem(last=False)
+    return plan
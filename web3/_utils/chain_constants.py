@@ -0,0 +1,95 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Optional,
+    Union,
+)
+
+from eth_utils import (
+    to_int,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.providers import (  # noqa: F401
+        AsyncBaseProvider,
+        BaseProvider,
+    )
+    from web3.types import (  # noqa: F401
+        BlockData,
+    )
+
+CHAIN_ID = "chain_id"
+LATEST_BLOCK_GAS_LIMIT = "latest_block_gas_limit"
+
+
+def get_chain_constants(
+    provider: Union["BaseProvider", "AsyncBaseProvider"],
+) -> Dict[str, Any]:
+    """
+    Values that do not change for the lifetime of a connection, e.g. the chain
+    id, and values scoped to a block, which are kept with their block number.
+    They are kept on the provider, so a new provider starts out empty, and
+    persistent connection providers drop them when they connect or disconnect.
+    """
+    if provider._chain_constants is None:
+        provider._chain_constants = {}
+    return provider._chain_constants
+
+
+def clear_chain_constants(provider: Union["BaseProvider", "AsyncBaseProvider"]) -> None:
+    provider._chain_constants = None
+    # the head of the previous connection is no longer current either
+    provider._head_tracker = None
+
+
+def get_chain_id(w3: "Web3") -> int:
+    chain_constants = get_chain_constants(w3.provider)
+    if CHAIN_ID not in chain_constants:
+        chain_constants[CHAIN_ID] = w3.eth.chain_id
+    return chain_constants[CHAIN_ID]
+
+
+async def async_get_chain_id(async_w3: "AsyncWeb3") -> int:
+    chain_constants = get_chain_constants(async_w3.provider)
+    if CHAIN_ID not in chain_constants:
+        chain_constants[CHAIN_ID] = await async_w3.eth.chain_id
+    return chain_constants[CHAIN_ID]
+
+
+def _to_int(value: Any) -> int:
+    return to_int(hexstr=value) if isinstance(value, str) else value
+
+
+def cache_block_gas_limit(
+    provider: Union["BaseProvider", "AsyncBaseProvider"],
+    block: "BlockData",
+) -> None:
+    """
+    Keep the gas limit of the newest block seen. Block headers received from a
+    ``newHeads`` subscription can be passed in as well as fetched blocks.
+    """
+    number, gas_limit = _to_int(block["number"]), _to_int(block["gasLimit"])
+    chain_constants = get_chain_constants(provider)
+    cached = chain_constants.get(LATEST_BLOCK_GAS_LIMIT)
+    if cached is None or cached[0] <= number:
+        chain_constants[LATEST_BLOCK_GAS_LIMIT] = (number, gas_limit)
+
+
+def has_cached_block_gas_limit(
+    provider: Union["BaseProvider", "AsyncBaseProvider"],
+) -> bool:
+    return LATEST_BLOCK_GAS_LIMIT in get_chain_constants(provider)
+
+
+def get_cached_block_gas_limit(
+    provider: Union["BaseProvider", "AsyncBaseProvider"], block_number: int
+) -> Optional[int]:
+    cached = get_chain_constants(provider).get(LATEST_BLOCK_GAS_LIMIT)
+    if cached is not None and cached[0] == block_number:
+        return cached[1]
+    return None
@@ -124,7 +124,17 @@ class DynamicArrayPackedEncoder(BaseArrayEncoder):
 
 
 class Web3JsonEncoder(json.JSONEncoder):
-    pass
+
+    def default(self, obj: Any) ->Union[Dict[Any, Any], HexStr]:
+        if isinstance(obj, AttributeDict):
+            # not ``obj.__dict__``: lazy and compact subclasses keep their
+            # values elsewhere
+            return dict(obj)
+        elif isinstance(obj, HexBytes):
+            return HexStr(obj.hex())
+        elif isinstance(obj, bytes):
+            return to_hex(obj)
+        return json.JSONEncoder.default(self, obj)
 
 
 def to_json(obj: Dict[Any, Any]) ->str:
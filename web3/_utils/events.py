@@ -1,24 +1,34 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
 import itertools
-from typing import TYPE_CHECKING, Any, Collection, Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union, cast
+import warnings
 from eth_abi import grammar
 from eth_abi.codec import ABICodec
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.exceptions import InsufficientDataBytes, NonEmptyPaddingBytes
 from eth_typing import ChecksumAddress, HexStr, Primitives, TypeStr
 from eth_utils import encode_hex, event_abi_to_log_topic, is_list_like, keccak, to_bytes, to_dict, to_hex, to_tuple
 from eth_utils.curried import apply_formatter_if
 from eth_utils.toolz import complement, compose, cons, curry, valfilter
 import web3
-from web3._utils.abi import exclude_indexed_event_inputs, get_indexed_event_inputs, get_normalized_abi_arg_type, map_abi_data, named_tree, normalize_event_input_types
+from web3._utils.abi import exclude_indexed_event_inputs, get_indexed_event_inputs, get_normalized_abi_arg_type, named_tree, normalize_event_input_types
 from web3._utils.encoding import encode_single_packed, hexstr_if_str
-from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
-from web3.datastructures import AttributeDict
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS, compose_normalizers, get_flat_types, normalize_data
+from web3.datastructures import AttributeDict, MutableAttributeDict
 from web3.exceptions import InvalidEventABI, LogTopicError, MismatchedABI
 from web3.types import ABIEvent, ABIEventParams, BlockIdentifier, EventData, FilterParams, LogReceipt
 from web3.utils import get_abi_input_names
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
     from web3._utils.filters import AsyncLogFilter, LogFilter
+MAX_EVENT_DECODERS = 1024
+# the types of the log fields ``EventDecoder.decode_columns`` returns columns of
+LOG_COLUMN_TYPES: Dict[str, TypeStr] = {'address': 'address', 'blockHash':
+    'bytes32', 'blockNumber': 'uint256', 'logIndex': 'uint256',
+    'transactionHash': 'bytes32', 'transactionIndex': 'uint256'}
 
 
 @to_tuple
@@ -36,6 +46,296 @@ def get_event_abi_types_for_decoding(event_inputs: Sequence[ABIEventParams]
             yield input['type']
 
 
+def _log_entry_data_to_bytes(log_entry_data: Union[Primitives, HexStr, str]
+    ) ->bytes:
+    if isinstance(log_entry_data, bytes):
+        # formatted logs hold ``HexBytes``, which need no conversion
+        return log_entry_data
+    return hexstr_if_str(to_bytes, log_entry_data)
+
+
+class EventDecoder:
+    """
+    Everything needed to decode the logs of the event described by
+    ``event_abi`` with ``abi_codec`` that does not depend on the log: the event
+    topic, the types and names of the topics and data, the eth-abi decoders for
+    them and the composed return normalizers. Get decoders with
+    ``get_event_decoder``, which caches them.
+    """
+
+    def __init__(self, abi_codec: ABICodec, event_abi: ABIEvent) ->None:
+        self.abi_codec = abi_codec
+        self.event_abi = event_abi
+        self.event_name = event_abi['name']
+        self.anonymous = event_abi['anonymous']
+        self.topic: Optional[bytes] = (None if self.anonymous else
+            event_abi_to_log_topic(dict(event_abi)))
+        topics_abi = get_indexed_event_inputs(event_abi)
+        self.topic_types = get_event_abi_types_for_decoding(
+            normalize_event_input_types(topics_abi))
+        self.topic_names = get_abi_input_names(ABIEvent({'inputs':
+            topics_abi}))
+        data_abi = exclude_indexed_event_inputs(event_abi)
+        self.data_inputs = normalize_event_input_types(data_abi)
+        self.data_types = get_event_abi_types_for_decoding(self.data_inputs)
+        self.data_names = get_abi_input_names(ABIEvent({'inputs': data_abi}))
+        # sanity check that there are not name intersections between the topic
+        # names and the data argument names.
+        self.duplicate_names = set(self.topic_names).intersection(self.
+            data_names)
+        self._stream_class = abi_codec.stream_class
+        self._topic_decoders = tuple(_get_tuple_decoder(abi_codec, [
+            topic_type]) for topic_type in self.topic_types)
+        self._data_decoder = _get_tuple_decoder(abi_codec, self.data_types)
+        self._normalizer = compose_normalizers(BASE_RETURN_NORMALIZERS)
+        self._flat_topic_types = get_flat_types(self.topic_types)
+        self._flat_data_types = get_flat_types(self.data_types)
+        self.column_types = dict(itertools.chain(zip(self.topic_names, self
+            .topic_types), zip(self.data_names, self.data_types),
+            LOG_COLUMN_TYPES.items()))
+        self._topic_word_decoders = tuple(_get_word_decoder(topic_type) or
+            _decode_with(topic_decoder, self._stream_class) for topic_type,
+            topic_decoder in zip(self.topic_types, self._topic_decoders))
+        data_word_decoders = tuple(_get_word_decoder(data_type) for
+            data_type in self.data_types)
+        self._data_word_decoders = data_word_decoders if all(
+            data_word_decoders) else None
+
+    def _get_log_topics(self, log_entry: LogReceipt) ->Sequence[Any]:
+        """
+        Check that ``log_entry`` is a log of the event and return the topics of
+        its indexed arguments.
+        """
+        if self.anonymous:
+            log_topics = log_entry['topics']
+        elif not log_entry['topics']:
+            raise MismatchedABI(
+                'Expected non-anonymous event to have 1 or more topics')
+        elif self.topic != _log_entry_data_to_bytes(log_entry['topics'][0]):
+            raise MismatchedABI(
+                'The event signature did not match the provided ABI')
+        else:
+            log_topics = log_entry['topics'][1:]
+        if len(log_topics) != len(self.topic_types):
+            raise LogTopicError(
+                f'Expected {len(self.topic_types)} log topics.  Got {len(log_topics)}'
+                )
+        if self.duplicate_names:
+            raise InvalidEventABI(
+                f"The following argument names are duplicated between event inputs: '{', '.join(self.duplicate_names)}'"
+                )
+        return log_topics
+
+    def decode_args(self, log_entry: LogReceipt) ->Dict[str, Any]:
+        """
+        Check that ``log_entry`` is a log of the event and decode the event
+        arguments from its topics and data.
+        """
+        log_topics = self._get_log_topics(log_entry)
+        stream_class = self._stream_class
+        decoded_log_data = self._data_decoder(stream_class(
+            _log_entry_data_to_bytes(log_entry['data'])))
+        normalized_log_data = normalize_data(self._normalizer, self.
+            data_types, self._flat_data_types, decoded_log_data)
+        if self._flat_data_types is None:
+            named_log_data = named_tree(self.data_inputs, normalized_log_data)
+        else:
+            named_log_data = dict(zip(self.data_names, normalized_log_data))
+        decoded_topic_data = [topic_decoder(stream_class(
+            _log_entry_data_to_bytes(topic)))[0] for topic_decoder, topic in
+            zip(self._topic_decoders, log_topics)]
+        normalized_topic_data = normalize_data(self._normalizer, self.
+            topic_types, self._flat_topic_types, decoded_topic_data)
+        return dict(itertools.chain(zip(self.topic_names,
+            normalized_topic_data), named_log_data.items()))
+
+    def decode(self, log_entry: LogReceipt) ->EventData:
+        """
+        Decode ``log_entry``, like ``get_event_data``.
+        """
+        return self.to_event_data(self.decode_args(log_entry), log_entry)
+
+    def to_event_data(self, args: Dict[str, Any], log_entry: LogReceipt
+        ) ->EventData:
+        """
+        Return the event data of ``log_entry``, whose arguments are ``args``.
+        """
+        event_data = EventData(args=args, event=self.event_name, logIndex=
+            log_entry['logIndex'], transactionIndex=log_entry[
+            'transactionIndex'], transactionHash=log_entry['transactionHash'],
+            address=log_entry['address'], blockHash=log_entry['blockHash'],
+            blockNumber=log_entry['blockNumber'])
+        return cast(EventData, AttributeDict.recursive(event_data))
+
+    def decode_columns(self, log_entries: Iterable[LogReceipt]) ->Dict[str,
+        List[Any]]:
+        """
+        Decode ``log_entries``, which must all be logs of the event, into one
+        list per event argument and per log field of ``LOG_COLUMN_TYPES``, keyed
+        by name. The values aren't normalized: addresses and hashes are
+        ``bytes``, and other values are as eth-abi decodes them. Arguments of
+        static elementary types are read straight from the 32-byte words of the
+        log, which is much faster than decoding them with eth-abi.
+        """
+        if self.duplicate_names:
+            raise InvalidEventABI(
+                f"The following argument names are duplicated between event inputs: '{', '.join(self.duplicate_names)}'"
+                )
+        log_field_names = set(LOG_COLUMN_TYPES).intersection(itertools.
+            chain(self.topic_names, self.data_names))
+        if log_field_names:
+            raise InvalidEventABI(
+                f"The following argument names are also names of log fields: '{', '.join(sorted(log_field_names))}'"
+                )
+        topic_columns: List[List[Any]] = [[] for _ in self.topic_names]
+        data_columns: List[List[Any]] = [[] for _ in self.data_names]
+        log_columns: List[List[Any]] = [[] for _ in LOG_COLUMN_TYPES]
+        data_size = 32 * len(self.data_types)
+        for log_entry in log_entries:
+            for column, decode_word, topic in zip(topic_columns, self.
+                _topic_word_decoders, self._get_log_topics(log_entry)):
+                word = _log_entry_data_to_bytes(topic)
+                if len(word) != 32:
+                    raise InsufficientDataBytes(
+                        f'Expected a 32-byte log topic, got {len(word)} bytes')
+                column.append(decode_word(word))
+            data = _log_entry_data_to_bytes(log_entry['data'])
+            if self._data_word_decoders is None:
+                decoded_log_data = self._data_decoder(self._stream_class(data))
+                for column, data_type, value in zip(data_columns, self.
+                    data_types, decoded_log_data):
+                    if data_type == 'address':
+                        value = bytes.fromhex(value[2:])
+                    column.append(value)
+            elif len(data) < data_size:
+                raise InsufficientDataBytes(
+                    f'Tried to read {data_size} bytes, only got {len(data)} bytes.'
+                    )
+            else:
+                for offset, (column, decode_word) in enumerate(zip(
+                    data_columns, self._data_word_decoders)):
+                    column.append(decode_word(data[32 * offset:32 * offset +
+                        32]))
+            for column, (field, field_type) in zip(log_columns,
+                LOG_COLUMN_TYPES.items()):
+                value = log_entry[field]  # type: ignore
+                if field_type != 'uint256':
+                    value = _log_entry_data_to_bytes(value)
+                column.append(value)
+        return dict(zip(itertools.chain(self.topic_names, self.data_names,
+            LOG_COLUMN_TYPES), itertools.chain(topic_columns, data_columns,
+            log_columns)))
+
+
+def _get_word_decoder(type_str: TypeStr) ->Optional[Callable[[bytes], Any]]:
+    """
+    Return a decoder of values of ``type_str`` from their 32-byte ABI words, if
+    it is a static elementary type, which checks the padding like eth-abi does.
+    Addresses are decoded to their 20 bytes.
+    """
+    abi_type = grammar.parse(type_str)
+    if not isinstance(abi_type, grammar.BasicType) or abi_type.is_array:
+        return None
+    elif abi_type.base == 'address':
+        return _decode_address_word
+    elif abi_type.base == 'bool':
+        return _decode_bool_word
+    elif abi_type.sub is None:
+        return None
+    elif abi_type.base == 'uint':
+        return _get_int_word_decoder(abi_type.sub, signed=False)
+    elif abi_type.base == 'int':
+        return _get_int_word_decoder(abi_type.sub, signed=True)
+    elif abi_type.base == 'bytes':
+        return _get_bytes_word_decoder(abi_type.sub)
+    return None
+
+
+def _decode_address_word(word: bytes) ->bytes:
+    if any(word[:12]):
+        raise NonEmptyPaddingBytes(
+            f'Padding bytes were not empty: {word[:12]!r}')
+    return word[12:]
+
+
+def _decode_bool_word(word: bytes) ->bool:
+    value = int.from_bytes(word, 'big')
+    if value > 1:
+        raise NonEmptyPaddingBytes('Boolean must be either 0x0 or 0x1')
+    return bool(value)
+
+
+def _get_int_word_decoder(bits: int, signed: bool) ->Callable[[bytes], int]:
+    if signed:
+        lower_bound, upper_bound = -2 ** (bits - 1), 2 ** (bits - 1)
+    else:
+        lower_bound, upper_bound = 0, 2 ** bits
+
+    def decode_int_word(word: bytes) ->int:
+        value = int.from_bytes(word, 'big', signed=signed)
+        if not lower_bound <= value < upper_bound:
+            raise NonEmptyPaddingBytes(
+                f'Padding bytes were not empty: {word[:32 - bits // 8]!r}')
+        return value
+    return decode_int_word
+
+
+def _get_bytes_word_decoder(size: int) ->Callable[[bytes], bytes]:
+
+    def decode_bytes_word(word: bytes) ->bytes:
+        if any(word[size:]):
+            raise NonEmptyPaddingBytes(
+                f'Padding bytes were not empty: {word[size:]!r}')
+        return word[:size]
+    return decode_bytes_word
+
+
+def _decode_with(decoder: TupleDecoder, stream_class: Type[
+    ContextFramesBytesIO]) ->Callable[[bytes], Any]:
+
+    def decode_word(word: bytes) ->Any:
+        return decoder(stream_class(word))[0]
+    return decode_word
+
+
+def _get_tuple_decoder(abi_codec: ABICodec, types: Sequence[TypeStr]
+    ) ->TupleDecoder:
+    """
+    The decoder ``abi_codec.decode(types, data)`` builds on every call.
+    """
+    return TupleDecoder(decoders=tuple(abi_codec._registry.get_decoder(
+        type_str) for type_str in types))
+
+
+_event_decoders: 'OrderedDict[Tuple[int, int], EventDecoder]' = OrderedDict()
+_event_decoders_lock = threading.Lock()
+
+
+def get_event_decoder(abi_codec: ABICodec, event_abi: ABIEvent
+    ) ->EventDecoder:
+    """
+    Return the cached ``EventDecoder`` for ``abi_codec`` and ``event_abi``,
+    building it on first use. Decoders are cached by the identity of the codec
+    and of ``event_abi``, which is the same dict for every log decoded by an
+    event of a contract, and the ``MAX_EVENT_DECODERS`` most recently used ones
+    are kept.
+    """
+    # a cached decoder keeps its codec and ``event_abi`` alive, so the ids can't
+    # be reused by other objects while the decoder is cached
+    key = id(abi_codec), id(event_abi)
+    with _event_decoders_lock:
+        decoder = _event_decoders.get(key)
+        if decoder is not None:
+            _event_decoders.move_to_end(key)
+            return decoder
+    decoder = EventDecoder(abi_codec, event_abi)
+    with _event_decoders_lock:
+        _event_decoders[key] = decoder
+        while len(_event_decoders) > MAX_EVENT_DECODERS:
+            _event_decoders.popitem(last=False)
+    return decoder
+
+
 @curry
 def get_event_data(abi_codec: ABICodec, event_abi: ABIEvent, log_entry:
     LogReceipt) ->EventData:
@@ -43,47 +343,42 @@ def get_event_data(abi_codec: ABICodec, event_abi: ABIEvent, log_entry:
     Given an event ABI and a log entry for that event, return the decoded
     event data
     """
-    log_topics = log_entry['topics']
-    log_data = log_entry['data']
-    
-    # Validate that the first topic is the event signature
-    if event_abi_to_log_topic(event_abi) != log_topics[0]:
-        raise MismatchedABI("Event signature mismatch")
-    
-    indexed_inputs = get_indexed_event_inputs(event_abi)
-    non_indexed_inputs = exclude_indexed_event_inputs(event_abi)
-    
-    # Decode indexed inputs
-    decoded_indexed_data = abi_codec.decode(
-        [input['type'] for input in indexed_inputs],
-        b''.join(log_topics[1:])
-    )
-    
-    # Decode non-indexed inputs
-    decoded_non_indexed_data = abi_codec.decode(
-        [input['type'] for input in non_indexed_inputs],
-        log_data
-    )
-    
-    # Combine decoded data
-    decoded_data = list(decoded_indexed_data) + list(decoded_non_indexed_data)
-    
-    # Create a dictionary of decoded data
-    event_data = {
-        'args': AttributeDict(dict(zip(
-            [input['name'] for input in event_abi['inputs']],
-            decoded_data
-        ))),
-        'event': event_abi['name'],
-        'logIndex': log_entry['logIndex'],
-        'transactionIndex': log_entry['transactionIndex'],
-        'transactionHash': log_entry['transactionHash'],
-        'address': log_entry['address'],
-        'blockHash': log_entry['blockHash'],
-        'blockNumber': log_entry['blockNumber'],
-    }
-    
-    return AttributeDict(event_data)
+    return get_event_decoder(abi_codec, event_abi).decode(log_entry)
+
+
+@to_tuple
+def process_logs(logs: Iterable[LogReceipt], decode_log: Callable[[
+    LogReceipt], EventData], errors: 'EventLogErrorFlags') ->Iterable[EventData
+    ]:
+    """
+    Decode ``logs`` with ``decode_log``. Logs that can't be decoded are
+    discarded, returned with the error, raised or discarded with a warning,
+    as ``errors`` says.
+    """
+    try:
+        errors.name
+    except AttributeError:
+        raise AttributeError(
+            f'Error flag must be one of: {EventLogErrorFlags.flag_options()}')
+    for log in logs:
+        try:
+            rich_log = decode_log(log)
+        except (MismatchedABI, LogTopicError, InvalidEventABI, TypeError) as e:
+            if errors == EventLogErrorFlags.Discard:
+                continue
+            elif errors == EventLogErrorFlags.Ignore:
+                # type ignores b/c rich_log is typed as EventData
+                new_log = MutableAttributeDict(log)  # type: ignore
+                new_log['errors'] = e
+                rich_log = AttributeDict(new_log)  # type: ignore
+            elif errors == EventLogErrorFlags.Strict:
+                raise e
+            else:
+                warnings.warn(
+                    f"The log with transaction hash: {log['transactionHash']!r} and logIndex: {log['logIndex']} encountered the following error during processing: {type(e).__name__}({e}). It has been discarded."
+                    )
+                continue
+        yield rich_log
 
 
 normalize_topic_list = compose(remove_trailing_from_seq(remove_value=None),
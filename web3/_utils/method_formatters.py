@@ -1,10 +1,11 @@
 import codecs
+import functools
 import operator
 from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterable, NoReturn, Tuple, Union, cast
-from eth_typing import HexStr
+from eth_typing import ChecksumAddress, HexStr
 from eth_utils import is_hexstr
 from eth_utils.curried import apply_formatter_at_index, apply_formatter_if, apply_formatter_to_array, apply_formatters_to_dict, apply_formatters_to_sequence, apply_one_of_formatters, is_0x_prefixed, is_address, is_bytes, is_integer, is_null, is_string, remove_0x_prefix, text_if_str, to_checksum_address, to_list, to_tuple
-from eth_utils.toolz import complement, compose, curried, curry, partial
+from eth_utils.toolz import complement, compose, curried, curry, identity, partial
 from hexbytes import HexBytes
 from web3._utils.abi import is_length
 from web3._utils.encoding import hexstr_if_str, to_hex
@@ -12,10 +13,11 @@ from web3._utils.error_formatters_utils import raise_contract_logic_error_on_rev
 from web3._utils.filters import AsyncBlockFilter, AsyncLogFilter, AsyncTransactionFilter, BlockFilter, LogFilter, TransactionFilter
 from web3._utils.formatters import hex_to_integer, integer_to_hex, is_array_of_dicts, is_array_of_strings, remove_key_if
 from web3._utils.normalizers import abi_address_to_hex, abi_bytes_to_hex, abi_int_to_hex, abi_string_to_hex
+from web3._utils.result_mode import is_raw_request
 from web3._utils.rpc_abi import RPC, RPC_ABIS, abi_request_formatters
 from web3._utils.type_conversion import to_hex_if_bytes
 from web3._utils.utility_methods import either_set_is_a_subset
-from web3.datastructures import AttributeDict, ReadableAttributeDict
+from web3.datastructures import AttributeDict, CompactAttributeDict, LazyAttributeDict, ReadableAttributeDict
 from web3.exceptions import BlockNotFound, TransactionNotFound
 from web3.types import BlockIdentifier, CallOverrideParams, Formatters, RPCEndpoint, TReturn, TxParams, _Hash32
 if TYPE_CHECKING:
@@ -59,6 +61,236 @@ def type_aware_apply_formatters_to_dict_keys_and_values(key_formatters:
     return formatted_dict
 
 
+# --- formatter compilation --- #
+#
+# The result formatters below are declared as maps of curried combinators, which
+# keeps them readable but costs several generic calls per field. `compile_formatter`
+# walks such a declaration once and returns an equivalent flat function: the
+# combinators are inlined, the common leaf formatters are replaced by specialized
+# versions and anything it doesn't recognize is called exactly as declared, so the
+# output (and any error raised) is always the same as the declarative formatter.
+# Compiled with ``lazy=True``, dict formatters instead return a ``LazyAttributeDict``
+# which formats each field on first access.
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_to_checksum_address(value: str) -> ChecksumAddress:
+    return to_checksum_address(value)
+
+
+def _compiled_to_checksum_address(value: Any) -> ChecksumAddress:
+    if type(value) is str:
+        return _cached_to_checksum_address(value)
+    return to_checksum_address(value)
+
+
+def _compiled_to_integer_if_hex(value: Any) -> Any:
+    if isinstance(value, (str, bytes, bytearray)):
+        return int(value, 16)
+    return value
+
+
+def _hexbytes_from_hexstr(value: str) -> HexBytes:
+    # ``bytes.fromhex`` skips whitespace, so only trust it when every character
+    # after the prefix was consumed as a hex digit
+    if value.startswith("0x"):
+        try:
+            raw = bytes.fromhex(value[2:])
+        except ValueError:
+            pass
+        else:
+            if 2 * len(raw) + 2 == len(value):
+                return bytes.__new__(HexBytes, raw)
+    return HexBytes(value)
+
+
+def _compiled_hexbytes(value: Any) -> HexBytes:
+    if type(value) is str:
+        return _hexbytes_from_hexstr(value)
+    return HexBytes(value)
+
+
+def _compile_to_hexbytes(
+    num_bytes: int, variable_length: bool = False
+) -> Callable[[Any], HexBytes]:
+    fallback = to_hexbytes(num_bytes, variable_length=variable_length)
+
+    def compiled_to_hexbytes(value: Any) -> HexBytes:
+        if type(value) is str:
+            result = _hexbytes_from_hexstr(value)
+            if len(result) == num_bytes or (
+                variable_length and len(result) < num_bytes
+            ):
+                return result
+        return fallback(value)
+
+    return compiled_to_hexbytes
+
+
+_SPECIALIZED_FORMATTERS = (
+    _compiled_to_checksum_address,
+    _compiled_to_integer_if_hex,
+    _compiled_hexbytes,
+)
+
+
+def _compile_formatter_if(
+    condition: Callable[..., bool], formatter: Callable[..., Any], lazy: bool
+) -> Callable[..., Any]:
+    formatter = compile_formatter(formatter, lazy=lazy)
+    if condition is is_not_null:
+
+        def compiled_formatter_if_not_null(value: Any) -> Any:
+            if value is None:
+                return value
+            return formatter(value)
+
+        return compiled_formatter_if_not_null
+
+    def compiled_formatter_if(value: Any) -> Any:
+        if condition(value):
+            return formatter(value)
+        return value
+
+    return compiled_formatter_if
+
+
+def _compile_formatter_to_array(
+    formatter: Callable[..., Any], lazy: bool, as_list: bool = False
+) -> Callable[..., Any]:
+    formatter = compile_formatter(formatter, lazy=lazy)
+
+    def compiled_formatter_to_array(value: Any) -> Any:
+        if type(value) is list:
+            return [formatter(item) for item in value]
+        result = type(value)(formatter(item) for item in value)
+        return list(result) if as_list else result
+
+    return compiled_formatter_to_array
+
+
+def _compile_one_of_formatters(
+    formatter_condition_pairs: Tuple[Tuple[Callable[..., Any], Callable[..., Any]]],
+    lazy: bool,
+) -> Callable[..., Any]:
+    compiled_pairs = tuple(
+        (condition, compile_formatter(formatter, lazy=lazy))
+        for condition, formatter in formatter_condition_pairs
+    )
+
+    def compiled_one_of_formatters(value: Any) -> Any:
+        for condition, formatter in compiled_pairs:
+            if condition(value):
+                return formatter(value)
+        raise ValueError(
+            "The provided value did not satisfy any of the formatter conditions"
+        )
+
+    return compiled_one_of_formatters
+
+
+def _compile_formatters_to_dict(
+    formatters: Formatters, type_aware: bool, lazy: bool
+) -> Callable[..., Any]:
+    compiled_formatters = {
+        key: compile_formatter(formatter, lazy=lazy)
+        for key, formatter in formatters.items()
+    }
+    if lazy and type_aware:
+
+        def lazy_formatters_to_dict(value: Any) -> LazyAttributeDict[Any, Any]:
+            return LazyAttributeDict(value, compiled_formatters)
+
+        return lazy_formatters_to_dict
+
+    def compiled_formatters_to_dict(value: Any) -> Any:
+        formatted = {}
+        for key, item in value.items():
+            formatter = compiled_formatters.get(key)
+            if formatter is None:
+                formatted[key] = item
+                continue
+            try:
+                formatted[key] = formatter(item)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Could not format invalid value {item!r} as field {key!r}"
+                ) from exc
+            except TypeError as exc:
+                raise TypeError(
+                    f"Could not format invalid type {item!r} as field {key!r}"
+                ) from exc
+        if type_aware and isinstance(value, CompactAttributeDict):
+            return CompactAttributeDict.recursive(formatted)
+        elif type_aware and isinstance(value, AttributeDict):
+            return AttributeDict.recursive(formatted)
+        return formatted
+
+    return compiled_formatters_to_dict
+
+
+def _is_list_of_array_formatter(formatter: Any) -> bool:
+    # ``apply_list_to_array_formatter`` wraps ``apply_formatter_to_array`` with
+    # eth-utils' ``to_list``, which keeps the wrapped formatter on ``__wrapped__``
+    wrapped = getattr(formatter, "__wrapped__", None)
+    return (
+        isinstance(wrapped, curry)
+        and wrapped.func is apply_formatter_to_array.func
+        and len(wrapped.args) == 1
+        and getattr(formatter, "__closure__", None) is not None
+        and any(cell.cell_contents is list for cell in formatter.__closure__)
+    )
+
+
+def compile_formatter(
+    formatter: Callable[..., Any], lazy: bool = False
+) -> Callable[..., Any]:
+    """
+    Compile a declarative result formatter into an equivalent flat function.
+    """
+    # compiled formatters keep their declaration so that they can be compiled
+    # again, e.g. lazily, when nested in another declaration
+    formatter = getattr(formatter, "_declaration", formatter)
+    compiled = _compile_declaration(formatter, lazy)
+    if compiled is not formatter and compiled not in _SPECIALIZED_FORMATTERS:
+        compiled._declaration = formatter  # type: ignore[attr-defined]
+    return compiled
+
+
+def _compile_declaration(
+    formatter: Callable[..., Any], lazy: bool
+) -> Callable[..., Any]:
+    if formatter is to_integer_if_hex:
+        return _compiled_to_integer_if_hex
+    elif formatter is HexBytes:
+        return _compiled_hexbytes
+    elif formatter is to_checksum_address:
+        return _compiled_to_checksum_address
+    elif _is_list_of_array_formatter(formatter):
+        return _compile_formatter_to_array(
+            formatter.__wrapped__.args[0], lazy, as_list=True
+        )
+    elif not isinstance(formatter, curry):
+        return formatter
+
+    func, args, kwargs = formatter.func, formatter.args, formatter.keywords or {}
+    if func is to_hexbytes.func and len(args) == 1:
+        return _compile_to_hexbytes(args[0], **kwargs)
+    elif kwargs:
+        return formatter
+    elif func is apply_formatter_if.func and len(args) == 2:
+        return _compile_formatter_if(*args, lazy)
+    elif func is apply_formatter_to_array.func and len(args) == 1:
+        return _compile_formatter_to_array(args[0], lazy)
+    elif func is apply_one_of_formatters.func and len(args) == 1:
+        return _compile_one_of_formatters(args[0], lazy)
+    elif func is type_aware_apply_formatters_to_dict.func and len(args) == 1:
+        return _compile_formatters_to_dict(args[0], type_aware=True, lazy=lazy)
+    elif func is apply_formatters_to_dict.func and len(args) == 1:
+        return _compile_formatters_to_dict(args[0], type_aware=False, lazy=lazy)
+    return formatter
+
+
 ACCESS_LIST_FORMATTER = type_aware_apply_formatters_to_dict({'address':
     to_checksum_address, 'storageKeys': apply_list_to_array_formatter(
     to_hexbytes(64))})
@@ -86,13 +318,15 @@ TRANSACTION_RESULT_FORMATTERS = {'blockHash': apply_formatter_if(
     'data': HexBytes, 'maxFeePerBlobGas': to_integer_if_hex,
     'blobVersionedHashes': apply_formatter_if(is_not_null,
     apply_formatter_to_array(to_hexbytes(32)))}
-transaction_result_formatter = type_aware_apply_formatters_to_dict(
-    TRANSACTION_RESULT_FORMATTERS)
+transaction_result_formatter = compile_formatter(
+    type_aware_apply_formatters_to_dict(TRANSACTION_RESULT_FORMATTERS)
+)
 WITHDRAWAL_RESULT_FORMATTERS = {'index': to_integer_if_hex,
     'validatorIndex': to_integer_if_hex, 'address': to_checksum_address,
     'amount': to_integer_if_hex}
-withdrawal_result_formatter = type_aware_apply_formatters_to_dict(
-    WITHDRAWAL_RESULT_FORMATTERS)
+withdrawal_result_formatter = compile_formatter(
+    type_aware_apply_formatters_to_dict(WITHDRAWAL_RESULT_FORMATTERS)
+)
 LOG_ENTRY_FORMATTERS = {'blockHash': apply_formatter_if(is_not_null,
     to_hexbytes(32)), 'blockNumber': apply_formatter_if(is_not_null,
     to_integer_if_hex), 'transactionIndex': apply_formatter_if(is_not_null,
@@ -100,7 +334,9 @@ LOG_ENTRY_FORMATTERS = {'blockHash': apply_formatter_if(is_not_null,
     to_hexbytes(32)), 'logIndex': to_integer_if_hex, 'address':
     to_checksum_address, 'topics': apply_list_to_array_formatter(
     to_hexbytes(32)), 'data': HexBytes}
-log_entry_formatter = type_aware_apply_formatters_to_dict(LOG_ENTRY_FORMATTERS)
+log_entry_formatter = compile_formatter(
+    type_aware_apply_formatters_to_dict(LOG_ENTRY_FORMATTERS)
+)
 RECEIPT_FORMATTERS = {'blockHash': apply_formatter_if(is_not_null,
     to_hexbytes(32)), 'blockNumber': apply_formatter_if(is_not_null,
     to_integer_if_hex), 'transactionIndex': apply_formatter_if(is_not_null,
@@ -114,7 +350,9 @@ RECEIPT_FORMATTERS = {'blockHash': apply_formatter_if(is_not_null,
     to_checksum_address), 'effectiveGasPrice': to_integer_if_hex, 'type':
     to_integer_if_hex, 'blobGasPrice': to_integer_if_hex, 'blobGasUsed':
     to_integer_if_hex}
-receipt_formatter = type_aware_apply_formatters_to_dict(RECEIPT_FORMATTERS)
+receipt_formatter = compile_formatter(
+    type_aware_apply_formatters_to_dict(RECEIPT_FORMATTERS)
+)
 BLOCK_FORMATTERS = {'baseFeePerGas': to_integer_if_hex, 'extraData':
     apply_formatter_if(is_not_null, to_hexbytes(32, variable_length=True)),
     'gasLimit': to_integer_if_hex, 'gasUsed': to_integer_if_hex, 'size':
@@ -140,7 +378,9 @@ BLOCK_FORMATTERS = {'baseFeePerGas': to_integer_if_hex, 'extraData':
     'withdrawalsRoot': apply_formatter_if(is_not_null, to_hexbytes(32)),
     'blobGasUsed': to_integer_if_hex, 'excessBlobGas': to_integer_if_hex,
     'parentBeaconBlockRoot': apply_formatter_if(is_not_null, to_hexbytes(32))}
-block_formatter = type_aware_apply_formatters_to_dict(BLOCK_FORMATTERS)
+block_formatter = compile_formatter(
+    type_aware_apply_formatters_to_dict(BLOCK_FORMATTERS)
+)
 SYNCING_FORMATTERS = {'startingBlock': to_integer_if_hex, 'currentBlock':
     to_integer_if_hex, 'highestBlock': to_integer_if_hex, 'knownStates':
     to_integer_if_hex, 'pulledStates': to_integer_if_hex}
@@ -341,6 +581,17 @@ PYTHONIC_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {RPC.
     apply_formatter_to_array(common_tracing_result_formatter), RPC.
     trace_filter: trace_list_result_formatter, RPC.eth_subscribe:
     apply_formatter_if(is_not_null, subscription_formatter)}
+LAZY_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
+    method: compile_formatter(PYTHONIC_RESULT_FORMATTERS[method], lazy=True)
+    for method in (
+        RPC.eth_getBlockByHash,
+        RPC.eth_getBlockByNumber,
+        RPC.eth_getTransactionByHash,
+        RPC.eth_getTransactionByBlockHashAndIndex,
+        RPC.eth_getTransactionByBlockNumberAndIndex,
+        RPC.eth_getTransactionReceipt,
+    )
+}
 METHOD_NORMALIZERS: Dict[RPCEndpoint, Callable[..., Any]] = {RPC.
     eth_getLogs: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0), RPC
     .eth_newFilter: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0)}
@@ -375,3 +626,20 @@ NULL_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {RPC.
 FILTER_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {RPC.
     eth_newPendingTransactionFilter: filter_wrapper, RPC.eth_newBlockFilter:
     filter_wrapper, RPC.eth_newFilter: filter_wrapper}
+
+
+def get_module_result_formatters(
+    method_name: Union[RPCEndpoint, Callable[..., RPCEndpoint]],
+    module: "Module",
+) -> Callable[..., Any]:
+    """
+    Return the result formatters for ``method_name``, honouring the result mode
+    of the calling ``module``.
+    """
+    if is_raw_request():
+        return identity
+    if getattr(module, "lazy_results", False):
+        lazy_formatter = LAZY_RESULT_FORMATTERS.get(method_name)
+        if lazy_formatter is not None:
+            return lazy_formatter
+    return get_result_formatters(method_name, module)
@@ -1,22 +1,26 @@
 import codecs
 import functools
 import json
-from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union, cast
 from eth_abi.exceptions import ParseError
-from eth_abi.grammar import BasicType, parse
+from eth_abi.grammar import BasicType, TupleType, parse
 from eth_typing import ChecksumAddress, HexStr, TypeStr
 from eth_utils import to_bytes, to_checksum_address, to_hex, to_text
 from eth_utils.address import is_binary_address
 from eth_utils.toolz import curry
 from hexbytes import HexBytes
 from ens import ENS, AsyncENS
+from web3._utils.abi import abi_data_tree, data_tree_map, strip_abi_type
+from web3._utils.abi_cache import get_validated_abi
 from web3._utils.encoding import hexstr_if_str, text_if_str
 from web3._utils.ens import StaticENS, async_validate_name_has_address, is_ens_name, validate_name_has_address
-from web3._utils.validation import validate_abi, validate_address
+from web3._utils.formatters import recursive_map
+from web3._utils.validation import validate_address
 from web3.exceptions import InvalidAddress, NameNotFound
 from web3.types import ABI
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
+Normalizer = Callable[[TypeStr, Any], Tuple[TypeStr, Any]]
 
 
 def parse_basic_type_str(old_normalizer: Callable[[BasicType, TypeStr, Any],
@@ -39,3 +43,71 @@ def parse_basic_type_str(old_normalizer: Callable[[BasicType, TypeStr, Any],
 
 
 BASE_RETURN_NORMALIZERS = [addresses_checksummed]
+
+
+def compose_normalizers(normalizers: Sequence[Normalizer]) ->Normalizer:
+    """
+    Compose normalizers into one, so they can be applied in a single pass over
+    the data. Like ``map_abi_data``, a normalizer that returns ``None`` as the
+    type stops the remaining normalizers from being applied.
+    """
+    normalizers = tuple(normalizers)
+    if len(normalizers) == 1:
+        return normalizers[0]
+
+    def normalize(abi_type: TypeStr, data: Any) ->Tuple[TypeStr, Any]:
+        for normalizer in normalizers:
+            abi_type, data = normalizer(abi_type, data)
+            if abi_type is None:
+                break
+        return abi_type, data
+    return normalize
+
+
+def normalize_abi_data(normalizer: Normalizer, types: Sequence[TypeStr],
+    data: Sequence[Any]) ->Any:
+    """
+    ``map_abi_data`` for a single, possibly composed, normalizer.
+    """
+    return recursive_map(strip_abi_type, data_tree_map(normalizer,
+        abi_data_tree(types, data)))
+
+
+def get_flat_types(types: Sequence[TypeStr]) ->Optional[List[TypeStr]]:
+    """
+    Return ``types`` as ``abi_data_tree`` annotates data with them, if none is an
+    array or a tuple, and ``None`` otherwise. Data of flat types can be
+    normalized without building a data tree.
+    """
+    flat_types = []
+    for type_str in types:
+        abi_type = parse(type_str)
+        if abi_type.is_array or isinstance(abi_type, TupleType):
+            return None
+        flat_types.append(abi_type.to_type_str())
+    return flat_types
+
+
+def normalize_data(normalizer: Normalizer, types: Sequence[TypeStr],
+    flat_types: Optional[Sequence[TypeStr]], data: Sequence[Any]) ->List[Any]:
+    """
+    Apply ``normalizer`` to ``data`` of ``types``, without building a data tree
+    if ``flat_types``, from ``get_flat_types``, is not ``None``.
+    """
+    if flat_types is None:
+        return normalize_abi_data(normalizer, types, data)
+    return [normalizer(abi_type, value)[1] for abi_type, value in zip(
+        flat_types, data)]
+
+
+def normalize_abi(abi: Union[ABI, str]) ->ABI:
+    if isinstance(abi, str):
+        abi = json.loads(abi)
+    return get_validated_abi(cast(ABI, abi))
+
+
+def normalize_contract_address(w3: 'Web3', address: ChecksumAddress
+    ) ->ChecksumAddress:
+    if address and is_ens_name(address):
+        return normalize_address(cast(ENS, w3.ens), address)
+    return normalize_address_no_ens(address)
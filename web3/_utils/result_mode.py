@@ -0,0 +1,132 @@
+from contextlib import (
+    contextmanager,
+)
+from contextvars import (
+    ContextVar,
+)
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from eth_utils.toolz import (
+    identity,
+)
+
+if TYPE_CHECKING:
+    from web3.module import (  # noqa: F401
+        Module,
+    )
+
+# set within a ``raw_results_mode()`` block, consumed by the next method call
+_raw_results_requested: ContextVar[bool] = ContextVar(
+    "raw_results_requested", default=False
+)
+# ``None`` while no method call is in flight, otherwise whether it is raw
+_raw_request: ContextVar[Optional[bool]] = ContextVar("raw_request", default=None)
+
+
+@contextmanager
+def raw_results_mode() -> Iterator[None]:
+    """
+    Return the raw JSON-RPC result of every method called within the block.
+    """
+    token = _raw_results_requested.set(True)
+    try:
+        yield
+    finally:
+        _raw_results_requested.reset(token)
+
+
+def is_raw_request() -> bool:
+    """
+    Whether the method call in flight should return its raw JSON-RPC result.
+    """
+    return _raw_request.get() is True
+
+
+def _get_result_mode(module: "Module") -> Optional[bool]:
+    # Only the outermost method call can be raw. Requests made by middleware
+    # while serving a raw call, e.g. ``w3.eth.chain_id`` for validation, are
+    # always formatted. ``None`` keeps the mode of the current context.
+    current = _raw_request.get()
+    if current is None:
+        if module.raw_results or _raw_results_requested.get():
+            return True
+        return None
+    return False if current else None
+
+
+async def _await_in_result_mode(
+    raw: bool,
+    caller: Callable[..., Coroutine[Any, Any, Any]],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Any:
+    request_token = _raw_request.set(raw)
+    requested_token = _raw_results_requested.set(False)
+    try:
+        return await caller(*args, **kwargs)
+    finally:
+        _raw_results_requested.reset(requested_token)
+        _raw_request.reset(request_token)
+
+
+def apply_result_mode(module: "Module", caller: Callable[..., Any]) -> Any:
+    """
+    Wrap a method caller so that the middleware and result formatters can tell
+    whether the call should return its raw JSON-RPC result. The caller is
+    returned as is while no raw results mode is in effect.
+    """
+    if _get_result_mode(module) is None:
+        return caller
+
+    if module.is_async:
+
+        @functools.wraps(caller)
+        def async_caller(*args: Any, **kwargs: Any) -> Any:
+            raw = _get_result_mode(module)
+            if raw is None:
+                return caller(*args, **kwargs)
+            return _await_in_result_mode(raw, caller, args, kwargs)
+
+        return async_caller
+
+    @functools.wraps(caller)
+    def blocking_caller(*args: Any, **kwargs: Any) -> Any:
+        raw = _get_result_mode(module)
+        if raw is None:
+            return caller(*args, **kwargs)
+        request_token = _raw_request.set(raw)
+        requested_token = _raw_results_requested.set(False)
+        try:
+            return caller(*args, **kwargs)
+        finally:
+            _raw_results_requested.reset(requested_token)
+            _raw_request.reset(request_token)
+
+    return blocking_caller
+
+
+def skip_if_raw_request(
+    result_formatters: Callable[..., Callable[..., Any]],
+) -> Callable[..., Callable[..., Any]]:
+    """
+    Wrap the explicit ``result_formatters`` of a ``Method`` so that they are
+    skipped for calls that return their raw JSON-RPC result.
+    """
+
+    @functools.wraps(result_formatters)
+    def get_result_formatters(*args: Any) -> Callable[..., Any]:
+        if is_raw_request():
+            return identity
+        return result_formatters(*args)
+
+    return get_result_formatters
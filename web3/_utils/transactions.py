@@ -3,10 +3,12 @@ from typing import TYPE_CHECKING, List, Optional, Union, cast
 from eth_typing import ChecksumAddress
 from eth_utils.toolz import assoc, curry, merge
 from hexbytes import HexBytes
+from web3._utils.chain_constants import cache_block_gas_limit, get_cached_block_gas_limit, get_chain_id, has_cached_block_gas_limit
 from web3._utils.compat import Literal
 from web3._utils.utility_methods import all_in_dict, any_in_dict
 from web3.constants import DYNAMIC_FEE_TXN_PARAMS
 from web3.types import BlockIdentifier, TxData, TxParams, _Hash32
+from web3.utils.head_tracker import get_head_tracker
 TX_PARAM_LITERALS = Literal['type', 'from', 'to', 'gas', 'maxFeePerGas',
     'maxPriorityFeePerGas', 'gasPrice', 'value', 'data', 'nonce', 'chainId',
     'accessList', 'maxFeePerBlobGas', 'blobVersionedHashes']
@@ -19,7 +21,7 @@ TRANSACTION_DEFAULTS = {'value': 0, 'data': b'', 'gas': lambda w3, tx: w3.
     generate_gas_price(tx), 'maxFeePerGas': lambda w3, tx: w3.eth.
     max_priority_fee + 2 * w3.eth.get_block('latest')['baseFeePerGas'],
     'maxPriorityFeePerGas': lambda w3, tx: w3.eth.max_priority_fee,
-    'chainId': lambda w3, tx: w3.eth.chain_id}
+    'chainId': lambda w3, tx: get_chain_id(w3)}
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
 
@@ -53,3 +55,31 @@ def fill_transaction_defaults(w3: 'Web3', transaction: TxParams) ->TxParams:
         filled_transaction = assoc(filled_transaction, 'gas', w3.eth.estimate_gas(filled_transaction))
 
     return filled_transaction
+
+
+def get_block_gas_limit(w3: 'Web3', block_identifier: Optional[
+    BlockIdentifier]=None) ->int:
+    if block_identifier is None:
+        head_tracker = get_head_tracker(w3)
+        if not head_tracker.is_current() and has_cached_block_gas_limit(w3.provider):
+            # the gas limit is still cached if the head has not moved since
+            gas_limit = get_cached_block_gas_limit(w3.provider, w3.eth.block_number)
+            if gas_limit is not None:
+                return gas_limit
+        head = head_tracker.latest(w3)
+        cache_block_gas_limit(w3.provider, head)
+        return head['gasLimit']
+    block = w3.eth.get_block(block_identifier)
+    return block['gasLimit']
+
+
+def get_buffered_gas_estimate(w3: 'Web3', transaction: TxParams,
+    gas_buffer: int=100000) ->int:
+    gas_estimate_transaction = cast(TxParams, dict(**transaction))
+    gas_estimate = w3.eth.estimate_gas(gas_estimate_transaction)
+    gas_limit = get_block_gas_limit(w3)
+    if gas_estimate > gas_limit:
+        raise ValueError(
+            f'Contract does not appear to be deployable within the current network gas limits.  Estimated: {gas_estimate}. Current gas limit: {gas_limit}'
+            )
+    return min(gas_limit, gas_estimate + gas_buffer)
@@ -2,9 +2,9 @@ import copy
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Type, cast
 from eth_typing import ChecksumAddress
 from eth_utils import combomethod
-from eth_utils.toolz import partial
 from hexbytes import HexBytes
-from web3._utils.abi import fallback_func_abi_exists, filter_by_type, receive_func_abi_exists
+from web3._utils.abi import fallback_func_abi_exists, receive_func_abi_exists
+from web3._utils.abi_cache import get_cached_abi
 from web3._utils.async_transactions import async_fill_transaction_defaults
 from web3._utils.compat import Self
 from web3._utils.contracts import async_parse_block_identifier, parse_block_identifier_no_extra_call
@@ -231,12 +231,12 @@ class AsyncContractFunctions(BaseContractFunctions):
             raise NoABIFunctionsFound(
                 'The abi for this contract contains no function definitions. ',
                 'Are you sure you provided the correct contract abi?')
-        elif function_name not in self.__dict__['_functions']:
+        elif function_name not in self.__dict__['_cached_abi'].function_names:
             raise ABIFunctionNotFound(
                 f"The function '{function_name}' was not found in this contract's abi."
                 , ' Are you sure you provided the correct contract abi?')
         else:
-            return super().__getattribute__(function_name)
+            return self._make_function(function_name)
 
 
 class AsyncContract(BaseContract):
@@ -295,18 +295,15 @@ class AsyncContractCaller(BaseContractCaller):
         if self.abi:
             if transaction is None:
                 transaction = {}
-            self._functions = filter_by_type('function', self.abi)
-            for func in self._functions:
-                fn = AsyncContractFunction.factory(func['name'], w3=w3,
-                    contract_abi=self.abi, address=self.address,
-                    function_identifier=func['name'], decode_tuples=
-                    decode_tuples)
-                block_id = parse_block_identifier_no_extra_call(w3,
+            # caller methods are built on first access, see ``_make_caller_method``
+            self._cached_abi = get_cached_abi(self.abi)
+            self._functions = self._cached_abi.functions
+            self._contract_function_class = AsyncContractFunction
+            self._transaction = transaction
+            self._ccip_read_enabled = ccip_read_enabled
+            if self._functions:
+                self._block_identifier = parse_block_identifier_no_extra_call(w3,
                     block_identifier)
-                caller_method = partial(self.call_function, fn, transaction
-                    =transaction, block_identifier=block_id,
-                    ccip_read_enabled=ccip_read_enabled)
-                setattr(self, func['name'], caller_method)
 
     def __call__(self, transaction: Optional[TxParams]=None,
         block_identifier: BlockIdentifier=None, ccip_read_enabled: Optional
@@ -2,21 +2,24 @@ from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Generator, It
 import warnings
 from eth_typing import Address, ChecksumAddress, HexStr
 from eth_utils import add_0x_prefix, combomethod, encode_hex, function_abi_to_4byte_selector, is_list_like, is_text, to_tuple
+from eth_utils.toolz import partial
 from hexbytes import HexBytes
-from web3._utils.abi import abi_to_signature, check_if_arguments_can_be_encoded, fallback_func_abi_exists, filter_by_type, get_constructor_abi, is_array_type, merge_args_and_kwargs, receive_func_abi_exists
+from web3._utils.abi import abi_to_signature, check_if_arguments_can_be_encoded, fallback_func_abi_exists, get_constructor_abi, is_array_type, merge_args_and_kwargs, receive_func_abi_exists
+from web3._utils.abi_cache import get_cached_abi
 from web3._utils.contracts import decode_transaction_data, encode_abi, find_matching_event_abi, find_matching_fn_abi, get_function_info, prepare_transaction
 from web3._utils.datatypes import PropertyCheckingFactory
 from web3._utils.decorators import deprecate_method
 from web3._utils.empty import empty
 from web3._utils.encoding import to_4byte_hex, to_hex
-from web3._utils.events import AsyncEventFilterBuilder, EventFilterBuilder, get_event_data, is_dynamic_sized_type
+from web3._utils.events import AsyncEventFilterBuilder, EventFilterBuilder, get_event_data, get_event_decoder, is_dynamic_sized_type, process_logs
 from web3._utils.filters import construct_event_filter_params
 from web3._utils.function_identifiers import FallbackFn, ReceiveFn
 from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.datastructures import AttributeDict, MutableAttributeDict
 from web3.exceptions import ABIEventFunctionNotFound, ABIFunctionNotFound, FallbackNotFound, InvalidEventABI, LogTopicError, MismatchedABI, NoABIEventsFound, NoABIFound, NoABIFunctionsFound, Web3ValidationError
 from web3.logs import DISCARD, IGNORE, STRICT, WARN, EventLogErrorFlags
-from web3.types import ABI, ABIEvent, ABIFunction, BlockIdentifier, EventData, FilterParams, FunctionIdentifier, TContractFn, TxParams, TxReceipt
+from web3.types import ABI, ABIEvent, ABIFunction, BlockIdentifier, EventData, FilterParams, FunctionIdentifier, LogReceipt, TContractFn, TxParams, TxReceipt
+from web3.utils.events import EventLogDecoder
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
     from .async_contract import AsyncContractFunction
@@ -42,6 +45,25 @@ class BaseContractEvent:
             self.argument_names = argument_names
         self.abi = self._get_event_abi()
 
+    @classmethod
+    def _get_event_abi(cls) ->ABIEvent:
+        return find_matching_event_abi(cls.contract_abi, event_name=cls.
+            event_name)
+
+    @combomethod
+    def process_receipt(self, txn_receipt: TxReceipt, errors:
+        EventLogErrorFlags=WARN) ->Iterable[EventData]:
+        return self._parse_logs(txn_receipt, errors)
+
+    def _parse_logs(self, txn_receipt: TxReceipt, errors: EventLogErrorFlags
+        ) ->Iterable[EventData]:
+        decoder = get_event_decoder(self.w3.codec, self.abi)
+        return process_logs(txn_receipt['logs'], decoder.decode, errors)
+
+    @combomethod
+    def process_log(self, log: HexStr) ->EventData:
+        return get_event_data(self.w3.codec, self.abi, log)
+
 
 class BaseContractEvents:
     """Class containing contract event objects
@@ -69,23 +91,28 @@ class BaseContractEvents:
         ChecksumAddress]=None) ->None:
         if abi:
             self.abi = abi
-            self._events = filter_by_type('event', self.abi)
-            for event in self._events:
-                setattr(self, event['name'], contract_event_type.factory(
-                    event['name'], w3=w3, contract_abi=self.abi, address=
-                    address, event_name=event['name']))
+            # events are built on first access, see ``__getattr__``
+            self._cached_abi = get_cached_abi(self.abi)
+            self._events = self._cached_abi.events
+            self._w3 = w3
+            self._contract_event_type = contract_event_type
+            self._address = address
 
     def __getattr__(self, event_name: str) ->Type['BaseContractEvent']:
         if '_events' not in self.__dict__:
             raise NoABIEventsFound(
                 'The abi for this contract contains no event definitions. ',
                 'Are you sure you provided the correct contract abi?')
-        elif event_name not in self.__dict__['_events']:
+        elif event_name not in self.__dict__['_cached_abi'].event_names:
             raise ABIEventFunctionNotFound(
                 f"The event '{event_name}' was not found in this contract's abi. "
                 , 'Are you sure you provided the correct contract abi?')
         else:
-            return super().__getattribute__(event_name)
+            event = self._cached_abi.make_event(self._contract_event_type,
+                event_name, self._w3, self._address)
+            # later accesses find the attribute and don't reach ``__getattr__``
+            setattr(self, event_name, event)
+            return event
 
     def __getitem__(self, event_name: str) ->Type['BaseContractEvent']:
         return getattr(self, event_name)
@@ -104,6 +131,32 @@ class BaseContractEvents:
         except ABIEventFunctionNotFound:
             return False
 
+    def process_receipt(self, txn_receipt: TxReceipt, errors:
+        EventLogErrorFlags=WARN) ->Tuple[EventData, ...]:
+        """
+        Decode the logs of ``txn_receipt`` of any of the events of the contract,
+        in one pass. Logs that can't be decoded, like the logs of other
+        contracts' events, are handled as by ``ContractEvent.process_receipt``.
+        """
+        return self._get_log_decoder().process_receipt(txn_receipt, errors)
+
+    def process_logs(self, logs: Iterable[LogReceipt], errors:
+        EventLogErrorFlags=WARN) ->Tuple[EventData, ...]:
+        """
+        Decode ``logs`` of any of the events of the contract, like
+        ``process_receipt``.
+        """
+        return self._get_log_decoder().process_logs(logs, errors)
+
+    def _get_log_decoder(self) ->EventLogDecoder:
+        if not self.__dict__.get('_events'):
+            raise NoABIEventsFound(
+                'The abi for this contract contains no event definitions. ',
+                'Are you sure you provided the correct contract abi?')
+        if '_log_decoder' not in self.__dict__:
+            self._log_decoder = EventLogDecoder(self._w3.codec, self.abi)
+        return self._log_decoder
+
 
 class BaseContractFunction:
     """Base class for contract functions
@@ -148,12 +201,29 @@ class BaseContractFunctions:
         self.w3 = w3
         self.address = address
         if self.abi:
-            self._functions = filter_by_type('function', self.abi)
-            for func in self._functions:
-                setattr(self, func['name'], contract_function_class.factory
-                    (func['name'], w3=self.w3, contract_abi=self.abi,
-                    address=self.address, decode_tuples=decode_tuples,
-                    function_identifier=func['name']))
+            # functions are built on first access, see ``_make_function``
+            self._cached_abi = get_cached_abi(self.abi)
+            self._functions = self._cached_abi.functions
+            self._contract_function_class = contract_function_class
+            self._decode_tuples = decode_tuples
+            self._w3 = w3
+            self._address = address
+            # functions named like an attribute, e.g. ``w3``, replace it
+            for function_name in (self._cached_abi.function_names & vars(
+                self).keys()):
+                self._make_function(function_name)
+
+    def _make_function(self, function_name: str) ->Union['ContractFunction',
+        'AsyncContractFunction']:
+        """
+        Build the function named ``function_name`` and set it as an attribute,
+        so later accesses don't reach ``__getattr__``.
+        """
+        function = self._cached_abi.make_function(self.
+            _contract_function_class, function_name, self._w3, self._address,
+            self._decode_tuples)
+        setattr(self, function_name, function)
+        return function
 
     def __iter__(self) ->Generator[str, None, None]:
         if not hasattr(self, '_functions') or not self._functions:
@@ -267,7 +337,7 @@ class BaseContractCaller:
             raise NoABIFunctionsFound(
                 'The ABI for this contract contains no function definitions. ',
                 'Are you sure you provided the correct contract ABI?')
-        elif function_name not in {fn['name'] for fn in self._functions}:
+        elif function_name not in self._cached_abi.function_names:
             functions_available = ', '.join([fn['name'] for fn in self.
                 _functions])
             raise ABIFunctionNotFound(
@@ -276,7 +346,20 @@ class BaseContractCaller:
                 f'{functions_available}. ',
                 'Did you mean to call one of those functions?')
         else:
-            return super().__getattribute__(function_name)
+            return self._make_caller_method(function_name)
+
+    def _make_caller_method(self, function_name: str) ->Callable[..., Any]:
+        """
+        Build the method calling the function named ``function_name`` and set
+        it as an attribute, so later accesses don't reach ``__getattr__``.
+        """
+        fn = self._cached_abi.make_function(self._contract_function_class,
+            function_name, self.w3, self.address, self.decode_tuples)
+        caller_method = partial(self.call_function, fn, transaction=self.
+            _transaction, block_identifier=self._block_identifier,
+            ccip_read_enabled=self._ccip_read_enabled)
+        setattr(self, function_name, caller_method)
+        return caller_method
 
     def __hasattr__(self, event_name: str) ->bool:
         try:
@@ -4,14 +4,15 @@ from eth_typing import ChecksumAddress
 from eth_utils import combomethod
 from eth_utils.toolz import partial
 from hexbytes import HexBytes
-from web3._utils.abi import fallback_func_abi_exists, filter_by_type, receive_func_abi_exists
+from web3._utils.abi import fallback_func_abi_exists, receive_func_abi_exists
+from web3._utils.abi_cache import get_cached_abi
 from web3._utils.compat import Self
 from web3._utils.contracts import parse_block_identifier
 from web3._utils.datatypes import PropertyCheckingFactory
 from web3._utils.events import EventFilterBuilder, get_event_data
 from web3._utils.filters import LogFilter
 from web3._utils.function_identifiers import FallbackFn, ReceiveFn
-from web3._utils.normalizers import normalize_abi, normalize_address, normalize_bytecode
+from web3._utils.normalizers import normalize_abi, normalize_bytecode, normalize_contract_address
 from web3._utils.transactions import fill_transaction_defaults
 from web3.contract.base_contract import BaseContract, BaseContractCaller, BaseContractConstructor, BaseContractEvent, BaseContractEvents, BaseContractFunction, BaseContractFunctions, NonExistentFallbackFunction, NonExistentReceiveFunction
 from web3.contract.utils import build_transaction_for_function, call_contract_function, estimate_gas_for_function, find_functions_by_identifier, get_function_by_identifier, transact_with_contract_function
@@ -235,12 +236,12 @@ class ContractFunctions(BaseContractFunctions):
             raise NoABIFunctionsFound(
                 'The abi for this contract contains no function definitions. ',
                 'Are you sure you provided the correct contract abi?')
-        elif function_name not in self.__dict__['_functions']:
+        elif function_name not in self.__dict__['_cached_abi'].function_names:
             raise ABIFunctionNotFound(
                 f"The function '{function_name}' was not found in this contract's abi."
                 , ' Are you sure you provided the correct contract abi?')
         else:
-            return super().__getattribute__(function_name)
+            return self._make_function(function_name)
 
 
 class Contract(BaseContract):
@@ -258,7 +259,7 @@ class Contract(BaseContract):
                 'The `Contract` class has not been initialized.  Please use the `web3.contract` interface to create your contract class.'
                 )
         if address:
-            self.address = normalize_address(cast('ENS', _w3.ens), address)
+            self.address = normalize_contract_address(_w3, address)
         if not self.address:
             raise TypeError(
                 'The address argument is required to instantiate a contract.')
@@ -305,17 +306,15 @@ class ContractCaller(BaseContractCaller):
         if self.abi:
             if transaction is None:
                 transaction = {}
-            self._functions = filter_by_type('function', self.abi)
-            for func in self._functions:
-                fn = ContractFunction.factory(func['name'], w3=w3,
-                    contract_abi=self.abi, address=self.address,
-                    function_identifier=func['name'], decode_tuples=
-                    decode_tuples)
-                block_id = parse_block_identifier(w3, block_identifier)
-                caller_method = partial(self.call_function, fn, transaction
-                    =transaction, block_identifier=block_id,
-                    ccip_read_enabled=ccip_read_enabled)
-                setattr(self, func['name'], caller_method)
+            # caller methods are built on first access, see ``_make_caller_method``
+            self._cached_abi = get_cached_abi(self.abi)
+            self._functions = self._cached_abi.functions
+            self._contract_function_class = ContractFunction
+            self._transaction = transaction
+            self._ccip_read_enabled = ccip_read_enabled
+            if self._functions:
+                self._block_identifier = parse_block_identifier(w3,
+                    block_identifier)
 
     def __call__(self, transaction: Optional[TxParams]=None,
         block_identifier: BlockIdentifier=None, ccip_read_enabled: Optional
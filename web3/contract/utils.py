@@ -3,8 +3,9 @@ from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
 from eth_abi.exceptions import DecodingError
 from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
-from web3._utils.abi import filter_by_type, get_abi_output_types, map_abi_data, named_tree, recursive_dict_to_namedtuple
+from web3._utils.abi import filter_by_type, recursive_dict_to_namedtuple
 from web3._utils.async_transactions import async_fill_transaction_defaults
+from web3._utils.call_plans import get_call_plan
 from web3._utils.contracts import find_matching_fn_abi, prepare_transaction
 from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3._utils.transactions import fill_transaction_defaults
@@ -32,38 +33,22 @@ def call_contract_function(w3: 'Web3', address: ChecksumAddress,
     if transaction is None:
         transaction = {}
 
-    processed_transaction = prepare_transaction(
-        address,
-        w3,
-        fn_identifier=function_identifier,
-        contract_abi=contract_abi,
-        fn_abi=fn_abi,
-        transaction=transaction,
-        fn_args=args,
-        fn_kwargs=kwargs,
+    call_plan = get_call_plan(fn_abi, normalizers)
+    # ``eth_call`` needs no gas, fee, value or chain id defaults, and
+    # ``from`` defaults to ``default_account`` in ``eth.call``, so unlike a
+    # transaction the call is sent as prepared, without extra RPCs
+    call_transaction = call_plan.prepare_transaction(
+        address, w3, transaction, args, kwargs)
+
+    result = w3.eth.call(
+        call_transaction,
+        block_identifier=block_id,
+        state_override=state_override,
+        ccip_read_enabled=ccip_read_enabled,
     )
 
-    call_transaction = fill_transaction_defaults(w3, processed_transaction)
-
-    output_types = get_abi_output_types(fn_abi)
-
-    call_params = {
-        'to': address,
-        'data': call_transaction['data'],
-    }
-    if 'gas' in call_transaction:
-        call_params['gas'] = call_transaction['gas']
-
-    if state_override is not None:
-        call_params['state_override'] = state_override
-
-    if ccip_read_enabled is not None:
-        call_params['ccip_read_enabled'] = ccip_read_enabled
-
-    result = w3.eth.call(call_params, block_identifier=block_id)
-
     try:
-        output_data = w3.codec.decode(output_types, result)
+        return call_plan.decode_output(w3.codec, result, decode_tuples)
     except DecodingError as e:
         # Provide a more helpful error message than the one provided by
         # eth-abi-utils
@@ -72,20 +57,11 @@ def call_contract_function(w3: 'Web3', address: ChecksumAddress,
             "output_types {}".format(
                 function_identifier,
                 result,
-                output_types
+                call_plan.output_types
             )
         )
         raise BadFunctionCallOutput(msg) from e
 
-    normalized_data = map_abi_data(normalizers, output_types, output_data)
-
-    if len(normalized_data) == 1:
-        return normalized_data[0]
-    elif decode_tuples:
-        return named_tree(normalized_data, output_types)
-    else:
-        return normalized_data
-
 
 def transact_with_contract_function(address: ChecksumAddress, w3: 'Web3',
     function_name: Optional[FunctionIdentifier]=None, transaction: Optional
@@ -208,58 +184,33 @@ async def async_call_contract_function(async_w3: 'AsyncWeb3', address:
     if transaction is None:
         transaction = {}
 
-    processed_transaction = prepare_transaction(
-        address,
-        async_w3,
-        fn_identifier=function_identifier,
-        contract_abi=contract_abi,
-        fn_abi=fn_abi,
-        transaction=transaction,
-        fn_args=args,
-        fn_kwargs=kwargs,
+    call_plan = get_call_plan(fn_abi, normalizers)
+    # ``eth_call`` needs no gas, fee, value or chain id defaults, and
+    # ``from`` defaults to ``default_account`` in ``eth.call``, so unlike a
+    # transaction the call is sent as prepared, without extra RPCs
+    call_transaction = call_plan.prepare_transaction(
+        address, async_w3, transaction, args, kwargs)
+
+    result = await async_w3.eth.call(
+        call_transaction,
+        block_identifier=block_id,
+        state_override=state_override,
+        ccip_read_enabled=ccip_read_enabled,
     )
 
-    call_transaction = await async_fill_transaction_defaults(async_w3, processed_transaction)
-
-    output_types = get_abi_output_types(fn_abi)
-
-    call_params = {
-        'to': address,
-        'data': call_transaction['data'],
-    }
-    if 'gas' in call_transaction:
-        call_params['gas'] = call_transaction['gas']
-
-    if state_override is not None:
-        call_params['state_override'] = state_override
-
-    if ccip_read_enabled is not None:
-        call_params['ccip_read_enabled'] = ccip_read_enabled
-
-    result = await async_w3.eth.call(call_params, block_identifier=block_id)
-
     try:
-        output_data = async_w3.codec.decode(output_types, result)
+        return call_plan.decode_output(async_w3.codec, result, decode_tuples)
     except DecodingError as e:
         msg = (
             "Could not decode contract function call {} return data {} for "
             "output_types {}".format(
                 function_identifier,
                 result,
-                output_types
+                call_plan.output_types
             )
         )
         raise BadFunctionCallOutput(msg) from e
 
-    normalized_data = map_abi_data(normalizers, output_types, output_data)
-
-    if len(normalized_data) == 1:
-        return normalized_data[0]
-    elif decode_tuples:
-        return named_tree(normalized_data, output_types)
-    else:
-        return normalized_data
-
 
 async def async_transact_with_contract_function(address: ChecksumAddress,
     async_w3: 'AsyncWeb3', function_name: Optional[FunctionIdentifier]=None,
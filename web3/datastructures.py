@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from collections.abc import Hashable
+import functools
 from typing import Any, Callable, Dict, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Type, TypeVar, Union, cast
 from eth_utils import is_integer
 from web3._utils.formatters import recursive_map
@@ -40,7 +41,7 @@ class ReadableAttributeDict(Mapping[TKey, TValue]):
             builder.text(f'{class_name}(...)')
         else:
             with builder.group(4, f'{class_name}(', ')'):
-                for idx, (key, value) in enumerate(self.__dict__.items()):
+                for idx, (key, value) in enumerate(self.items()):
                     if idx:
                         builder.text(',')
                         builder.breakable()
@@ -87,6 +88,215 @@ class AttributeDict(ReadableAttributeDict[TKey, TValue], Hashable):
             return False
 
 
+class LazyAttributeDict(AttributeDict[TKey, TValue]):
+    """
+    An ``AttributeDict`` whose values are formatted when first accessed.
+
+    Each formatted value is memoized, so reading a few fields of a large result
+    only pays for those fields. Hashing, equality and ``repr`` format every
+    field first and behave exactly like the equivalent ``AttributeDict``.
+    """
+
+    # ``__dict__`` holds the formatted values, so the unformatted values and the
+    # formatters are kept in slots
+    __slots__ = ("_unformatted", "_formatters")
+
+    def __init__(self, dictionary: Mapping[TKey, Any], formatters: Mapping[TKey,
+        Callable[[Any], TValue]]) ->None:
+        self.__dict__ = {}
+        object.__setattr__(self, '_unformatted', dict(dictionary))
+        object.__setattr__(self, '_formatters', formatters)
+
+    def _format(self, key: TKey) ->TValue:
+        value = self._unformatted[key]
+        formatter = self._formatters.get(key)
+        if formatter is not None:
+            try:
+                value = formatter(value)
+            except ValueError as exc:
+                raise ValueError(
+                    f'Could not format invalid value {value!r} as field {key!r}'
+                    ) from exc
+            except TypeError as exc:
+                raise TypeError(
+                    f'Could not format invalid type {value!r} as field {key!r}'
+                    ) from exc
+        self.__dict__[key] = value
+        return value
+
+    def _format_all(self) ->None:
+        if len(self.__dict__) != len(self._unformatted):
+            self.__dict__ = {key: self[key] for key in self._unformatted}
+
+    def __getitem__(self, key: TKey) ->TValue:
+        try:
+            return self.__dict__[key]
+        except KeyError:
+            return self._format(key)
+
+    def __getattr__(self, attr: str) ->TValue:
+        if attr not in LazyAttributeDict.__slots__ and attr in self._unformatted:
+            return self._format(cast(TKey, attr))
+        raise AttributeError(
+            f'{self.__class__.__name__!r} object has no attribute {attr!r}')
+
+    def __contains__(self, key: Any) ->bool:
+        return key in self._unformatted
+
+    def __iter__(self) ->Iterator[Any]:
+        return iter(self._unformatted)
+
+    def __len__(self) ->int:
+        return len(self._unformatted)
+
+    def __repr__(self) ->str:
+        self._format_all()
+        # formatted, it is an ``AttributeDict``
+        return f"AttributeDict({self.__dict__!r})"
+
+    def _repr_pretty_(self, builder: Any, cycle: bool) ->None:
+        self._format_all()
+        super()._repr_pretty_(builder, cycle)
+
+    def __hash__(self) ->int:
+        self._format_all()
+        return super().__hash__()
+
+    def __eq__(self, other: Any) ->bool:
+        self._format_all()
+        return super().__eq__(other)
+
+    def __reduce__(self) ->Tuple[Type[AttributeDict[TKey, TValue]], Tuple[
+        Dict[TKey, TValue]]]:
+        self._format_all()
+        return AttributeDict, (self.__dict__,)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_key_index(keys: Tuple[Any, ...]) ->Dict[Any, int]:
+    # shared by every ``CompactAttributeDict`` with the same keys, never mutated
+    return {key: index for index, key in enumerate(keys)}
+
+
+def _to_hashable(value: Any) ->Any:
+    if type(value) is list or type(value) is tuple:
+        return tuple(_to_hashable(item) for item in value)
+    return value
+
+
+# the attributes of a ``CompactAttributeDict``, which shadow keys of the same name
+_COMPACT_ATTRIBUTE_DICT_ATTRS = frozenset(('_key_index', '_values', '_wrapped',
+    '_hash'))
+
+
+class CompactAttributeDict(AttributeDict[TKey, TValue]):
+    """
+    An ``AttributeDict`` that holds its values compactly.
+
+    The keys are held in an index shared by every instance with the same keys, so
+    each instance only holds a list of its values. Nested mappings, including
+    those in lists and tuples, are wrapped when first accessed rather than up
+    front, and the hash is computed once. Equality and hashing are the same as
+    for the equivalent ``AttributeDict``.
+
+    Nested values are not copied until they are accessed, so the mapping being
+    wrapped should not be modified afterwards.
+    """
+
+    def __init__(
+        self, dictionary: Mapping[TKey, TValue], *args: Any, **kwargs: Any
+    ) ->None:
+        if args or kwargs or type(dictionary) is not dict:
+            dictionary = dict(dictionary)
+            dictionary.update(dict(*args, **kwargs))
+        object.__setattr__(self, '_key_index', _get_key_index(tuple(dictionary)))
+        object.__setattr__(self, '_values', list(dictionary.values()))
+        # bit ``i`` is set once the value at index ``i`` has been wrapped
+        object.__setattr__(self, '_wrapped', 0)
+        object.__setattr__(self, '_hash', None)
+
+    @classmethod
+    def recursive(cls, value: TValue) ->Any:
+        """
+        Wrap ``value`` like ``AttributeDict.recursive``, but lazily: only the
+        outermost mappings are wrapped now, nested ones when they are accessed.
+        """
+        value_type = type(value)
+        if value_type is dict:
+            return cls(value)
+        elif value_type is list or value_type is tuple:
+            return value_type(cls.recursive(item) for item in value)
+        elif value is None or isinstance(value, (str, bytes, int)):
+            # checked before the much slower ``Mapping`` checks
+            return value
+        elif isinstance(value, Mapping) and not isinstance(value, AttributeDict):
+            return cls(value)
+        return value
+
+    def _wrap(self, index: int) ->TValue:
+        value = self.recursive(self._values[index])
+        self._values[index] = value
+        object.__setattr__(self, '_wrapped', self._wrapped | 1 << index)
+        return value
+
+    def __getitem__(self, key: TKey) ->TValue:
+        index = self._key_index[key]
+        if self._wrapped >> index & 1:
+            return self._values[index]
+        return self._wrap(index)
+
+    def __getattr__(self, attr: str) ->TValue:
+        # only called for names which are not found on the instance or class
+        if attr not in _COMPACT_ATTRIBUTE_DICT_ATTRS:
+            try:
+                index = self._key_index[attr]
+            except KeyError:
+                pass
+            else:
+                if self._wrapped >> index & 1:
+                    return self._values[index]
+                return self._wrap(index)
+        raise AttributeError(
+            f'{self.__class__.__name__!r} object has no attribute {attr!r}'
+        )
+
+    def __contains__(self, key: Any) ->bool:
+        return key in self._key_index
+
+    def __iter__(self) ->Iterator[Any]:
+        return iter(self._key_index)
+
+    def __len__(self) ->int:
+        return len(self._values)
+
+    def __repr__(self) ->str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
+
+    def __hash__(self) ->int:
+        # same value as the hash of the equivalent ``AttributeDict``, but nested
+        # instances are hashed through their own cached hash
+        if self._hash is None:
+            object.__setattr__(
+                self,
+                '_hash',
+                hash(tuple(sorted((key, _to_hashable(self[key])) for key in self))),
+            )
+        return self._hash
+
+    def __eq__(self, other: Any) ->bool:
+        if isinstance(other, AttributeDict):
+            return hash(self) == hash(other)
+        elif isinstance(other, Mapping):
+            return dict(self.items()) == dict(other)
+        else:
+            return False
+
+    def __reduce__(
+        self,
+    ) ->Tuple[Type['CompactAttributeDict[TKey, TValue]'], Tuple[Dict[TKey, TValue]]]:
+        return self.__class__, (dict(self.items()),)
+
+
 def tupleize_lists_nested(d: Mapping[TKey, TValue]) ->AttributeDict[TKey,
     TValue]:
     """
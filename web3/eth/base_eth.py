@@ -14,5 +14,6 @@ class BaseEth(Module):
     _default_block: BlockIdentifier = 'latest'
     _default_contract_factory: Any = None
     _gas_price_strategy = None
+    lazy_results: bool = False
     is_async = False
     account = Account()
@@ -0,0 +1,475 @@
+"""
+Request instrumentation for the ``RequestManager``.
+
+Set ``w3.manager.instrumentation`` to a ``RequestInstrumentation`` to time every
+request, and every middleware layer it passes through, into one or more sinks::
+
+    >>> from web3.instrumentation import RequestInstrumentation, RequestMetrics
+    >>> metrics = RequestMetrics()
+    >>> w3.manager.instrumentation = RequestInstrumentation(metrics)
+"""
+
+from bisect import (
+    bisect_left,
+)
+from contextvars import (
+    ContextVar,
+)
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from web3._utils.compat import (
+    Protocol,
+)
+from web3.middleware import (
+    async_combine_middlewares,
+    combine_middlewares,
+)
+from web3.types import (
+    AsyncMiddleware,
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.manager import (  # noqa: F401
+        RequestManager,
+    )
+
+# upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# time spent in the inner layers of the middleware layer being timed
+_child_time: ContextVar[Optional[List[float]]] = ContextVar("child_time", default=None)
+# size of the raw response of the request being timed
+_response_size: ContextVar[Optional[List[Optional[int]]]] = ContextVar(
+    "response_size", default=None
+)
+
+
+def report_response_size(size: int) -> None:
+    """
+    Record the size, in bytes, of the raw response of the request in flight.
+    Providers call this before decoding a response. It does nothing unless the
+    request is instrumented.
+    """
+    response_size = _response_size.get()
+    if response_size is not None:
+        response_size[0] = size
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket upper bounds. ``counts`` holds the number of
+    observations per bucket, with one more entry than ``buckets`` for the
+    observations above the last bound.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, sum={self.sum:.6f})"
+
+
+class RequestSink(Protocol):
+    def record_request(
+        self,
+        method: RPCEndpoint,
+        duration: float,
+        error: bool,
+        response_bytes: Optional[int],
+    ) -> None:
+        ...
+
+    def record_middleware(
+        self, name: str, method: RPCEndpoint, duration: float
+    ) -> None:
+        ...
+
+
+class MethodMetrics:
+    __slots__ = ("requests", "errors", "response_bytes", "latency")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.response_bytes = 0
+        self.latency = Histogram(buckets)
+
+    def __repr__(self) -> str:
+        return (
+            f"MethodMetrics(requests={self.requests}, errors={self.errors}, "
+            f"response_bytes={self.response_bytes}, latency={self.latency!r})"
+        )
+
+
+class RequestMetrics:
+    """
+    In-memory sink keeping per-method request, error and response byte counts
+    with a latency histogram, and a self-time histogram per middleware.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.methods: Dict[str, MethodMetrics] = {}
+        self.middlewares: Dict[str, Histogram] = {}
+
+    def record_request(
+        self,
+        method: RPCEndpoint,
+        duration: float,
+        error: bool,
+        response_bytes: Optional[int],
+    ) -> None:
+        with self._lock:
+            metrics = self.methods.get(method)
+            if metrics is None:
+                metrics = self.methods[method] = MethodMetrics(self.buckets)
+            metrics.requests += 1
+            metrics.errors += error
+            if response_bytes is not None:
+                metrics.response_bytes += response_bytes
+            metrics.latency.observe(duration)
+
+    def record_middleware(
+        self, name: str, method: RPCEndpoint, duration: float
+    ) -> None:
+        with self._lock:
+            histogram = self.middlewares.get(name)
+            if histogram is None:
+                histogram = self.middlewares[name] = Histogram(self.buckets)
+            histogram.observe(duration)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.methods.clear()
+            self.middlewares.clear()
+
+
+class RequestRecord(NamedTuple):
+    method: RPCEndpoint
+    duration: float
+    error: bool
+    response_bytes: Optional[int]
+
+
+class MiddlewareRecord(NamedTuple):
+    name: str
+    method: RPCEndpoint
+    duration: float
+
+
+class CallbackSink:
+    """
+    Sink passing a ``RequestRecord`` or ``MiddlewareRecord`` to plain callbacks.
+    """
+
+    def __init__(
+        self,
+        on_request: Optional[Callable[[RequestRecord], Any]] = None,
+        on_middleware: Optional[Callable[[MiddlewareRecord], Any]] = None,
+    ) -> None:
+        self.on_request = on_request
+        self.on_middleware = on_middleware
+
+    def record_request(
+        self,
+        method: RPCEndpoint,
+        duration: float,
+        error: bool,
+        response_bytes: Optional[int],
+    ) -> None:
+        if self.on_request is not None:
+            self.on_request(RequestRecord(method, duration, error, response_bytes))
+
+    def record_middleware(
+        self, name: str, method: RPCEndpoint, duration: float
+    ) -> None:
+        if self.on_middleware is not None:
+            self.on_middleware(MiddlewareRecord(name, method, duration))
+
+
+class PrometheusSink:
+    """
+    Sink exporting to ``prometheus_client``, which must be installed separately.
+    """
+
+    def __init__(
+        self,
+        registry: Any = None,
+        namespace: str = "web3",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        try:
+            import prometheus_client
+        except ImportError as exc:
+            raise ImportError(
+                "PrometheusSink requires the prometheus_client package: "
+                "pip install prometheus-client"
+            ) from exc
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        options = {"namespace": namespace, "registry": registry}
+        self.requests = prometheus_client.Counter(
+            "requests", "JSON-RPC requests made", ["method"], **options
+        )
+        self.errors = prometheus_client.Counter(
+            "request_errors", "JSON-RPC requests that failed", ["method"], **options
+        )
+        self.response_bytes = prometheus_client.Counter(
+            "response_bytes", "Bytes of JSON-RPC responses", ["method"], **options
+        )
+        self.latency = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "JSON-RPC request latency",
+            ["method"],
+            buckets=buckets,
+            **options,
+        )
+        self.middleware_latency = prometheus_client.Histogram(
+            "middleware_self_seconds",
+            "Time spent in a middleware layer, excluding inner layers",
+            ["middleware"],
+            buckets=buckets,
+            **options,
+        )
+
+    def record_request(
+        self,
+        method: RPCEndpoint,
+        duration: float,
+        error: bool,
+        response_bytes: Optional[int],
+    ) -> None:
+        self.requests.labels(method).inc()
+        if error:
+            self.errors.labels(method).inc()
+        if response_bytes is not None:
+            self.response_bytes.labels(method).inc(response_bytes)
+        self.latency.labels(method).observe(duration)
+
+    def record_middleware(
+        self, name: str, method: RPCEndpoint, duration: float
+    ) -> None:
+        self.middleware_latency.labels(name).observe(duration)
+
+
+def _is_error(response: Any) -> bool:
+    return isinstance(response, dict) and "error" in response
+
+
+class RequestInstrumentation:
+    """
+    Times requests made through a ``RequestManager`` into the given sinks.
+
+    Each middleware layer, and the provider itself as ``"provider"``, reports its
+    self-time: the time spent in the layer excluding the inner layers and any
+    requests the layer makes on its own, which are recorded separately.
+    """
+
+    def __init__(self, *sinks: RequestSink) -> None:
+        self.sinks = sinks
+        self._request_func_cache: Tuple[Any, Optional[Callable[..., Any]]] = (
+            None,
+            None,
+        )
+
+    def _record_middleware(
+        self, name: str, method: RPCEndpoint, duration: float
+    ) -> None:
+        for sink in self.sinks:
+            sink.record_middleware(name, method, duration)
+
+    def _record_request(
+        self,
+        method: RPCEndpoint,
+        duration: float,
+        error: bool,
+        response_bytes: Optional[int],
+    ) -> None:
+        for sink in self.sinks:
+            sink.record_request(method, duration, error, response_bytes)
+
+    def _timed(
+        self, name: str, request_fn: Callable[..., RPCResponse]
+    ) -> Callable[..., RPCResponse]:
+        def timed_request(method: RPCEndpoint, params: Any) -> RPCResponse:
+            children = [0.0]
+            token = _child_time.set(children)
+            start = time.perf_counter()
+            try:
+                return request_fn(method, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                _child_time.reset(token)
+                parent = _child_time.get()
+                if parent is not None:
+                    parent[0] += elapsed
+                self._record_middleware(name, method, elapsed - children[0])
+
+        return timed_request
+
+    def _async_timed(
+        self, name: str, request_fn: Callable[..., Coroutine[Any, Any, RPCResponse]]
+    ) -> Callable[..., Coroutine[Any, Any, RPCResponse]]:
+        async def timed_request(method: RPCEndpoint, params: Any) -> RPCResponse:
+            children = [0.0]
+            token = _child_time.set(children)
+            start = time.perf_counter()
+            try:
+                return await request_fn(method, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                _child_time.reset(token)
+                parent = _child_time.get()
+                if parent is not None:
+                    parent[0] += elapsed
+                self._record_middleware(name, method, elapsed - children[0])
+
+        return timed_request
+
+    def _named_middlewares(self, manager: "RequestManager") -> Tuple[Any, ...]:
+        # outermost first, the provider's own middlewares last
+        return tuple(manager.middleware_onion.middlewares) + tuple(
+            (middleware, getattr(middleware, "__name__", repr(middleware)))
+            for middleware in manager.provider._middlewares
+        )
+
+    def _timed_middleware(self, middleware: Middleware, name: str) -> Middleware:
+        def timed_middleware(
+            make_request: Callable[..., RPCResponse], w3: "Web3"
+        ) -> Callable[..., RPCResponse]:
+            return self._timed(name, middleware(make_request, w3))
+
+        return timed_middleware
+
+    def _async_timed_middleware(
+        self, middleware: AsyncMiddleware, name: str
+    ) -> AsyncMiddleware:
+        async def timed_middleware(
+            make_request: Callable[..., Any], async_w3: "AsyncWeb3"
+        ) -> Callable[..., Coroutine[Any, Any, RPCResponse]]:
+            return self._async_timed(name, await middleware(make_request, async_w3))
+
+        return timed_middleware
+
+    def _request_func(self, manager: "RequestManager") -> Callable[..., RPCResponse]:
+        named_middlewares = self._named_middlewares(manager)
+        cache_key = (named_middlewares, manager.provider)
+        if cache_key != self._request_func_cache[0]:
+            request_func = combine_middlewares(
+                middlewares=[
+                    self._timed_middleware(middleware, name)
+                    for middleware, name in named_middlewares
+                ],
+                w3=manager.w3,
+                provider_request_fn=self._timed(
+                    "provider", manager.provider.make_request
+                ),
+            )
+            self._request_func_cache = (cache_key, request_func)
+        return self._request_func_cache[1]
+
+    async def _async_request_func(
+        self, manager: "RequestManager"
+    ) -> Callable[..., Coroutine[Any, Any, RPCResponse]]:
+        named_middlewares = self._named_middlewares(manager)
+        cache_key = (named_middlewares, manager.provider)
+        if cache_key != self._request_func_cache[0]:
+            request_func = await async_combine_middlewares(
+                middlewares=[
+                    self._async_timed_middleware(middleware, name)
+                    for middleware, name in named_middlewares
+                ],
+                async_w3=manager.w3,
+                provider_request_fn=self._async_timed(
+                    "provider", manager.provider.make_request
+                ),
+            )
+            self._request_func_cache = (cache_key, request_func)
+        return self._request_func_cache[1]
+
+    def make_request(
+        self, manager: "RequestManager", method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        request_func = self._request_func(manager)
+        response_size: List[Optional[int]] = [None]
+        token = _response_size.set(response_size)
+        start = time.perf_counter()
+        error = True
+        try:
+            response = request_func(method, params)
+            error = _is_error(response)
+            return response
+        finally:
+            duration = time.perf_counter() - start
+            _response_size.reset(token)
+            self._record_request(method, duration, error, response_size[0])
+
+    async def coro_make_request(
+        self, manager: "RequestManager", method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        request_func = await self._async_request_func(manager)
+        response_size: List[Optional[int]] = [None]
+        token = _response_size.set(response_size)
+        start = time.perf_counter()
+        error = True
+        try:
+            response = await request_func(method, params)
+            error = _is_error(response)
+            return response
+        finally:
+            duration = time.perf_counter() - start
+            _response_size.reset(token)
+            self._record_request(method, duration, error, response_size[0])
@@ -34,6 +34,7 @@ from web3.providers.websocket.websocket_connection import WebsocketConnection
 from web3.testing import Testing
 from web3.tracing import Tracing
 from web3.types import AsyncMiddlewareOnion, MiddlewareOnion, Wei
+from web3.utils.multicall import DEFAULT_BATCH_SIZE, MULTICALL3_ADDRESS, AsyncMulticall, Multicall
 if TYPE_CHECKING:
     from web3.pm import PM
     from web3._utils.empty import Empty
@@ -106,6 +107,14 @@ class Web3(BaseWeb3):
             self.attach_modules(external_modules)
         self.ens = ens
 
+    def multicall(self, address: ChecksumAddress=MULTICALL3_ADDRESS,
+        batch_size: int=DEFAULT_BATCH_SIZE) ->Multicall:
+        """
+        Batch contract reads into ``eth_call`` requests to the Multicall3
+        contract at ``address``.
+        """
+        return Multicall(self, address, batch_size)
+
 
 class AsyncWeb3(BaseWeb3):
     eth: AsyncEth
@@ -126,6 +135,14 @@ class AsyncWeb3(BaseWeb3):
             self.attach_modules(external_modules)
         self.ens = ens
 
+    def multicall(self, address: ChecksumAddress=MULTICALL3_ADDRESS,
+        batch_size: int=DEFAULT_BATCH_SIZE) ->AsyncMulticall:
+        """
+        Batch contract reads into ``eth_call`` requests to the Multicall3
+        contract at ``address``.
+        """
+        return AsyncMulticall(self, address, batch_size)
+
     @staticmethod
     def persistent_websocket(provider: PersistentConnectionProvider,
         middlewares: Optional[Sequence[Any]]=None, modules: Optional[Dict[
@@ -7,6 +7,7 @@ from web3._utils.caching import generate_cache_key
 from web3._utils.compat import Self
 from web3.datastructures import NamedElementOnion
 from web3.exceptions import BadResponseFormat, MethodUnavailable, ProviderConnectionError, TaskNotRunning
+from web3.instrumentation import RequestInstrumentation
 from web3.middleware import abi_middleware, async_attrdict_middleware, async_buffered_gas_estimate_middleware, async_gas_price_strategy_middleware, async_name_to_address_middleware, async_validation_middleware, attrdict_middleware, buffered_gas_estimate_middleware, gas_price_strategy_middleware, name_to_address_middleware, validation_middleware
 from web3.module import apply_result_formatters
 from web3.providers import AutoProvider, PersistentConnectionProvider
@@ -23,6 +24,7 @@ class RequestManager:
     logger = logging.getLogger('web3.RequestManager')
     middleware_onion: Union[MiddlewareOnion, AsyncMiddlewareOnion,
         NamedElementOnion[None, None]]
+    instrumentation: Optional[RequestInstrumentation] = None
 
     def __init__(self, w3: Union['AsyncWeb3', 'Web3'], provider: Optional[
         Union['BaseProvider', 'AsyncBaseProvider']]=None, middlewares:
@@ -88,6 +90,8 @@ class RequestManager:
     def _make_request(self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any) ->RPCResponse:
         if callable(method):
             method = method(params)
+        if self.instrumentation is not None:
+            return self.instrumentation.make_request(self, method, params)
         middleware = self.middleware_onion.wrap(self.provider.make_request)
         return middleware(method, params)
 
@@ -121,6 +125,8 @@ class RequestManager:
     async def _make_async_request(self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any) ->RPCResponse:
         if callable(method):
             method = method(params)
+        if self.instrumentation is not None:
+            return await self.instrumentation.coro_make_request(self, method, params)
         middleware = self.middleware_onion.wrap(self.provider.request)
         return await middleware(method, params)
 
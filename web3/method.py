@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional,
 import warnings
 from eth_utils.curried import to_tuple
 from eth_utils.toolz import pipe
-from web3._utils.method_formatters import get_error_formatters, get_null_result_formatters, get_request_formatters, get_result_formatters
+from web3._utils.method_formatters import get_error_formatters, get_module_result_formatters, get_null_result_formatters, get_request_formatters
+from web3._utils.result_mode import apply_result_mode, skip_if_raw_request
 from web3._utils.rpc_abi import RPC
 from web3.exceptions import Web3ValidationError
 from web3.types import RPCEndpoint, TReturn
@@ -63,7 +64,8 @@ class Method(Generic[TFunc]):
         self.json_rpc_method = json_rpc_method
         self.mungers = _set_mungers(mungers, is_property)
         self.request_formatters = request_formatters or get_request_formatters
-        self.result_formatters = result_formatters or get_result_formatters
+        self.result_formatters = (skip_if_raw_request(result_formatters) if
+            result_formatters else get_module_result_formatters)
         self.null_result_formatters = (null_result_formatters or
             get_null_result_formatters)
         self.method_choice_depends_on_args = method_choice_depends_on_args
@@ -75,7 +77,7 @@ class Method(Generic[TFunc]):
             raise TypeError(
                 'Direct calls to methods are not supported. Methods must be called from an module instance, usually attached to a web3 instance.'
                 )
-        return obj.retrieve_caller_fn(self)
+        return apply_result_mode(obj, obj.retrieve_caller_fn(self))
 
     @property
     def method_selector_fn(self) -> Callable[..., Union[RPCEndpoint, Callable[..., RPCEndpoint]]]:
@@ -23,7 +23,9 @@ from .async_cache import (
 )
 from .attrdict import (
     async_attrdict_middleware,
+    async_compact_attrdict_middleware,
     attrdict_middleware,
+    compact_attrdict_middleware,
 )
 from .buffered_gas_estimate import (
     async_buffered_gas_estimate_middleware,
@@ -70,6 +72,11 @@ from .names import (
     async_name_to_address_middleware,
     name_to_address_middleware,
 )
+from .nonce import (
+    NonceManager,
+    async_construct_nonce_manager_middleware,
+    construct_nonce_manager_middleware,
+)
 from .normalize_request_parameters import (
     request_parameter_normalizer,
 )
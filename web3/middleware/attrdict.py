@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Callable, Optional, cast
 from eth_utils.toolz import assoc
-from web3.datastructures import AttributeDict
+from web3._utils.result_mode import is_raw_request
+from web3.datastructures import AttributeDict, CompactAttributeDict
 from web3.types import AsyncMiddlewareCoroutine, RPCEndpoint, RPCResponse
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
@@ -14,16 +15,37 @@ def attrdict_middleware(make_request: Callable[[RPCEndpoint, Any], Any],
 
     Note: Accessing `AttributeDict` properties via attribute
         (e.g. my_attribute_dict.property1) will not preserve typing.
+
+    Results of calls made in raw results mode are left as is.
     """
     def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
         response = make_request(method, params)
-        if 'result' in response and isinstance(response['result'], dict):
+        if 'result' in response and isinstance(response['result'], dict
+            ) and not is_raw_request():
             response = assoc(response, 'result', AttributeDict.recursive(response['result']))
         return cast(RPCResponse, response)
     
     return middleware
 
 
+def compact_attrdict_middleware(make_request: Callable[[RPCEndpoint, Any],
+    Any], _w3: 'Web3') ->Callable[[RPCEndpoint, Any], RPCResponse]:
+    """
+    Converts any result which is a dictionary into a `CompactAttributeDict`.
+
+    A drop-in replacement for the `attrdict` middleware which uses less memory
+    for large results: nested dictionaries are only wrapped when accessed.
+    """
+    def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        response = make_request(method, params)
+        if 'result' in response and isinstance(response['result'], dict
+            ) and not is_raw_request():
+            response = assoc(response, 'result', CompactAttributeDict.recursive(response['result']))
+        return cast(RPCResponse, response)
+    
+    return middleware
+
+
 async def async_attrdict_middleware(make_request: Callable[[RPCEndpoint,
     Any], Any], async_w3: 'AsyncWeb3') ->AsyncMiddlewareCoroutine:
     """
@@ -31,11 +53,32 @@ async def async_attrdict_middleware(make_request: Callable[[RPCEndpoint,
 
     Note: Accessing `AttributeDict` properties via attribute
         (e.g. my_attribute_dict.property1) will not preserve typing.
+
+    Results of calls made in raw results mode are left as is.
     """
     async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
         response = await make_request(method, params)
-        if 'result' in response and isinstance(response['result'], dict):
+        if 'result' in response and isinstance(response['result'], dict
+            ) and not is_raw_request():
             response = assoc(response, 'result', AttributeDict.recursive(response['result']))
         return cast(RPCResponse, response)
     
     return middleware
+
+
+async def async_compact_attrdict_middleware(make_request: Callable[[
+    RPCEndpoint, Any], Any], async_w3: 'AsyncWeb3') ->AsyncMiddlewareCoroutine:
+    """
+    Converts any result which is a dictionary into a `CompactAttributeDict`.
+
+    A drop-in replacement for the `attrdict` middleware which uses less memory
+    for large results: nested dictionaries are only wrapped when accessed.
+    """
+    async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        response = await make_request(method, params)
+        if 'result' in response and isinstance(response['result'], dict
+            ) and not is_raw_request():
+            response = assoc(response, 'result', CompactAttributeDict.recursive(response['result']))
+        return cast(RPCResponse, response)
+    
+    return middleware
@@ -13,6 +13,19 @@ if 'WEB3_MAX_BLOCK_REQUEST' in os.environ:
     MAX_BLOCK_REQUEST = to_int(text=os.environ['WEB3_MAX_BLOCK_REQUEST'])
 else:
     MAX_BLOCK_REQUEST = 50
+# the largest range ``get_logs_adaptive`` grows to, and the number of logs under
+# which it grows the range
+MAX_ADAPTIVE_BLOCK_REQUEST = 10000
+ADAPTIVE_TARGET_LOGS = 1000
+# parts of the messages of errors nodes reject ``eth_getLogs`` requests with
+# for returning too many logs...
+LOG_RESULTS_LIMIT_MESSAGES = ('query returned more than', 'response size',
+    'max results')
+# ... or for spanning too many blocks. Other errors about the block range, e.g.
+# "invalid block range params", aren't fixed by requesting fewer blocks
+LOG_BLOCK_RANGE_LIMIT_MESSAGES = ('block range limit', 'maximum block range',
+    'max block range', 'range too large', 'range is too large',
+    'range is too wide', 'too many blocks')
 
 
 def segment_count(start: int, stop: int, step: int=5) ->Iterable[Tuple[int,
@@ -138,6 +151,65 @@ def get_logs_multipart(w3: 'Web3', start_block: BlockNumber, stop_block:
         yield w3.eth.get_logs(params)
 
 
+def get_logs_adaptive(w3: 'Web3', start_block: BlockNumber, stop_block:
+    BlockNumber, address: Optional[Union[Address, ChecksumAddress, List[
+    Union[Address, ChecksumAddress]]]]=None, topics: Optional[List[Optional
+    [Union[_Hash32, List[_Hash32]]]]]=None, initial_blocks: int=
+    MAX_BLOCK_REQUEST, max_blocks: int=MAX_ADAPTIVE_BLOCK_REQUEST,
+    target_logs: int=ADAPTIVE_TARGET_LOGS) ->Iterable[List[LogReceipt]]:
+    """Used to break up requests to ``eth_getLogs`` into ranges the node accepts
+
+    Logs are requested ``initial_blocks`` blocks at a time at first. A range the
+    node rejects for returning too many logs or spanning too many blocks is
+    halved and requested again, and the range is doubled, up to ``max_blocks``,
+    after a request returned fewer than ``target_logs`` logs. The logs of each
+    range are yielded as they are received, in order.
+    """
+    if initial_blocks < 1 or max_blocks < 1:
+        raise ValueError(
+            'initial_blocks and max_blocks must be positive integers')
+    blocks = min(initial_blocks, max_blocks)
+    from_block = start_block
+    while from_block <= stop_block:
+        to_block = BlockNumber(min(from_block + blocks - 1, stop_block))
+        params = {'fromBlock': from_block, 'toBlock': to_block, 'address':
+            address, 'topics': topics}
+        try:
+            logs = w3.eth.get_logs(cast(FilterParams, valfilter(lambda x:
+                x is not None, params)))
+        except ValueError as e:
+            blocks, max_blocks = shrink_log_range(e, to_block - from_block +
+                1, max_blocks)
+            continue
+        yield logs
+        from_block = BlockNumber(to_block + 1)
+        if len(logs) < target_logs:
+            blocks = min(2 * blocks, max_blocks)
+
+
+def shrink_log_range(error: ValueError, blocks: int, max_blocks: int
+    ) ->Tuple[int, int]:
+    """
+    Return the number of blocks to request logs of after a request of ``blocks``
+    blocks failed with ``error``, and the largest number of blocks to request
+    from then on, or raise ``error`` if it isn't a rejection of a request that
+    can be split.
+    """
+    detail = error.args[0] if error.args else None
+    if isinstance(detail, dict):
+        message = str(detail.get('message', '')).lower()
+    else:
+        message = str(error).lower()
+    if blocks > 1 and any(part in message for part in
+        LOG_RESULTS_LIMIT_MESSAGES):
+        return blocks // 2, max_blocks
+    elif blocks > 1 and any(part in message for part in
+        LOG_BLOCK_RANGE_LIMIT_MESSAGES):
+        # the node limits the range of blocks, so it isn't grown back
+        return blocks // 2, blocks // 2
+    raise error
+
+
 class RequestLogs:
     _from_block: BlockNumber
 
@@ -247,6 +319,40 @@ async def async_get_logs_multipart(w3: 'Web3', start_block: BlockNumber,
         yield await w3.eth.get_logs(params)
 
 
+async def async_get_logs_adaptive(w3: 'Web3', start_block: BlockNumber,
+    stop_block: BlockNumber, address: Optional[Union[Address,
+    ChecksumAddress, List[Union[Address, ChecksumAddress]]]]=None, topics:
+    Optional[List[Optional[Union[_Hash32, List[_Hash32]]]]]=None,
+    initial_blocks: int=MAX_BLOCK_REQUEST, max_blocks: int=
+    MAX_ADAPTIVE_BLOCK_REQUEST, target_logs: int=ADAPTIVE_TARGET_LOGS
+    ) ->AsyncIterable[List[LogReceipt]]:
+    """Used to break up requests to ``eth_getLogs`` into ranges the node accepts
+
+    See ``get_logs_adaptive``.
+    """
+    if initial_blocks < 1 or max_blocks < 1:
+        raise ValueError(
+            'initial_blocks and max_blocks must be positive integers')
+    blocks = min(initial_blocks, max_blocks)
+    from_block = start_block
+    while from_block <= stop_block:
+        to_block = BlockNumber(min(from_block + blocks - 1, stop_block))
+        params = {'fromBlock': from_block, 'toBlock': to_block, 'address':
+            address, 'topics': topics}
+        params_with_none_dropped = cast(FilterParams, valfilter(lambda x:
+            x is not None, params))
+        try:
+            logs = await w3.eth.get_logs(params_with_none_dropped)  # type: ignore
+        except ValueError as e:
+            blocks, max_blocks = shrink_log_range(e, to_block - from_block +
+                1, max_blocks)
+            continue
+        yield logs
+        from_block = BlockNumber(to_block + 1)
+        if len(logs) < target_logs:
+            blocks = min(2 * blocks, max_blocks)
+
+
 class AsyncRequestLogs:
     _from_block: BlockNumber
 
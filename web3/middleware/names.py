@@ -1,10 +1,285 @@
-from typing import TYPE_CHECKING, Any, Callable, Dict, Sequence, Union
-from toolz import merge
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+from eth_typing import ChecksumAddress, TypeStr
+from toolz import curry, merge
+from web3._utils.empty import empty
 from web3._utils.normalizers import abi_ens_resolver, async_abi_ens_resolver
 from web3._utils.rpc_abi import RPC_ABIS, abi_request_formatters
-from web3.types import AsyncMiddlewareCoroutine, Middleware, RPCEndpoint
+from web3.types import AsyncMiddlewareCoroutine, Middleware, RPCEndpoint, RPCResponse
 from .._utils.abi import abi_data_tree, async_data_tree_map, strip_abi_type
 from .._utils.formatters import recursive_map
 from .formatting import construct_formatting_middleware
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
+# seconds a resolved name is reused before it is looked up again
+ENS_CACHE_TTL = 60.0
+ENS_CACHE_SIZE = 1024
+
+# strings that can never be ENS names: "0x" followed by hex characters only
+_HEX_STRING = re.compile(r"0[xX][0-9a-fA-F]*")
+
+
+def _address_arguments(
+    abi_types: Union[Sequence[Any], Dict[str, str]],
+) -> Tuple[Any, ...]:
+    # the indices, or the transaction fields, that hold addresses
+    if isinstance(abi_types, dict):
+        return tuple(
+            field
+            for field, abi_type in abi_types.items()
+            if abi_type.startswith("address")
+        )
+    return tuple(
+        index
+        for index, abi_type in enumerate(abi_types)
+        if abi_type is not None and abi_type.startswith("address")
+    )
+
+
+_RPC_ADDRESS_ARGUMENTS = {
+    method: _address_arguments(abi_types) for method, abi_types in RPC_ABIS.items()
+}
+_LOGS_SUBSCRIPTION_ABIS = {"address": "address", "topics": "bytes32[]"}
+
+
+def _may_be_ens_name(value: Any) -> bool:
+    if isinstance(value, str):
+        return value != "" and _HEX_STRING.fullmatch(value) is None
+    elif isinstance(value, (list, tuple)):
+        return any(_may_be_ens_name(item) for item in value)
+    return False
+
+
+def _may_contain_ens_names(method: RPCEndpoint, params: Any) -> bool:
+    """
+    Cheap pre-scan of the address-typed params of a request. Returns ``False``
+    only if none of them could be an ENS name, so the params need no resolving.
+    """
+    address_arguments = _RPC_ADDRESS_ARGUMENTS.get(method)
+    if not address_arguments:
+        return False
+    elif isinstance(address_arguments[0], str):
+        if not params:
+            return False
+        param_dict = params[0]
+        if not isinstance(param_dict, Mapping):
+            return True
+        return any(
+            _may_be_ens_name(param_dict.get(field)) for field in address_arguments
+        )
+    else:
+        return any(
+            _may_be_ens_name(params[index])
+            for index in address_arguments
+            if index < len(params)
+        )
+
+
+def _get_resolver_key(w3: Union["AsyncWeb3", "Web3"]) -> Any:
+    # ``w3.ens`` builds a new ``ENS`` on every access unless one was set, in
+    # which case names are resolved through the provider
+    ens = w3._ens
+    return w3.provider if ens is empty else ens
+
+
+class _ENSAddressCache:
+    """
+    Addresses resolved for ENS names, reused for ``ttl`` seconds as long as
+    the ``ENS`` instance set on ``w3``, or else the provider, they were
+    resolved with is still in use.
+    """
+
+    def __init__(self, ttl: float = ENS_CACHE_TTL, size: int = ENS_CACHE_SIZE) -> None:
+        self.ttl = ttl
+        self.size = size
+        self._entries: Dict[str, Tuple[Any, ChecksumAddress, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, resolver_key: Any, name: str) -> Optional[ChecksumAddress]:
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        cached_resolver_key, address, expires_at = entry
+        if cached_resolver_key is not resolver_key or time.monotonic() >= expires_at:
+            # another thread may have dropped it already
+            self._entries.pop(name, None)
+            return None
+        return address
+
+    def set(self, resolver_key: Any, name: str, address: ChecksumAddress) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.size:
+                # drop the oldest entry
+                self._entries.pop(next(iter(self._entries), None), None)
+            self._entries[name] = (resolver_key, address, time.monotonic() + self.ttl)
+
+
+@curry
+def _cached_abi_ens_resolver(
+    w3: "Web3",
+    cache: _ENSAddressCache,
+    type_str: TypeStr,
+    val: Any,
+) -> Tuple[TypeStr, Any]:
+    if type_str != "address" or w3 is None:
+        return abi_ens_resolver(w3, type_str, val)
+
+    if isinstance(val, str) and val in cache._entries:
+        address = cache.get(_get_resolver_key(w3), val)
+        if address is not None:
+            return type_str, address
+
+    type_str, resolved = abi_ens_resolver(w3, type_str, val)
+    if resolved is not val:
+        cache.set(_get_resolver_key(w3), val, resolved)
+    return type_str, resolved
+
+
+def name_to_address_middleware(
+    w3: "Web3", ens_cache_ttl: float = ENS_CACHE_TTL
+) -> Middleware:
+    normalizers = [
+        _cached_abi_ens_resolver(w3, _ENSAddressCache(ens_cache_ttl)),
+    ]
+    formatting_middleware = construct_formatting_middleware(
+        request_formatters=abi_request_formatters(normalizers, RPC_ABIS)
+    )
+
+    def ens_name_to_address_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any], _w3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        resolve_names_and_make_request = formatting_middleware(make_request, _w3)
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if _may_contain_ens_names(method, params):
+                return resolve_names_and_make_request(method, params)
+            return make_request(method, params)
+
+        return middleware
+
+    return ens_name_to_address_middleware
+
+
+# -- async -- #
+
+
+def _is_logs_subscription_with_optional_args(method: RPCEndpoint, params: Any) -> bool:
+    return method == "eth_subscribe" and len(params) == 2 and params[0] == "logs"
+
+
+async def _async_cached_abi_ens_resolver(
+    async_w3: "AsyncWeb3",
+    cache: _ENSAddressCache,
+    type_str: TypeStr,
+    val: Any,
+) -> Tuple[TypeStr, Any]:
+    if type_str != "address" or async_w3 is None:
+        return await async_abi_ens_resolver(async_w3, type_str, val)
+
+    if isinstance(val, str) and val in cache._entries:
+        address = cache.get(_get_resolver_key(async_w3), val)
+        if address is not None:
+            return type_str, address
+
+    type_str, resolved = await async_abi_ens_resolver(async_w3, type_str, val)
+    if resolved is not val:
+        cache.set(_get_resolver_key(async_w3), val, resolved)
+    return type_str, resolved
+
+
+async def async_format_all_ens_names_to_address(
+    async_web3: "AsyncWeb3",
+    abi_types_for_method: Sequence[Any],
+    data: Sequence[Any],
+    cache: Optional[_ENSAddressCache] = None,
+) -> Sequence[Any]:
+    # provide a stepwise version of what the curried formatters do
+    abi_typed_params = abi_data_tree(abi_types_for_method, data)
+    if cache is None:
+        resolver = async_abi_ens_resolver
+    else:
+
+        async def resolver(
+            async_w3: "AsyncWeb3", type_str: TypeStr, val: Any
+        ) -> Tuple[TypeStr, Any]:
+            return await _async_cached_abi_ens_resolver(async_w3, cache, type_str, val)
+
+    formatted_data_tree = await async_data_tree_map(
+        async_web3,
+        resolver,
+        abi_typed_params,
+    )
+    formatted_params = recursive_map(strip_abi_type, formatted_data_tree)
+    return formatted_params
+
+
+async def async_apply_ens_to_address_conversion(
+    async_web3: "AsyncWeb3",
+    params: Any,
+    abi_types_for_method: Union[Sequence[str], Dict[str, str]],
+    cache: Optional[_ENSAddressCache] = None,
+) -> Any:
+    if isinstance(abi_types_for_method, Sequence):
+        formatted_params = await async_format_all_ens_names_to_address(
+            async_web3, abi_types_for_method, params, cache
+        )
+        return formatted_params
+
+    elif isinstance(abi_types_for_method, dict):
+        # first arg is a dict but other args may be preset
+        # e.g. eth_call({...}, "latest")
+        # this is similar to applying a dict formatter at index 0 of the args
+        param_dict = params[0]
+        fields = list(abi_types_for_method.keys() & param_dict.keys())
+        formatted_params = await async_format_all_ens_names_to_address(
+            async_web3,
+            [abi_types_for_method[field] for field in fields],
+            [param_dict[field] for field in fields],
+            cache,
+        )
+        formatted_dict = dict(zip(fields, formatted_params))
+        formatted_params_dict = merge(param_dict, formatted_dict)
+        return (formatted_params_dict, *params[1:])
+
+    else:
+        raise TypeError(
+            f"ABI definitions must be a list or dictionary, "
+            f"got {abi_types_for_method!r}"
+        )
+
+
+async def async_name_to_address_middleware(
+    make_request: Callable[[RPCEndpoint, Any], Any],
+    async_w3: "AsyncWeb3",
+) -> AsyncMiddlewareCoroutine:
+    cache = _ENSAddressCache()
+
+    async def middleware(method: RPCEndpoint, params: Any) -> Any:
+        abi_types_for_method = RPC_ABIS.get(method, None)
+
+        if abi_types_for_method is not None:
+            if _is_logs_subscription_with_optional_args(method, params):
+                # eth_subscribe optional logs params are unique.
+                # Handle them separately here.
+                (formatted_dict,) = await async_apply_ens_to_address_conversion(
+                    async_w3,
+                    (params[1],),
+                    _LOGS_SUBSCRIPTION_ABIS,
+                    cache,
+                )
+                params = (params[0], formatted_dict)
+
+            elif _may_contain_ens_names(method, params):
+                params = await async_apply_ens_to_address_conversion(
+                    async_w3,
+                    params,
+                    abi_types_for_method,
+                    cache,
+                )
+        return await make_request(method, params)
+
+    return middleware
@@ -0,0 +1,265 @@
+import asyncio
+from collections import (
+    OrderedDict,
+)
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+)
+
+from eth_utils import (
+    is_address,
+    to_checksum_address,
+)
+
+from web3._utils.method_formatters import (
+    to_integer_if_hex,
+)
+from web3.types import (
+    AsyncMiddleware,
+    AsyncMiddlewareCoroutine,
+    Middleware,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+SEND_TRANSACTION_METHODS = ("eth_sendTransaction",)
+BLOCK_METHODS = ("eth_getBlockByNumber", "eth_getBlockByHash")
+# the number of recent block hashes kept to detect reorgs
+BLOCK_HASH_HISTORY = 128
+
+
+class NonceManager:
+    """
+    Local, per-account transaction nonces. Each account is seeded once with its
+    pending transaction count and counts up from there. An account is seeded
+    again after a failed send. All accounts are seeded again after a reorg is
+    seen in the block responses passing through the middleware.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._nonces: Dict[str, int] = {}
+        self._block_hashes: "OrderedDict[int, Any]" = OrderedDict()
+        self._head: Optional[int] = None
+
+    def reset(self, account: Optional[str] = None) -> None:
+        """
+        Seed ``account``, or every account, again on its next transaction.
+        """
+        with self._lock:
+            if account is None:
+                self._nonces.clear()
+            else:
+                self._nonces.pop(_account_key(account), None)
+
+    def _take(self, account: str) -> Optional[int]:
+        with self._lock:
+            nonce = self._nonces.get(account)
+            if nonce is not None:
+                self._nonces[account] = nonce + 1
+            return nonce
+
+    def _seed(self, account: str, nonce: int) -> int:
+        with self._lock:
+            # a nonce sent explicitly in the meantime may be ahead of the node
+            nonce = max(nonce, self._nonces.get(account, nonce))
+            self._nonces[account] = nonce + 1
+            return nonce
+
+    def _sent(self, account: str, nonce: int) -> None:
+        with self._lock:
+            if account in self._nonces and self._nonces[account] <= nonce:
+                self._nonces[account] = nonce + 1
+
+    def _observe(self, method: RPCEndpoint, response: RPCResponse) -> None:
+        result = response.get("result")
+        if not result:
+            return
+        if method == "eth_blockNumber":
+            self._observe_head(to_integer_if_hex(result))
+        elif method in BLOCK_METHODS and "number" in result and "hash" in result:
+            number = to_integer_if_hex(result["number"])
+            self._observe_head(number)
+            with self._lock:
+                previous_hash = self._block_hashes.get(number)
+                parent_hash = self._block_hashes.get(number - 1)
+                if (
+                    previous_hash is not None
+                    and previous_hash != result["hash"]
+                    or parent_hash is not None
+                    and "parentHash" in result
+                    and parent_hash != result["parentHash"]
+                ):
+                    self._reorg()
+                self._block_hashes[number] = result["hash"]
+                while len(self._block_hashes) > BLOCK_HASH_HISTORY:
+                    self._block_hashes.popitem(last=False)
+
+    def _observe_head(self, number: int) -> None:
+        with self._lock:
+            if self._head is not None and number < self._head:
+                self._reorg()
+            self._head = number
+
+    def _reorg(self) -> None:
+        # called with the lock held
+        self._nonces.clear()
+        self._block_hashes.clear()
+        self._head = None
+
+
+def _account_key(account: str) -> str:
+    return to_checksum_address(account) if is_address(account) else account
+
+
+def _get_transaction_count_params(account: str) -> Any:
+    return [account, "pending"]
+
+
+def _needs_nonce(method: RPCEndpoint, params: Any) -> bool:
+    if method not in SEND_TRANSACTION_METHODS or not params:
+        return False
+    transaction = params[0]
+    return (
+        isinstance(transaction, dict)
+        and transaction.get("from") is not None
+        and transaction.get("nonce") is None
+    )
+
+
+def construct_nonce_manager_middleware(
+    nonce_manager: Optional[NonceManager] = None,
+) -> Middleware:
+    """
+    Fill in the nonce of sent transactions from a local per-account counter
+    rather than asking the node for every transaction. Transactions sent at the
+    same time get distinct nonces.
+
+    Pass a ``NonceManager`` to be able to ``reset()`` the counters.
+    """
+    if nonce_manager is None:
+        nonce_manager = NonceManager()
+    seed_locks: Dict[str, threading.Lock] = {}
+    seed_locks_lock = threading.Lock()
+
+    def nonce_manager_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any], w3: "Web3"
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in SEND_TRANSACTION_METHODS:
+                response = make_request(method, params)
+                nonce_manager._observe(method, response)
+                return response
+
+            transaction = params[0]
+            account = _account_key(transaction.get("from", ""))
+            if _needs_nonce(method, params):
+                nonce = nonce_manager._take(account)
+                if nonce is None:
+                    with seed_locks_lock:
+                        seed_lock = seed_locks.setdefault(account, threading.Lock())
+                    with seed_lock:
+                        nonce = nonce_manager._take(account)
+                        if nonce is None:
+                            count_response = make_request(
+                                RPCEndpoint("eth_getTransactionCount"),
+                                _get_transaction_count_params(transaction["from"]),
+                            )
+                            if "error" in count_response:
+                                return count_response
+                            nonce = nonce_manager._seed(
+                                account, to_integer_if_hex(count_response["result"])
+                            )
+                transaction = dict(transaction, nonce=nonce)
+                params = [transaction, *params[1:]]
+
+            try:
+                response = make_request(method, params)
+            except Exception:
+                nonce_manager.reset(account)
+                raise
+
+            if "error" in response:
+                nonce_manager.reset(account)
+            elif transaction.get("nonce") is not None:
+                nonce_manager._sent(account, to_integer_if_hex(transaction["nonce"]))
+            return response
+
+        return middleware
+
+    return nonce_manager_middleware
+
+
+# -- async -- #
+
+
+async def async_construct_nonce_manager_middleware(
+    nonce_manager: Optional[NonceManager] = None,
+) -> AsyncMiddleware:
+    """
+    Fill in the nonce of sent transactions from a local per-account counter
+    rather than asking the node for every transaction. Transactions sent at the
+    same time get distinct nonces.
+
+    Pass a ``NonceManager`` to be able to ``reset()`` the counters.
+    """
+    if nonce_manager is None:
+        nonce_manager = NonceManager()
+    seed_locks: Dict[str, asyncio.Lock] = {}
+
+    async def async_nonce_manager_middleware(
+        make_request: Callable[[RPCEndpoint, Any], Any], async_w3: "AsyncWeb3"
+    ) -> AsyncMiddlewareCoroutine:
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in SEND_TRANSACTION_METHODS:
+                response = await make_request(method, params)
+                nonce_manager._observe(method, response)
+                return response
+
+            transaction = params[0]
+            account = _account_key(transaction.get("from", ""))
+            if _needs_nonce(method, params):
+                nonce = nonce_manager._take(account)
+                if nonce is None:
+                    seed_lock = seed_locks.setdefault(account, asyncio.Lock())
+                    async with seed_lock:
+                        nonce = nonce_manager._take(account)
+                        if nonce is None:
+                            count_response = await make_request(
+                                RPCEndpoint("eth_getTransactionCount"),
+                                _get_transaction_count_params(transaction["from"]),
+                            )
+                            if "error" in count_response:
+                                return count_response
+                            nonce = nonce_manager._seed(
+                                account, to_integer_if_hex(count_response["result"])
+                            )
+                transaction = dict(transaction, nonce=nonce)
+                params = [transaction, *params[1:]]
+
+            try:
+                response = await make_request(method, params)
+            except Exception:
+                nonce_manager.reset(account)
+                raise
+
+            if "error" in response:
+                nonce_manager.reset(account)
+            elif transaction.get("nonce") is not None:
+                nonce_manager._sent(account, to_integer_if_hex(transaction["nonce"]))
+            return response
+
+        return middleware
+
+    return async_nonce_manager_middleware
@@ -1,12 +1,19 @@
 import time
-from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Collection
 from web3.exceptions import StaleBlockchain
 from web3.types import AsyncMiddleware, AsyncMiddlewareCoroutine, BlockData, Middleware, RPCEndpoint, RPCResponse
+from web3.utils.head_tracker import get_async_head_tracker, get_head_tracker
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, Web3
 SKIP_STALECHECK_FOR_METHODS = 'eth_getBlockByNumber',
 
 
+def _is_fresh(block: BlockData, allowable_delay: int) ->bool:
+    if block and time.time() - block['timestamp'] <= allowable_delay:
+        return True
+    return False
+
+
 def make_stalecheck_middleware(allowable_delay: int,
     skip_stalecheck_for_methods: Collection[str]=SKIP_STALECHECK_FOR_METHODS
     ) ->Middleware:
@@ -20,16 +27,25 @@ def make_stalecheck_middleware(allowable_delay: int,
 
     If the latest block in the chain is older than 5 minutes in this example, then the
     middleware will raise a StaleBlockchain exception.
+
+    The latest block is read from the provider's shared head tracker (see
+    ``web3.utils.get_head_tracker``).
     """
-    def stalecheck_middleware(make_request: Callable[[RPCEndpoint, Any], Any], w3: 'Web3') -> Callable[[RPCEndpoint, Any], RPCResponse]:
-        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+    if allowable_delay <= 0:
+        raise ValueError(
+            'You must set a positive allowable_delay in seconds for this middleware'
+            )
+
+    def stalecheck_middleware(make_request: Callable[[RPCEndpoint, Any],
+        Any], w3: 'Web3') ->Callable[[RPCEndpoint, Any], RPCResponse]:
+
+        def middleware(method: RPCEndpoint, params: Any) ->RPCResponse:
             if method not in skip_stalecheck_for_methods:
-                latest_block = w3.eth.get_block('latest')
-                if latest_block is None:
-                    raise StaleBlockchain("Latest block is None")
-                last_block_time = latest_block['timestamp']
-                if time.time() - last_block_time > allowable_delay:
-                    raise StaleBlockchain(f"The latest block is {time.time() - last_block_time} seconds old, which exceeds the allowable delay of {allowable_delay} seconds")
+                head_tracker = get_head_tracker(w3)
+                if not _is_fresh(head_tracker.head, allowable_delay):
+                    latest = head_tracker.latest(w3)
+                    if not _is_fresh(latest, allowable_delay):
+                        raise StaleBlockchain(latest, allowable_delay)
             return make_request(method, params)
         return middleware
     return stalecheck_middleware
@@ -48,16 +64,25 @@ async def async_make_stalecheck_middleware(allowable_delay: int,
 
     If the latest block in the chain is older than 5 minutes in this example, then the
     middleware will raise a StaleBlockchain exception.
+
+    The latest block is read from the provider's shared head tracker (see
+    ``web3.utils.get_async_head_tracker``).
     """
-    async def stalecheck_middleware(make_request: Callable[[RPCEndpoint, Any], Any], w3: 'AsyncWeb3') -> AsyncMiddlewareCoroutine:
-        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+    if allowable_delay <= 0:
+        raise ValueError(
+            'You must set a positive allowable_delay in seconds for this middleware'
+            )
+
+    async def stalecheck_middleware(make_request: Callable[[RPCEndpoint,
+        Any], Any], w3: 'AsyncWeb3') ->AsyncMiddlewareCoroutine:
+
+        async def middleware(method: RPCEndpoint, params: Any) ->RPCResponse:
             if method not in skip_stalecheck_for_methods:
-                latest_block = await w3.eth.get_block('latest')
-                if latest_block is None:
-                    raise StaleBlockchain("Latest block is None")
-                last_block_time = latest_block['timestamp']
-                if time.time() - last_block_time > allowable_delay:
-                    raise StaleBlockchain(f"The latest block is {time.time() - last_block_time} seconds old, which exceeds the allowable delay of {allowable_delay} seconds")
+                head_tracker = get_async_head_tracker(w3)
+                if not _is_fresh(head_tracker.head, allowable_delay):
+                    latest = await head_tracker.latest(w3)
+                    if not _is_fresh(latest, allowable_delay):
+                        raise StaleBlockchain(latest, allowable_delay)
             return await make_request(method, params)
         return middleware
     return stalecheck_middleware
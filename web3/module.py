@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional, Type
 from eth_abi.codec import ABICodec
 from eth_utils.toolz import curry, pipe
 from web3._utils.filters import AsyncLogFilter, LogFilter, _UseExistingFilter
+from web3._utils.result_mode import raw_results_mode  # noqa: F401
 from web3.method import Method
 from web3.providers.persistent import PersistentConnectionProvider
 from web3.types import RPCEndpoint, RPCResponse
@@ -12,6 +13,7 @@ TReturn = TypeVar('TReturn')
 
 class Module:
     is_async = False
+    raw_results: bool = False
 
     def __init__(self, w3: Union['AsyncWeb3', 'Web3']) ->None:
         if self.is_async:
@@ -15,6 +15,12 @@ from .eth_tester import (
 from .ipc import (
     IPCProvider,
 )
+from .replay import (
+    AsyncRecordingProvider,
+    AsyncReplayProvider,
+    RecordingProvider,
+    ReplayProvider,
+)
 from .rpc import (
     HTTPProvider,
 )
@@ -33,6 +39,8 @@ __all__ = [
     "AsyncBaseProvider",
     "AsyncEthereumTesterProvider",
     "AsyncHTTPProvider",
+    "AsyncRecordingProvider",
+    "AsyncReplayProvider",
     "AutoProvider",
     "BaseProvider",
     "EthereumTesterProvider",
@@ -40,6 +48,8 @@ __all__ = [
     "IPCProvider",
     "JSONBaseProvider",
     "PersistentConnectionProvider",
+    "RecordingProvider",
+    "ReplayProvider",
     "WebsocketProvider",
     "WebsocketProviderV2",
 ]
@@ -1,5 +1,5 @@
 import itertools
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional, Sequence, Tuple, cast
 from eth_utils import is_text, to_bytes, to_text
 from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
 from web3.exceptions import ProviderConnectionError
@@ -7,12 +7,15 @@ from web3.middleware import async_combine_middlewares
 from web3.types import AsyncMiddleware, AsyncMiddlewareOnion, MiddlewareOnion, RPCEndpoint, RPCResponse
 if TYPE_CHECKING:
     from web3 import AsyncWeb3, WebsocketProviderV2
+    from web3.utils.head_tracker import AsyncHeadTracker
 
 
 class AsyncBaseProvider:
     _middlewares: Tuple[AsyncMiddleware, ...] = ()
     _request_func_cache: Tuple[Tuple[AsyncMiddleware, ...], Callable[...,
         Coroutine[Any, Any, RPCResponse]]] = (None, None)
+    _chain_constants: Optional[Dict[str, Any]] = None
+    _head_tracker: Optional['AsyncHeadTracker'] = None
     is_async = True
     has_persistent_connection = False
     global_ccip_read_enabled: bool = True
@@ -5,6 +5,7 @@ from eth_typing import URI
 from eth_utils import to_dict
 from web3._utils.http import construct_user_agent
 from web3._utils.request import async_cache_and_return_session as _async_cache_and_return_session, async_make_post_request, get_default_http_endpoint
+from web3.instrumentation import report_response_size
 from web3.types import AsyncMiddleware, RPCEndpoint, RPCResponse
 from ..datastructures import NamedElementOnion
 from ..middleware.exception_retry_request import async_http_retry_request_middleware
@@ -29,3 +30,27 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
 
     def __str__(self) ->str:
         return f'RPC connection {self.endpoint_uri}'
+
+    @to_dict
+    def get_request_kwargs(self) ->Iterable[Tuple[str, Any]]:
+        if 'headers' not in self._request_kwargs:
+            yield 'headers', self.get_request_headers()
+        for key, value in self._request_kwargs.items():
+            yield key, value
+
+    def get_request_headers(self) ->Dict[str, str]:
+        return {'Content-Type': 'application/json', 'User-Agent':
+            construct_user_agent(str(type(self)))}
+
+    async def make_request(self, method: RPCEndpoint, params: Any) ->RPCResponse:
+        self.logger.debug(
+            f'Making request HTTP. URI: {self.endpoint_uri}, Method: {method}')
+        request_data = self.encode_rpc_request(method, params)
+        raw_response = await async_make_post_request(self.endpoint_uri, request_data, **
+            self.get_request_kwargs())
+        report_response_size(len(raw_response))
+        response = self.decode_rpc_response(raw_response)
+        self.logger.debug(
+            f'Getting response HTTP. URI: {self.endpoint_uri}, Method: {method}, Response: {response}'
+            )
+        return response
@@ -1,5 +1,5 @@
 import itertools
-from typing import TYPE_CHECKING, Any, Callable, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple, cast
 from eth_utils import to_bytes, to_text
 from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
 from web3.exceptions import ProviderConnectionError
@@ -7,12 +7,15 @@ from web3.middleware import combine_middlewares
 from web3.types import Middleware, MiddlewareOnion, RPCEndpoint, RPCResponse
 if TYPE_CHECKING:
     from web3 import Web3
+    from web3.utils.head_tracker import HeadTracker
 
 
 class BaseProvider:
     _middlewares: Tuple[Middleware, ...] = ()
     _request_func_cache: Tuple[Tuple[Middleware, ...], Callable[...,
         RPCResponse]] = (None, None)
+    _chain_constants: Optional[Dict[str, Any]] = None
+    _head_tracker: Optional['HeadTracker'] = None
     is_async = False
     has_persistent_connection = False
     global_ccip_read_enabled: bool = True
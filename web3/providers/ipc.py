@@ -8,6 +8,7 @@ import threading
 from types import TracebackType
 from typing import Any, Optional, Type, Union
 from web3._utils.threads import Timeout
+from web3.instrumentation import report_response_size
 from web3.types import RPCEndpoint, RPCResponse
 from .base import JSONBaseProvider
 
@@ -78,6 +79,7 @@ class IPCProvider(JSONBaseProvider):
                             break
             except (ConnectionError, OSError) as e:
                 raise ConnectionError(f"Could not connect to IPC socket at path: {self.ipc_path}") from e
+        report_response_size(len(response_raw))
         return self.decode_rpc_response(response_raw)
 
     def isConnected(self) -> bool:
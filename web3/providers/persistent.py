@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 from websockets import ConnectionClosed, ConnectionClosedOK, WebSocketClientProtocol, WebSocketException
 from web3._utils.caching import generate_cache_key
+from web3._utils.chain_constants import clear_chain_constants
 from web3.exceptions import ProviderConnectionError, TaskNotRunning, TimeExhausted
 from web3.providers.async_base import AsyncJSONBaseProvider
 from web3.providers.websocket.request_processor import RequestProcessor
@@ -103,6 +104,7 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         """
         if not self.endpoint_uri:
             raise ValueError("No endpoint URI specified")
+        clear_chain_constants(self)
         
         try:
             self._ws = await asyncio.wait_for(
@@ -128,6 +130,7 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             except asyncio.CancelledError:
                 pass
         self._listen_event.clear()
+        clear_chain_constants(self)
 
     async def is_connected(self) ->bool:
         """
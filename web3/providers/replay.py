@@ -0,0 +1,284 @@
+import asyncio
+from collections import (
+    defaultdict,
+)
+import json
+import os
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+    cast,
+)
+
+from web3._utils.encoding import (
+    Web3JsonEncoder,
+)
+from web3.providers.async_base import (
+    AsyncBaseProvider,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.types import (
+    AsyncMiddleware,
+    Middleware,
+    MiddlewareOnion,
+    RPCEndpoint,
+    RPCResponse,
+)
+
+
+def _request_key(method: RPCEndpoint, params: Any) -> str:
+    return json.dumps(
+        [method, params or []],
+        cls=Web3JsonEncoder,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+class _RecordingWriter:
+    """
+    Append request/response pairs to a JSON lines file, one object per line
+    with ``method``, ``params``, ``response`` and ``elapsed`` (seconds) keys.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    def write(
+        self, method: RPCEndpoint, params: Any, response: RPCResponse, elapsed: float
+    ) -> None:
+        line = json.dumps(
+            {
+                "method": method,
+                "params": params or [],
+                "response": response,
+                "elapsed": round(elapsed, 6),
+            },
+            cls=Web3JsonEncoder,
+            separators=(",", ":"),
+        )
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _Recording:
+    """
+    Recorded responses by request. Repeated requests get their recorded
+    responses in order, and the last one once those run out.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self._responses: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        with open(path, encoding="utf-8") as recording:
+            for line in recording:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = _request_key(entry["method"], entry["params"])
+                self._responses[key].append(
+                    (
+                        json.dumps(entry["response"], separators=(",", ":")),
+                        entry.get("elapsed", 0.0),
+                    )
+                )
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def next_response(
+        self, method: RPCEndpoint, params: Any
+    ) -> Tuple[Optional[str], float]:
+        key = _request_key(method, params)
+        responses = self._responses.get(key)
+        if not responses:
+            return None, 0.0
+        with self._lock:
+            position = self._positions[key]
+            self._positions[key] = min(position + 1, len(responses) - 1)
+        return responses[position]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._positions.clear()
+
+
+def _decode_response(
+    method: RPCEndpoint, params: Any, raw_response: Optional[str]
+) -> RPCResponse:
+    if raw_response is None:
+        return cast(
+            RPCResponse,
+            {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32000,
+                    "message": f"No recorded response for {method} with params "
+                    f"{params!r}",
+                },
+            },
+        )
+    # decode on every request, like a provider reading from the network
+    return cast(RPCResponse, json.loads(raw_response))
+
+
+class RecordingProvider(BaseProvider):
+    """
+    Wraps ``provider`` and appends each request it makes, with the response
+    and the time it took, to the JSON lines file at ``path``. Replay the file
+    with ``ReplayProvider``.
+
+    The wrapped provider's own middlewares still run, and are not recorded.
+    """
+
+    def __init__(
+        self, provider: BaseProvider, path: Union[str, "os.PathLike[str]"]
+    ) -> None:
+        self.provider = provider
+        self._writer = _RecordingWriter(path)
+
+    @property
+    def middlewares(self) -> Tuple[Middleware, ...]:
+        return self.provider.middlewares
+
+    @middlewares.setter
+    def middlewares(self, values: MiddlewareOnion) -> None:
+        self.provider.middlewares = values
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        start = time.perf_counter()
+        response = self.provider.make_request(method, params)
+        self._writer.write(method, params, response, time.perf_counter() - start)
+        return response
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return self.provider.is_connected(show_traceback)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ReplayProvider(BaseProvider):
+    """
+    Serves the responses recorded by ``RecordingProvider`` without a node.
+    Each response is delayed by ``latency`` seconds, plus the recorded time
+    when ``use_recorded_latency`` is set.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        latency: float = 0.0,
+        use_recorded_latency: bool = False,
+    ) -> None:
+        self.latency = latency
+        self.use_recorded_latency = use_recorded_latency
+        self._recording = _Recording(path)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        raw_response, elapsed = self._recording.next_response(method, params)
+        delay = self.latency + (elapsed if self.use_recorded_latency else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        return _decode_response(method, params, raw_response)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    def reset(self) -> None:
+        """
+        Serve repeated requests from their first recorded response again.
+        """
+        self._recording.reset()
+
+
+# -- async -- #
+
+
+class AsyncRecordingProvider(AsyncBaseProvider):
+    """
+    Wraps an async ``provider`` and appends each request it makes, with the
+    response and the time it took, to the JSON lines file at ``path``. Replay
+    the file with ``AsyncReplayProvider``.
+
+    The wrapped provider's own middlewares still run, and are not recorded.
+    """
+
+    def __init__(
+        self, provider: AsyncBaseProvider, path: Union[str, "os.PathLike[str]"]
+    ) -> None:
+        self.provider = provider
+        self._writer = _RecordingWriter(path)
+
+    @property
+    def middlewares(self) -> Tuple[AsyncMiddleware, ...]:
+        return self.provider.middlewares
+
+    @middlewares.setter
+    def middlewares(self, values: MiddlewareOnion) -> None:
+        self.provider.middlewares = values
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        start = time.perf_counter()
+        response = await self.provider.make_request(method, params)
+        self._writer.write(method, params, response, time.perf_counter() - start)
+        return response
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return await self.provider.is_connected(show_traceback)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class AsyncReplayProvider(AsyncBaseProvider):
+    """
+    Serves the responses recorded by ``AsyncRecordingProvider`` or
+    ``RecordingProvider`` without a node. Each response is delayed by
+    ``latency`` seconds, plus the recorded time when ``use_recorded_latency``
+    is set.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        latency: float = 0.0,
+        use_recorded_latency: bool = False,
+    ) -> None:
+        self.latency = latency
+        self.use_recorded_latency = use_recorded_latency
+        self._recording = _Recording(path)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        raw_response, elapsed = self._recording.next_response(method, params)
+        delay = self.latency + (elapsed if self.use_recorded_latency else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return _decode_response(method, params, raw_response)
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    def reset(self) -> None:
+        """
+        Serve repeated requests from their first recorded response again.
+        """
+        self._recording.reset()
@@ -5,6 +5,7 @@ from eth_utils import to_dict
 from web3._utils.http import construct_user_agent
 from web3._utils.request import cache_and_return_session, get_default_http_endpoint, make_post_request
 from web3.datastructures import NamedElementOnion
+from web3.instrumentation import report_response_size
 from web3.middleware import http_retry_request_middleware
 from web3.types import Middleware, RPCEndpoint, RPCResponse
 from .base import JSONBaseProvider
@@ -32,3 +33,27 @@ class HTTPProvider(JSONBaseProvider):
 
     def __str__(self) ->str:
         return f'RPC connection {self.endpoint_uri}'
+
+    @to_dict
+    def get_request_kwargs(self) ->Iterable[Tuple[str, Any]]:
+        if 'headers' not in self._request_kwargs:
+            yield 'headers', self.get_request_headers()
+        for key, value in self._request_kwargs.items():
+            yield key, value
+
+    def get_request_headers(self) ->Dict[str, str]:
+        return {'Content-Type': 'application/json', 'User-Agent':
+            construct_user_agent(str(type(self)))}
+
+    def make_request(self, method: RPCEndpoint, params: Any) ->RPCResponse:
+        self.logger.debug(
+            f'Making request HTTP. URI: {self.endpoint_uri}, Method: {method}')
+        request_data = self.encode_rpc_request(method, params)
+        raw_response = make_post_request(self.endpoint_uri, request_data, **
+            self.get_request_kwargs())
+        report_response_size(len(raw_response))
+        response = self.decode_rpc_response(raw_response)
+        self.logger.debug(
+            f'Getting response HTTP. URI: {self.endpoint_uri}, Method: {method}, Response: {response}'
+            )
+        return response
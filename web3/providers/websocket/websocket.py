@@ -9,6 +9,7 @@ from eth_typing import URI
 from websockets.client import connect
 from websockets.legacy.client import WebSocketClientProtocol
 from web3.exceptions import Web3ValidationError
+from web3.instrumentation import report_response_size
 from web3.providers.base import JSONBaseProvider
 from web3.types import RPCEndpoint, RPCResponse
 RESTRICTED_WEBSOCKET_KWARGS = {'uri', 'loop'}
@@ -69,6 +70,10 @@ class WebsocketProvider(JSONBaseProvider):
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         request_data = self.encode_rpc_request(method, params)
         response = self._loop.run_until_complete(self._make_request(request_data))
+        # text frames are decoded, report their size in bytes like the other
+        # providers
+        report_response_size(len(response.encode('utf-8') if isinstance(
+            response, str) else response))
         return self.decode_rpc_response(response)
 
     async def _make_request(self, request_data: str) -> str:
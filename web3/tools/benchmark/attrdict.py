@@ -0,0 +1,148 @@
+"""
+Offline benchmark for holding full blocks in memory as plain dictionaries, as an
+``AttributeDict`` and as a ``CompactAttributeDict``. No node is required:
+
+    python web3/tools/benchmark/attrdict.py --num-calls 200
+"""
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from web3._utils.method_formatters import (
+    block_formatter,
+)
+from web3.datastructures import (
+    AttributeDict,
+    CompactAttributeDict,
+)
+from web3.tools.benchmark.formatters import (
+    make_raw_block,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=200,
+    help="The number of blocks to hold in memory",
+)
+parser.add_argument(
+    "--num-transactions",
+    type=int,
+    default=150,
+    help="The number of full transactions in each block",
+)
+
+
+def measure_memory(make_block: Callable[[], Any], n: int) -> Tuple[List[Any], float]:
+    """
+    Return ``n`` blocks and the memory they hold on to, in bytes per block.
+    """
+    tracemalloc.start()
+    try:
+        blocks = [make_block() for _ in range(n)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return blocks, size / n
+
+
+def read_transactions(block: Any) -> Any:
+    for transaction in block["transactions"]:
+        transaction["hash"]
+    return block
+
+
+def time_calls(func: Callable[[], Any], n: int) -> float:
+    start = timeit.default_timer()
+    for _ in range(n):
+        func()
+    return timeit.default_timer() - start
+
+
+def main(
+    logger: logging.Logger, num_calls: int, num_transactions: int = 150
+) -> Dict[str, Dict[str, float]]:
+    raw_json = json.dumps(make_raw_block(num_transactions))
+    _, raw_size = measure_memory(lambda: json.loads(raw_json), num_calls)
+    wrappers: Dict[str, Callable[[Any], Any]] = {
+        "AttributeDict": AttributeDict.recursive,
+        "CompactAttributeDict": CompactAttributeDict.recursive,
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    logger.info(f"Raw JSON dict: {raw_size:.0f} bytes / block")
+    logger.info(
+        "|{:^22}|{:^16}|{:^16}|{:^16}|{:^16}|{:^16}|".format(
+            f"Blocks ({num_calls})",
+            "bytes / block",
+            "after reading",
+            "wrap",
+            "hash (x2)",
+            "access",
+        )
+    )
+    logger.info("-" * 109)
+    for name, wrap in wrappers.items():
+        blocks, size = measure_memory(
+            lambda: wrap(block_formatter(json.loads(raw_json))), num_calls
+        )
+        _, read_size = measure_memory(
+            lambda: read_transactions(wrap(block_formatter(json.loads(raw_json)))),
+            num_calls,
+        )
+        formatted_blocks = iter(
+            [block_formatter(json.loads(raw_json)) for _ in range(num_calls)]
+        )
+        wrap_time = time_calls(lambda: wrap(next(formatted_blocks)), num_calls)
+
+        unhashed_blocks = iter(blocks)
+
+        def hash_block() -> None:
+            block = next(unhashed_blocks)
+            hash(block)
+            hash(block)
+
+        hash_time = time_calls(hash_block, num_calls)
+
+        def access_block() -> None:
+            for transaction in blocks[0].transactions:
+                transaction.hash
+
+        access_time = time_calls(access_block, num_calls)
+
+        results[name] = {
+            "bytes_per_block": size,
+            "bytes_per_block_after_reading": read_size,
+            "wrap": wrap_time,
+            "hash": hash_time,
+            "access": access_time,
+        }
+        logger.info(
+            "|{:^22}|{:^16.0f}|{:^16.0f}|{:^16.6}|{:^16.6}|{:^16.6}|".format(
+                name, size, read_size, wrap_time, hash_time, access_time
+            )
+        )
+    logger.info("-" * 109)
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls, args.num_transactions)
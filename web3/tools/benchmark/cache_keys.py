@@ -0,0 +1,146 @@
+"""
+Offline benchmark for ``web3._utils.caching.generate_cache_key`` over realistic
+JSON-RPC params. No node is required:
+
+    python web3/tools/benchmark/cache_keys.py --num-calls 10000
+"""
+
+import argparse
+import hashlib
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from eth_utils import (
+    is_boolean,
+    is_bytes,
+    is_dict,
+    is_list_like,
+    is_null,
+    is_number,
+    is_text,
+    to_bytes,
+)
+
+from web3._utils.caching import (
+    generate_cache_key,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=10000,
+    help="The number of cache keys to generate per params set",
+)
+
+
+def _address(i: int) -> str:
+    return "0x" + f"{i:040x}"
+
+
+def _topic(i: int) -> str:
+    return "0x" + f"{i:064x}"
+
+
+GET_LOGS_FILTER = {
+    "fromBlock": "0x12a05f2",
+    "toBlock": "0x12a0dc2",
+    "address": [_address(i) for i in range(50)],
+    "topics": [
+        _topic(0xDDF252AD),
+        [_topic(i) for i in range(20)],
+        None,
+    ],
+}
+
+ETH_CALL_TX = {
+    "from": _address(1),
+    "to": _address(2),
+    "gas": "0x1c9c380",
+    "data": "0x70a08231" + "00" * 2048,
+}
+
+CACHE_KEY_PARAMS: List[Tuple[str, Any]] = [
+    ("eth_chainId", ("eth_chainId", [])),
+    ("eth_getBlockByNumber", ("eth_getBlockByNumber", ["latest", True])),
+    ("eth_call", ("eth_call", [ETH_CALL_TX, "latest"])),
+    ("eth_getLogs", ("eth_getLogs", [GET_LOGS_FILTER])),
+    ("eth_getLogs (AttributeDict)", ("eth_getLogs", [AttributeDict(GET_LOGS_FILTER)])),
+]
+
+
+def repr_cache_key(value: Any) -> str:
+    """
+    The previous ``str()`` based key generation, kept here as the baseline.
+    """
+    if is_null(value):
+        return "null"
+    elif is_boolean(value):
+        return "bool:%s" % str(value).lower()
+    elif is_number(value):
+        return "num:%d" % value
+    elif is_text(value):
+        return "text:%s" % value
+    elif is_bytes(value):
+        return "bytes:%s" % hashlib.md5(value).hexdigest()
+    elif is_list_like(value):
+        return "list:%s" % hashlib.md5(to_bytes(text=str(value))).hexdigest()
+    elif is_dict(value):
+        return (
+            "dict:%s"
+            % hashlib.md5(to_bytes(text=str(sorted(value.items())))).hexdigest()
+        )
+    else:
+        return "obj:%s" % hashlib.md5(to_bytes(text=str(value))).hexdigest()
+
+
+def time_calls(func: Callable[[], Any], n: int) -> float:
+    start = timeit.default_timer()
+    for _ in range(n):
+        func()
+    return timeit.default_timer() - start
+
+
+def main(logger: logging.Logger, num_calls: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    logger.info(
+        "|{:^30}|{:^20}|{:^20}|".format(
+            f"Params ({num_calls} keys)", "generate_cache_key", "repr + md5"
+        )
+    )
+    logger.info("-" * 74)
+    for name, params in CACHE_KEY_PARAMS:
+        results[name] = {
+            "generate_cache_key": time_calls(
+                lambda: generate_cache_key(params), num_calls
+            ),
+            "repr + md5": time_calls(lambda: repr_cache_key(params), num_calls),
+        }
+        logger.info(
+            "|{:^30}|{:^20.10}|{:^20.10}|".format(
+                name, results[name]["generate_cache_key"], results[name]["repr + md5"]
+            )
+        )
+    logger.info("-" * 74)
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
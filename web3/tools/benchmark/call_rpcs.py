@@ -0,0 +1,127 @@
+"""
+Offline benchmark counting the RPCs, and timing, a read-only contract call
+with and without ``fill_transaction_defaults`` run on the call transaction.
+Contract calls take the read-only path, which sends ``eth_call`` alone.
+Requests are answered in-process by a ``StubResponder``:
+
+    python web3/tools/benchmark/call_rpcs.py --num-calls 1000
+"""
+
+import argparse
+from collections import (
+    Counter,
+)
+import logging
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+)
+
+from web3 import (
+    Web3,
+)
+from web3._utils.transactions import (
+    fill_transaction_defaults,
+)
+from web3.tools.benchmark.hot_paths import (
+    ERC20_ABI,
+    HOLDER_ADDRESS,
+    TOKEN_ADDRESS,
+    StubProvider,
+    time_calls,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+    TxParams,
+    Wei,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=1000,
+    help="The number of contract calls to make",
+)
+
+
+class CountingStubProvider(StubProvider):
+    """
+    A ``StubProvider`` that counts the requests it answers, by method.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: Counter[str] = Counter()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.counts[method] += 1
+        return super().make_request(method, params)
+
+
+def count_rpcs(provider: CountingStubProvider, func: Callable[[], Any]) -> int:
+    # warm up first, to count the RPCs of every call and not one-off lookups
+    # like the cached chain id
+    func()
+    provider.counts.clear()
+    func()
+    return sum(provider.counts.values())
+
+
+def main(logger: logging.Logger, num_calls: int) -> Dict[str, Dict[str, float]]:
+    provider = CountingStubProvider()
+    w3 = Web3(provider)
+    token = w3.eth.contract(address=TOKEN_ADDRESS, abi=ERC20_ABI)
+    data = token.encode_abi("balanceOf", [HOLDER_ADDRESS])
+    cases: Dict[str, TxParams] = {
+        "balanceOf": {},
+        "balanceOf (gasPrice set)": {"gasPrice": Wei(10**9)},
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    logger.info(
+        "|{:^30}|{:^16}|{:^16}|{:^20}|{:^20}|".format(
+            f"Contract call ({num_calls} calls)",
+            "filled rpcs",
+            "read-only rpcs",
+            "filled",
+            "read-only",
+        )
+    )
+    logger.info("-" * 108)
+    for name, transaction in cases.items():
+
+        def filled_call() -> Any:
+            call_transaction: TxParams = {"to": TOKEN_ADDRESS, "data": data}
+            call_transaction.update(transaction)
+            return w3.eth.call(fill_transaction_defaults(w3, call_transaction))
+
+        def read_only_call() -> Any:
+            return token.functions.balanceOf(HOLDER_ADDRESS).call(dict(transaction))
+
+        results[name] = {
+            "filled defaults rpcs": count_rpcs(provider, filled_call),
+            "read-only rpcs": count_rpcs(provider, read_only_call),
+            "filled defaults": time_calls(filled_call, num_calls),
+            "read-only": time_calls(read_only_call, num_calls),
+        }
+        logger.info(
+            "|{:^30}|{:^16}|{:^16}|{:^20.10}|{:^20.10}|".format(
+                name, *results[name].values()
+            )
+        )
+    logger.info("-" * 108)
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
@@ -0,0 +1,127 @@
+"""
+Offline benchmark of the time and memory taken to make contract instances for
+many addresses sharing one ABI, e.g. ERC-20 tokens, and for a large ABI of which
+only a few functions are used:
+
+    python web3/tools/benchmark/contract_construction.py --num-instances 10000
+"""
+
+import argparse
+import copy
+import logging
+import sys
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from web3 import (
+    Web3,
+)
+from web3.tools.benchmark.hot_paths import (
+    ERC20_ABI,
+    StubProvider,
+    time_calls,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-instances",
+    type=int,
+    default=10000,
+    help="The number of contract instances to make",
+)
+
+
+def make_large_abi(num_functions: int, num_events: int) -> List[Dict[str, Any]]:
+    """
+    An ABI the size of an aggregated diamond proxy ABI.
+    """
+    uint_input = {"name": "value", "type": "uint256"}
+    return [
+        {
+            "type": "function",
+            "name": f"function{i}",
+            "inputs": [uint_input],
+            "outputs": [uint_input],
+            "stateMutability": "view",
+        }
+        for i in range(num_functions)
+    ] + [
+        {
+            "type": "event",
+            "name": f"Event{i}",
+            "inputs": [dict(uint_input, indexed=False)],
+            "anonymous": False,
+        }
+        for i in range(num_events)
+    ]
+
+
+def measure_memory(make_instance: Callable[[int], Any], n: int) -> float:
+    """
+    The memory held by ``n`` instances, in KiB per instance.
+    """
+    tracemalloc.start()
+    try:
+        instances = [make_instance(i) for i in range(n)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del instances
+    return size / 1024 / n
+
+
+def main(logger: logging.Logger, num_instances: int) -> Dict[str, Dict[str, float]]:
+    w3 = Web3(StubProvider())
+    addresses = [
+        Web3.to_checksum_address(f"0x{i + 1:040x}") for i in range(num_instances)
+    ]
+    factory = w3.eth.contract(abi=ERC20_ABI)
+    large_abi = make_large_abi(2000, 500)
+    # ABIs loaded per request are equal, but distinct, objects
+    abi_copies: List[Any] = [copy.deepcopy(ERC20_ABI) for _ in range(num_instances)]
+    cases: Dict[str, Callable[[int], Any]] = {
+        "w3.eth.contract": lambda i: w3.eth.contract(
+            address=addresses[i], abi=ERC20_ABI
+        ),
+        "w3.eth.contract (ABI copies)": lambda i: w3.eth.contract(
+            address=addresses[i], abi=abi_copies[i]
+        ),
+        "factory(address)": lambda i: factory(addresses[i]),
+        "large ABI, one function used": lambda i: w3.eth.contract(
+            address=addresses[i], abi=large_abi
+        ).functions.function0,
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    logger.info(
+        "|{:^30}|{:^20}|{:^20}|".format(
+            f"Contracts ({num_instances})", "seconds", "KiB per instance"
+        )
+    )
+    logger.info("-" * 74)
+    for name, make_instance in cases.items():
+        index = iter(range(num_instances))
+        results[name] = {
+            "seconds": time_calls(lambda: make_instance(next(index)), num_instances),
+            "KiB per instance": measure_memory(make_instance, num_instances),
+        }
+        logger.info(
+            "|{:^30}|{:^20.10}|{:^20.10}|".format(name, *results[name].values())
+        )
+    logger.info("-" * 74)
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_instances)
@@ -0,0 +1,273 @@
+"""
+Offline benchmark for the result formatters of ``eth_getBlockByNumber`` and
+``eth_getTransactionReceipt``, comparing the compiled formatters in use with the
+declarative ones they are compiled from, and with the lazy formatters used when
+``w3.eth.lazy_results`` is set (reading a single field). No node is required:
+
+    python web3/tools/benchmark/formatters.py --num-calls 100
+"""
+
+import argparse
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from eth_utils.curried import (
+    apply_formatter_to_array,
+    apply_one_of_formatters,
+)
+from eth_utils.toolz import (
+    assoc,
+)
+
+from web3._utils.formatters import (
+    is_array_of_dicts,
+    is_array_of_strings,
+)
+from web3._utils.method_formatters import (
+    BLOCK_FORMATTERS,
+    LAZY_RESULT_FORMATTERS,
+    LOG_ENTRY_FORMATTERS,
+    RECEIPT_FORMATTERS,
+    TRANSACTION_RESULT_FORMATTERS,
+    block_formatter,
+    receipt_formatter,
+    to_hexbytes,
+    type_aware_apply_formatters_to_dict,
+)
+from web3._utils.rpc_abi import (
+    RPC,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=100,
+    help="The number of blocks and receipts to format",
+)
+parser.add_argument(
+    "--num-transactions",
+    type=int,
+    default=300,
+    help="The number of full transactions in each block",
+)
+
+
+def _hex(value: int, num_bytes: int) -> str:
+    return "0x" + f"{value:0{2 * num_bytes}x}"
+
+
+def make_raw_transaction(index: int, block_number: int = 0x12A05F2) -> Dict[str, Any]:
+    """
+    A mainnet-shaped EIP-1559 transaction, as returned by the node.
+    """
+    return {
+        "blockHash": _hex(block_number, 32),
+        "blockNumber": hex(block_number),
+        "from": _hex(0xA0B86991C6218B36C1D19D4A2E9EB0CE3606EB48 + index % 40, 20),
+        "gas": hex(21000 + index),
+        "gasPrice": hex(30_000_000_000 + index),
+        "maxFeePerGas": hex(40_000_000_000),
+        "maxPriorityFeePerGas": hex(1_000_000_000),
+        "hash": _hex(block_number * 1000 + index, 32),
+        "input": "0xa9059cbb" + "00" * 64,
+        "nonce": hex(index),
+        "to": _hex(0xDAC17F958D2EE523A2206206994597C13D831EC7 + index % 25, 20),
+        "transactionIndex": hex(index),
+        "value": hex(10**18 + index),
+        "type": "0x2",
+        "accessList": [],
+        "chainId": "0x1",
+        "v": "0x1",
+        "r": _hex(index + 1, 32),
+        "s": _hex(index + 2, 32),
+        "yParity": "0x1",
+    }
+
+
+def make_raw_block(
+    num_transactions: int, block_number: int = 0x12A05F2
+) -> Dict[str, Any]:
+    """
+    A mainnet-shaped block with full transactions, as returned by the node.
+    """
+    return {
+        "baseFeePerGas": hex(29_000_000_000),
+        "difficulty": "0x0",
+        "extraData": "0x6265617665726275696c642e6f7267",
+        "gasLimit": hex(30_000_000),
+        "gasUsed": hex(12_345_678),
+        "hash": _hex(block_number, 32),
+        "logsBloom": "0x" + "00" * 256,
+        "miner": _hex(0x95222290DD7278AA3DDD389CC1E1D165CC4BAFE5, 20),
+        "mixHash": _hex(block_number + 1, 32),
+        "nonce": "0x0000000000000000",
+        "number": hex(block_number),
+        "parentHash": _hex(block_number - 1, 32),
+        "receiptsRoot": _hex(block_number + 2, 32),
+        "sha3Uncles": _hex(block_number + 3, 32),
+        "size": hex(150_000),
+        "stateRoot": _hex(block_number + 4, 32),
+        "timestamp": hex(1_700_000_000),
+        "totalDifficulty": hex(58_750_003_716_598_352_816_469),
+        "transactions": [
+            make_raw_transaction(index, block_number)
+            for index in range(num_transactions)
+        ],
+        "transactionsRoot": _hex(block_number + 5, 32),
+        "uncles": [],
+        "withdrawals": [
+            {
+                "index": hex(index),
+                "validatorIndex": hex(100_000 + index),
+                "address": _hex(0xB9D7934878B5FB9610B3FE8A5E441E8FAD7E293F, 20),
+                "amount": hex(15_000_000),
+            }
+            for index in range(16)
+        ],
+        "withdrawalsRoot": _hex(block_number + 6, 32),
+    }
+
+
+def make_raw_receipt(num_logs: int, block_number: int = 0x12A05F2) -> Dict[str, Any]:
+    """
+    A mainnet-shaped transaction receipt with ERC-20 ``Transfer`` logs.
+    """
+    return {
+        "blockHash": _hex(block_number, 32),
+        "blockNumber": hex(block_number),
+        "contractAddress": None,
+        "cumulativeGasUsed": hex(1_234_567),
+        "effectiveGasPrice": hex(30_000_000_000),
+        "from": _hex(0xA0B86991C6218B36C1D19D4A2E9EB0CE3606EB48, 20),
+        "gasUsed": hex(65_000),
+        "logs": [
+            {
+                "address": _hex(0xDAC17F958D2EE523A2206206994597C13D831EC7, 20),
+                "blockHash": _hex(block_number, 32),
+                "blockNumber": hex(block_number),
+                "data": _hex(10**18 + index, 32),
+                "logIndex": hex(index),
+                "removed": False,
+                "topics": [
+                    _hex(0xDDF252AD, 32),
+                    _hex(index + 1, 32),
+                    _hex(index + 2, 32),
+                ],
+                "transactionHash": _hex(block_number * 1000, 32),
+                "transactionIndex": "0x0",
+            }
+            for index in range(num_logs)
+        ],
+        "logsBloom": "0x" + "00" * 256,
+        "status": "0x1",
+        "to": _hex(0xDAC17F958D2EE523A2206206994597C13D831EC7, 20),
+        "transactionHash": _hex(block_number * 1000, 32),
+        "transactionIndex": "0x0",
+        "type": "0x2",
+    }
+
+
+declarative_transaction_formatter = type_aware_apply_formatters_to_dict(
+    TRANSACTION_RESULT_FORMATTERS
+)
+declarative_block_formatter = type_aware_apply_formatters_to_dict(
+    assoc(
+        BLOCK_FORMATTERS,
+        "transactions",
+        apply_one_of_formatters(
+            (
+                (
+                    is_array_of_dicts,
+                    apply_formatter_to_array(declarative_transaction_formatter),
+                ),
+                (is_array_of_strings, apply_formatter_to_array(to_hexbytes(32))),
+            )
+        ),
+    )
+)
+declarative_receipt_formatter = type_aware_apply_formatters_to_dict(
+    assoc(
+        RECEIPT_FORMATTERS,
+        "logs",
+        apply_formatter_to_array(
+            type_aware_apply_formatters_to_dict(LOG_ENTRY_FORMATTERS)
+        ),
+    )
+)
+
+
+def time_calls(func: Callable[[], Any], n: int) -> float:
+    start = timeit.default_timer()
+    for _ in range(n):
+        func()
+    return timeit.default_timer() - start
+
+
+def main(
+    logger: logging.Logger, num_calls: int, num_transactions: int = 300
+) -> Dict[str, Dict[str, float]]:
+    raw_block = make_raw_block(num_transactions)
+    raw_receipt = make_raw_receipt(20)
+    assert block_formatter(raw_block) == declarative_block_formatter(raw_block)
+    assert receipt_formatter(raw_receipt) == declarative_receipt_formatter(raw_receipt)
+    lazy_block_formatter = LAZY_RESULT_FORMATTERS[RPC.eth_getBlockByNumber]
+    lazy_receipt_formatter = LAZY_RESULT_FORMATTERS[RPC.eth_getTransactionReceipt]
+    assert lazy_block_formatter(raw_block) == block_formatter(raw_block)
+    assert lazy_receipt_formatter(raw_receipt) == receipt_formatter(raw_receipt)
+
+    benchmarks: List[Any] = [
+        (
+            f"eth_getBlockByNumber ({num_transactions} txs)",
+            lambda: block_formatter(raw_block),
+            lambda: declarative_block_formatter(raw_block),
+            lambda: lazy_block_formatter(raw_block).number,
+        ),
+        (
+            "eth_getTransactionReceipt (20 logs)",
+            lambda: receipt_formatter(raw_receipt),
+            lambda: declarative_receipt_formatter(raw_receipt),
+            lambda: lazy_receipt_formatter(raw_receipt).status,
+        ),
+    ]
+
+    results: Dict[str, Dict[str, float]] = {}
+    logger.info(
+        "|{:^40}|{:^20}|{:^20}|{:^20}|".format(
+            f"Result ({num_calls} calls)", "compiled", "declarative", "lazy"
+        )
+    )
+    logger.info("-" * 105)
+    for name, compiled, declarative, lazy in benchmarks:
+        results[name] = {
+            "compiled": time_calls(compiled, num_calls),
+            "declarative": time_calls(declarative, num_calls),
+            "lazy": time_calls(lazy, num_calls),
+        }
+        logger.info(
+            "|{:^40}|{:^20.10}|{:^20.10}|{:^20.10}|".format(
+                name,
+                results[name]["compiled"],
+                results[name]["declarative"],
+                results[name]["lazy"],
+            )
+        )
+    logger.info("-" * 105)
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls, args.num_transactions)
@@ -0,0 +1,314 @@
+"""
+Offline benchmarks for the client-side hot paths that no single feature
+benchmark covers: request encoding and response decoding, the default
+middleware stack, ABI encoding and decoding of contract calls, event log
+decoding and ENS name normalization. Requests are answered in-process by a
+``StubResponder``, so no node is required:
+
+    python web3/tools/benchmark/hot_paths.py --num-calls 1000
+"""
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+)
+
+from ens.utils import (
+    normal_name_to_hash,
+    normalize_name,
+)
+from web3 import (
+    Web3,
+)
+from web3._utils.method_formatters import (
+    receipt_formatter,
+)
+from web3.providers import (
+    BaseProvider,
+    JSONBaseProvider,
+)
+from web3.tools.benchmark.cache_keys import (
+    ETH_CALL_TX,
+    GET_LOGS_FILTER,
+)
+from web3.tools.benchmark.formatters import (
+    make_raw_block,
+    make_raw_receipt,
+)
+from web3.tools.benchmark.stub_node import (
+    StubResponder,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+from web3.utils.events import (
+    decode_logs_columnar,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=1000,
+    help="The number of calls to make per benchmark",
+)
+
+TOKEN_ADDRESS = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+HOLDER_ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+ERC20_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "value", "type": "uint256"},
+        ],
+        "name": "transfer",
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "from", "type": "address"},
+            {"indexed": True, "name": "to", "type": "address"},
+            {"indexed": False, "name": "value", "type": "uint256"},
+        ],
+        "name": "Transfer",
+        "type": "event",
+    },
+]
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+# exactInputSingle((address,address,uint24,address,uint256,uint256,uint160))
+SWAP_TYPES = ["(address,address,uint24,address,uint256,uint256,uint160)"]
+SWAP_ARGS = [
+    (TOKEN_ADDRESS, HOLDER_ADDRESS, 3000, HOLDER_ADDRESS, 10**18, 0, 0),
+]
+ENS_NAMES = [
+    "vitalik.eth",
+    "Nick.ETH",
+    "sub.domain.example.eth",
+    "ünicode.eth",
+    "\U0001f98a.eth",
+]
+
+
+class StubProvider(BaseProvider):
+    """
+    Answers requests in-process with a ``StubResponder``.
+    """
+
+    def __init__(self, responder: StubResponder = None) -> None:
+        self.responder = responder or StubResponder()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self.responder.respond(
+            {"jsonrpc": "2.0", "id": 0, "method": method, "params": params}
+        )
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+def time_calls(func: Callable[[], Any], n: int) -> float:
+    start = timeit.default_timer()
+    for _ in range(n):
+        func()
+    return timeit.default_timer() - start
+
+
+def _log_results(
+    logger: logging.Logger, title: str, results: Dict[str, Dict[str, float]]
+) -> None:
+    logger.info(f"{title}:")
+    for case, variants in results.items():
+        for variant, seconds in variants.items():
+            logger.info("  |{:^40}|{:^30}|{:^20.10}|".format(case, variant, seconds))
+
+
+def request_encoding(
+    logger: logging.Logger, num_calls: int
+) -> Dict[str, Dict[str, float]]:
+    provider = JSONBaseProvider()
+    raw_block = json.dumps(
+        {"jsonrpc": "2.0", "id": 1, "result": make_raw_block(150)}
+    ).encode()
+    raw_receipt = json.dumps(
+        {"jsonrpc": "2.0", "id": 1, "result": make_raw_receipt(20)}
+    ).encode()
+    results = {
+        "eth_call request": {
+            "encode": time_calls(
+                lambda: provider.encode_rpc_request(
+                    RPCEndpoint("eth_call"), [ETH_CALL_TX, "latest"]
+                ),
+                num_calls,
+            ),
+        },
+        "eth_getLogs request": {
+            "encode": time_calls(
+                lambda: provider.encode_rpc_request(
+                    RPCEndpoint("eth_getLogs"), [GET_LOGS_FILTER]
+                ),
+                num_calls,
+            ),
+        },
+        "block response (150 txs)": {
+            "decode": time_calls(
+                lambda: provider.decode_rpc_response(raw_block), num_calls
+            ),
+        },
+        "receipt response (20 logs)": {
+            "decode": time_calls(
+                lambda: provider.decode_rpc_response(raw_receipt), num_calls
+            ),
+        },
+    }
+    _log_results(logger, f"Request encoding ({num_calls} calls)", results)
+    return results
+
+
+def middleware_stack(
+    logger: logging.Logger, num_calls: int
+) -> Dict[str, Dict[str, float]]:
+    provider = StubProvider()
+    w3_default = Web3(provider)
+    w3_bare = Web3(provider, middlewares=[])
+    call_tx = {"to": TOKEN_ADDRESS, "data": "0x70a08231" + "00" * 32}
+    cases: Dict[str, Callable[[Web3], Any]] = {
+        "eth_blockNumber": lambda w3: w3.eth.block_number,
+        "eth_getBalance": lambda w3: w3.eth.get_balance(HOLDER_ADDRESS),
+        "eth_call": lambda w3: w3.eth.call(call_tx),
+    }
+    results = {
+        case: {
+            "default middlewares": time_calls(lambda: call(w3_default), num_calls),
+            "no middlewares": time_calls(lambda: call(w3_bare), num_calls),
+        }
+        for case, call in cases.items()
+    }
+    _log_results(logger, f"Middleware stack ({num_calls} calls)", results)
+    return results
+
+
+def abi_codec(logger: logging.Logger, num_calls: int) -> Dict[str, Dict[str, float]]:
+    w3 = Web3(StubProvider())
+    token = w3.eth.contract(address=TOKEN_ADDRESS, abi=ERC20_ABI)
+    balance = w3.codec.encode(["uint256"], [10**18])
+    swap = w3.codec.encode(SWAP_TYPES, SWAP_ARGS)
+    results = {
+        "transfer(address,uint256)": {
+            "encode": time_calls(
+                lambda: token.encode_abi(
+                    fn_name="transfer", args=[HOLDER_ADDRESS, 10**18]
+                ),
+                num_calls,
+            ),
+            "decode": time_calls(
+                lambda: w3.codec.decode(["uint256"], balance), num_calls
+            ),
+        },
+        "exactInputSingle tuple": {
+            "encode": time_calls(
+                lambda: w3.codec.encode(SWAP_TYPES, SWAP_ARGS), num_calls
+            ),
+            "decode": time_calls(lambda: w3.codec.decode(SWAP_TYPES, swap), num_calls),
+        },
+        "balanceOf(address)": {
+            "call": time_calls(
+                lambda: token.functions.balanceOf(HOLDER_ADDRESS).call(), num_calls
+            ),
+        },
+    }
+    _log_results(logger, f"ABI codec ({num_calls} calls)", results)
+    return results
+
+
+def event_decoding(
+    logger: logging.Logger, num_calls: int
+) -> Dict[str, Dict[str, float]]:
+    w3 = Web3(StubProvider())
+    token = w3.eth.contract(address=TOKEN_ADDRESS, abi=ERC20_ABI)
+    transfer = token.events.Transfer()
+    raw_receipt = make_raw_receipt(20)
+    for raw_log in raw_receipt["logs"]:
+        raw_log["topics"][0] = TRANSFER_TOPIC
+    receipt = receipt_formatter(raw_receipt)
+    log = receipt["logs"][0]
+    results = {
+        "Transfer": {
+            "process_log": time_calls(lambda: transfer.process_log(log), num_calls),
+            "process_receipt (20 logs)": time_calls(
+                lambda: transfer.process_receipt(receipt), num_calls
+            ),
+            "contract.events.process_receipt (20 logs)": time_calls(
+                lambda: token.events.process_receipt(receipt), num_calls
+            ),
+            "decode_logs_columnar (20 logs)": time_calls(
+                lambda: decode_logs_columnar(w3.codec, transfer.abi, receipt["logs"]),
+                num_calls,
+            ),
+        },
+    }
+    _log_results(logger, f"Event decoding ({num_calls} calls)", results)
+    return results
+
+
+def ens_normalization(
+    logger: logging.Logger, num_calls: int
+) -> Dict[str, Dict[str, float]]:
+    def normalize_names() -> None:
+        for name in ENS_NAMES:
+            normalize_name(name)
+
+    normalized = [normalize_name(name) for name in ENS_NAMES]
+
+    def hash_names() -> None:
+        for name in normalized:
+            normal_name_to_hash(name)
+
+    results = {
+        f"{len(ENS_NAMES)} names": {
+            "normalize_name": time_calls(normalize_names, num_calls),
+            "normal_name_to_hash": time_calls(hash_names, num_calls),
+        },
+    }
+    _log_results(logger, f"ENS normalization ({num_calls} calls)", results)
+    return results
+
+
+def main(logger: logging.Logger, num_calls: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for benchmark in (
+        request_encoding,
+        middleware_stack,
+        abi_codec,
+        event_decoding,
+        ens_normalization,
+    ):
+        results.update(benchmark(logger, num_calls))
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
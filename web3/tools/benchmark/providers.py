@@ -0,0 +1,130 @@
+"""
+Offline benchmark of provider throughput: the time taken by the HTTP, IPC and
+websocket providers, sync and async, to make the same requests. Requests are
+answered by a ``StubNode`` served in-process, so no node is required:
+
+    python web3/tools/benchmark/providers.py --num-calls 100
+
+Async requests are made concurrently, as ``main.py`` does against geth.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+)
+
+from web3 import (
+    AsyncHTTPProvider,
+    AsyncWeb3,
+    HTTPProvider,
+    IPCProvider,
+    Web3,
+    WebsocketProvider,
+    WebsocketProviderV2,
+)
+from web3.tools.benchmark.hot_paths import (
+    time_calls,
+)
+from web3.tools.benchmark.stub_node import (
+    StubNode,
+    StubResponder,
+)
+
+# the size of the ``eth_getBlockByNumber`` responses, in bytes
+PAYLOAD_SIZE = 10_000
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=100,
+    help="The number of requests to make with each provider",
+)
+
+SyncRequests = Dict[str, Callable[[Web3], Any]]
+AsyncRequests = Dict[str, Callable[[AsyncWeb3], Awaitable[Any]]]
+
+SYNC_REQUESTS: SyncRequests = {
+    "eth_blockNumber": lambda w3: w3.eth.block_number,
+    "eth_getBlockByNumber": lambda w3: w3.eth.get_block("latest"),
+}
+ASYNC_REQUESTS: AsyncRequests = {
+    "eth_blockNumber": lambda w3: w3.eth.block_number,
+    "eth_getBlockByNumber": lambda w3: w3.eth.get_block("latest"),
+}
+
+
+async def time_async_calls(func: Callable[[], Awaitable[Any]], n: int) -> float:
+    start = timeit.default_timer()
+    await asyncio.gather(*(func() for _ in range(n)))
+    return timeit.default_timer() - start
+
+
+def _time_sync_provider(
+    results: Dict[str, Dict[str, float]], name: str, w3: Web3, num_calls: int
+) -> None:
+    for case, request in SYNC_REQUESTS.items():
+        # warm up first, so connecting isn't timed
+        request(w3)
+        results[case][name] = time_calls(lambda: request(w3), num_calls)
+
+
+async def _time_async_provider(
+    results: Dict[str, Dict[str, float]], name: str, w3: AsyncWeb3, num_calls: int
+) -> None:
+    for case, request in ASYNC_REQUESTS.items():
+        await request(w3)
+        results[case][name] = await time_async_calls(lambda: request(w3), num_calls)
+
+
+async def _time_async_providers(
+    results: Dict[str, Dict[str, float]], node: StubNode, num_calls: int
+) -> None:
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(node.endpoint_uri))
+    await _time_async_provider(results, "AsyncHTTPProvider", async_w3, num_calls)
+
+    async with AsyncWeb3.persistent_websocket(
+        WebsocketProviderV2(node.websocket_uri)
+    ) as async_w3:
+        await _time_async_provider(results, "WebsocketProviderV2", async_w3, num_calls)
+
+
+def main(logger: logging.Logger, num_calls: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {case: {} for case in SYNC_REQUESTS}
+    with StubNode(StubResponder(payload_size=PAYLOAD_SIZE)) as node:
+        _time_sync_provider(
+            results, "HTTPProvider", Web3(HTTPProvider(node.endpoint_uri)), num_calls
+        )
+        _time_sync_provider(
+            results, "IPCProvider", Web3(IPCProvider(node.ipc_path)), num_calls
+        )
+        _time_sync_provider(
+            results,
+            "WebsocketProvider",
+            Web3(WebsocketProvider(node.websocket_uri)),
+            num_calls,
+        )
+        asyncio.run(_time_async_providers(results, node, num_calls))
+
+    logger.info(f"Provider throughput ({num_calls} requests):")
+    for case, variants in results.items():
+        for variant, seconds in variants.items():
+            logger.info("  |{:^30}|{:^30}|{:^20.10}|".format(case, variant, seconds))
+    return results
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
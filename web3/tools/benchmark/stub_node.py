@@ -0,0 +1,327 @@
+import asyncio
+import json
+import os
+import random
+from tempfile import (
+    TemporaryDirectory,
+)
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from aiohttp import (
+    web,
+)
+import websockets
+
+# use same coinbase value as in `web3/tools/benchmark/node.py`
+COINBASE = "0xdc544d1aa88ff8bbd2f2aec754b1f1e99e1812fd"
+CHAIN_ID = 1337
+BLOCK_NUMBER = 256
+
+_MISSING = object()
+# approximate encoded sizes, used to reach the requested payload size
+_TRANSACTION_HASH_SIZE = 69
+_LOG_SIZE = 620
+
+
+def _hex32(value: int) -> str:
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+class StubResponder:
+    """
+    Answers JSON-RPC requests with canned or generated results.
+
+    ``results`` maps RPC methods to a result, or to a callable taking the
+    request params and returning the result. It extends and overrides the
+    built-in results for common ``eth_`` methods. Block, ``eth_getLogs`` and
+    ``eth_call`` results are padded to about ``payload_size`` bytes. Each
+    request fails with probability ``error_rate``, chosen by a random number
+    generator seeded with ``seed``, and is answered after ``latency`` seconds.
+    """
+
+    def __init__(
+        self,
+        results: Optional[Dict[str, Any]] = None,
+        latency: float = 0.0,
+        payload_size: int = 0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.payload_size = payload_size
+        self.error_rate = error_rate
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self.results: Dict[str, Any] = {
+            "web3_clientVersion": "StubNode/v1",
+            "net_version": str(CHAIN_ID),
+            "net_listening": True,
+            "eth_chainId": hex(CHAIN_ID),
+            "eth_syncing": False,
+            "eth_accounts": [COINBASE],
+            "eth_coinbase": COINBASE,
+            "eth_blockNumber": hex(BLOCK_NUMBER),
+            "eth_gasPrice": hex(10**9),
+            "eth_maxPriorityFeePerGas": hex(10**9),
+            "eth_getBalance": hex(10**18),
+            "eth_getTransactionCount": "0x0",
+            "eth_estimateGas": hex(21000),
+            "eth_getCode": "0x",
+            "eth_call": self._call,
+            "eth_getBlockByNumber": self._block,
+            "eth_getBlockByHash": self._block,
+            "eth_getLogs": self._logs,
+            "eth_getTransactionReceipt": self._receipt,
+            "eth_sendTransaction": self._transaction_hash,
+            "eth_sendRawTransaction": self._transaction_hash,
+        }
+        self.results.update(results or {})
+
+    async def handle(self, raw_request: Union[str, bytes]) -> str:
+        """
+        Return the encoded response to an encoded request or batch of requests.
+        """
+        return await self.handle_request(json.loads(raw_request))
+
+    async def handle_request(self, request: Any) -> str:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if isinstance(request, list):
+            response: Any = [self.respond(item) for item in request]
+        else:
+            response = self.respond(request)
+        return json.dumps(response, separators=(",", ":"))
+
+    def respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.request_count += 1
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        if self.error_rate and self._random.random() < self.error_rate:
+            response["error"] = {"code": -32000, "message": "stub node error"}
+            return response
+
+        method = request.get("method")
+        result = self.results.get(method, _MISSING)
+        if result is _MISSING:
+            response["error"] = {
+                "code": -32601,
+                "message": f"the method {method} does not exist/is not available",
+            }
+        elif callable(result):
+            response["result"] = result(request.get("params") or [])
+        else:
+            response["result"] = result
+        return response
+
+    def _call(self, params: List[Any]) -> str:
+        return "0x" + "00" * max(32, self.payload_size // 2)
+
+    def _transaction_hash(self, params: List[Any]) -> str:
+        return _hex32(self._random.getrandbits(256))
+
+    def _block(self, params: List[Any]) -> Dict[str, Any]:
+        if params and isinstance(params[0], str) and params[0].startswith("0x"):
+            number = BLOCK_NUMBER if len(params[0]) == 66 else int(params[0], 16)
+        else:
+            number = BLOCK_NUMBER
+        transaction_count = self.payload_size // _TRANSACTION_HASH_SIZE
+        return {
+            "number": hex(number),
+            "hash": _hex32(number + 1),
+            "parentHash": _hex32(number),
+            "nonce": "0x0000000000000000",
+            "mixHash": _hex32(0),
+            "sha3Uncles": _hex32(0),
+            "logsBloom": "0x" + "00" * 256,
+            "transactionsRoot": _hex32(0),
+            "stateRoot": _hex32(0),
+            "receiptsRoot": _hex32(0),
+            "miner": COINBASE,
+            "difficulty": "0x0",
+            "totalDifficulty": "0x0",
+            "extraData": "0x",
+            "size": hex(max(self.payload_size, 512)),
+            "gasLimit": hex(30_000_000),
+            "gasUsed": hex(21000 * transaction_count),
+            "baseFeePerGas": hex(10**9),
+            "timestamp": hex(int(time.time())),
+            "transactions": [
+                _hex32(number << 32 | index) for index in range(transaction_count)
+            ],
+            "uncles": [],
+        }
+
+    def _logs(self, params: List[Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "address": COINBASE,
+                "topics": [_hex32(index), _hex32(0)],
+                "data": "0x" + "00" * 64,
+                "blockNumber": hex(BLOCK_NUMBER),
+                "blockHash": _hex32(BLOCK_NUMBER + 1),
+                "transactionHash": _hex32(index),
+                "transactionIndex": "0x0",
+                "logIndex": hex(index),
+                "removed": False,
+            }
+            for index in range(max(1, self.payload_size // _LOG_SIZE))
+        ]
+
+    def _receipt(self, params: List[Any]) -> Dict[str, Any]:
+        return {
+            "transactionHash": params[0] if params else _hex32(0),
+            "transactionIndex": "0x0",
+            "blockNumber": hex(BLOCK_NUMBER),
+            "blockHash": _hex32(BLOCK_NUMBER + 1),
+            "from": COINBASE,
+            "to": COINBASE,
+            "cumulativeGasUsed": hex(21000),
+            "gasUsed": hex(21000),
+            "effectiveGasPrice": hex(10**9),
+            "contractAddress": None,
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "status": "0x1",
+            "type": "0x2",
+        }
+
+
+class StubNode:
+    """
+    An in-process JSON-RPC server for benchmarking and load testing providers
+    without a node binary. HTTP, websocket and IPC (unix socket) endpoints are
+    served from a background thread and answered by ``responder``.
+
+    .. code-block:: python
+
+        with StubNode(StubResponder(latency=0.001)) as node:
+            w3 = Web3(HTTPProvider(node.endpoint_uri))
+            w3_ipc = Web3(IPCProvider(node.ipc_path))
+    """
+
+    def __init__(
+        self, responder: Optional[StubResponder] = None, host: str = "127.0.0.1"
+    ) -> None:
+        self.responder = responder or StubResponder()
+        self.host = host
+        self.endpoint_uri: Optional[str] = None
+        self.websocket_uri: Optional[str] = None
+        self.ipc_path: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._cleanups: List[Callable[[], Any]] = []
+
+    def start(self) -> "StubNode":
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="stub-node", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self) -> "StubNode":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    async def _start(self) -> None:
+        # http
+        app = web.Application()
+        app.router.add_post("/", self._handle_http)
+        app.router.add_get("/", self._handle_http_get)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, 0)
+        await site.start()
+        self._cleanups.append(runner.cleanup)
+        self.endpoint_uri = f"http://{self.host}:{runner.addresses[0][1]}"
+
+        # websocket
+        websocket_server = await websockets.serve(self._handle_websocket, self.host, 0)
+        self._cleanups.append(websocket_server.wait_closed)
+        self._cleanups.append(websocket_server.close)
+        port = next(iter(websocket_server.sockets)).getsockname()[1]
+        self.websocket_uri = f"ws://{self.host}:{port}"
+
+        # ipc
+        ipc_dir = TemporaryDirectory()
+        self.ipc_path = os.path.join(ipc_dir.name, "stub.ipc")
+        ipc_server = await asyncio.start_unix_server(self._handle_ipc, self.ipc_path)
+        self._cleanups.append(ipc_dir.cleanup)
+        self._cleanups.append(ipc_server.wait_closed)
+        self._cleanups.append(ipc_server.close)
+
+    async def _stop(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while self._cleanups:
+            result = self._cleanups.pop()()
+            if asyncio.iscoroutine(result):
+                await result
+
+    def _track(self, task: "asyncio.Task[Any]") -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle_http(self, request: web.Request) -> web.Response:
+        body = await self.responder.handle(await request.read())
+        return web.Response(text=body, content_type="application/json")
+
+    async def _handle_http_get(self, request: web.Request) -> web.Response:
+        return web.Response(text="")
+
+    async def _handle_websocket(self, websocket: Any, path: Any = None) -> None:
+        async def respond(message: Union[str, bytes]) -> None:
+            await websocket.send(await self.responder.handle(message))
+
+        async for message in websocket:
+            # respond concurrently, so latency does not serialize requests
+            self._track(asyncio.ensure_future(respond(message)))
+
+    async def _handle_ipc(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._track(asyncio.current_task())
+        decoder = json.JSONDecoder()
+        buffer = ""
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                buffer += data.decode()
+                while True:
+                    buffer = buffer.lstrip()
+                    try:
+                        request, end = decoder.raw_decode(buffer)
+                    except ValueError:
+                        break
+                    buffer = buffer[end:]
+                    response = await self.responder.handle_request(request)
+                    writer.write(response.encode())
+                    await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,311 @@
+"""
+Runs the offline benchmarks as one suite and writes the results as a table,
+JSON or CSV. A previous JSON or CSV run can be passed as a baseline, in which
+case each result is compared against it and the exit status is 1 if any
+result got slower by more than the threshold, or 2 if the baseline was run with
+a different number of calls:
+
+    python web3/tools/benchmark/suite.py --format json --output baseline.json
+    python web3/tools/benchmark/suite.py --baseline baseline.json --threshold 0.1
+
+No node is required: the ``providers`` group runs against an in-process
+``StubNode``. ``main.py`` benchmarks providers against geth.
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import platform
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import web3
+from web3.tools.benchmark import (
+    attrdict,
+    cache_keys,
+    call_rpcs,
+    contract_construction,
+    formatters,
+    hot_paths,
+    providers,
+)
+
+Results = Dict[str, Dict[str, float]]
+ResultKey = Tuple[str, str, str]
+
+
+class BenchmarkGroup(NamedTuple):
+    name: str
+    run: Callable[[logging.Logger, int], Results]
+    num_calls: int
+
+
+# ``num_calls`` is chosen so that each group takes roughly a second
+BENCHMARK_GROUPS: Tuple[BenchmarkGroup, ...] = (
+    BenchmarkGroup("requests", hot_paths.request_encoding, 1000),
+    BenchmarkGroup("middleware", hot_paths.middleware_stack, 1000),
+    BenchmarkGroup("formatters", formatters.main, 100),
+    BenchmarkGroup("abi", hot_paths.abi_codec, 1000),
+    BenchmarkGroup("calls", call_rpcs.main, 1000),
+    BenchmarkGroup("contracts", contract_construction.main, 1000),
+    BenchmarkGroup("events", hot_paths.event_decoding, 1000),
+    BenchmarkGroup("ens", hot_paths.ens_normalization, 20),
+    BenchmarkGroup("cache_keys", cache_keys.main, 10000),
+    BenchmarkGroup("attrdict", attrdict.main, 100),
+    BenchmarkGroup("providers", providers.main, 100),
+)
+CSV_FIELDS = ("group", "case", "variant", "num_calls", "value")
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--only",
+    action="append",
+    choices=[group.name for group in BENCHMARK_GROUPS],
+    help="Run only this benchmark group, may be repeated",
+)
+parser.add_argument(
+    "--scale",
+    type=float,
+    default=1.0,
+    help="Multiplier for the number of calls made by each benchmark group",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=1,
+    help="The number of times to run each benchmark, keeping the fastest result",
+)
+parser.add_argument(
+    "--format",
+    choices=("table", "json", "csv"),
+    default="table",
+    help="The output format",
+)
+parser.add_argument("--output", help="Write the results to this file")
+parser.add_argument(
+    "--verbose",
+    action="store_true",
+    help="Log the table of each benchmark group while the suite runs",
+)
+parser.add_argument("--baseline", help="A JSON or CSV results file to compare with")
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="The allowed slowdown against the baseline, as a fraction",
+)
+
+
+def run_suite(
+    logger: logging.Logger,
+    only: Optional[Iterable[str]] = None,
+    scale: float = 1.0,
+    repeat: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Run the benchmark groups and return one row per result, with ``group``,
+    ``case``, ``variant``, ``num_calls`` and ``value`` keys. Each value is the
+    lowest of ``repeat`` runs of ``num_calls`` calls.
+    """
+    selected = set(only) if only else None
+    best: Dict[ResultKey, float] = {}
+    group_num_calls: Dict[str, int] = {}
+    for group in BENCHMARK_GROUPS:
+        if selected is not None and group.name not in selected:
+            continue
+        num_calls = max(1, int(group.num_calls * scale))
+        group_num_calls[group.name] = num_calls
+        for _ in range(repeat):
+            for case, variants in group.run(logger, num_calls).items():
+                for variant, value in variants.items():
+                    key = (group.name, case, variant)
+                    best[key] = min(value, best.get(key, value))
+    return [
+        {
+            "group": group,
+            "case": case,
+            "variant": variant,
+            "num_calls": group_num_calls[group],
+            "value": value,
+        }
+        for (group, case, variant), value in best.items()
+    ]
+
+
+def to_json(rows: Sequence[Dict[str, Any]], scale: float = 1.0) -> str:
+    return json.dumps(
+        {
+            "metadata": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "web3": web3.__version__,
+                "scale": scale,
+                "timestamp": int(time.time()),
+            },
+            "results": list(rows),
+        },
+        indent=2,
+    )
+
+
+def to_csv(rows: Sequence[Dict[str, Any]]) -> str:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
+
+def to_table(rows: Sequence[Dict[str, Any]]) -> str:
+    lines = ["|{:^12}|{:^40}|{:^30}|{:^10}|{:^20}|".format(*CSV_FIELDS), "-" * 118]
+    lines.extend(
+        "|{:^12}|{:^40}|{:^30}|{:^10}|{:^20.10}|".format(
+            row["group"], row["case"], row["variant"], row["num_calls"], row["value"]
+        )
+        for row in rows
+    )
+    return "\n".join(lines)
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the rows written by ``--format json`` or ``--format csv``.
+    """
+    with open(path, encoding="utf-8") as results_file:
+        contents = results_file.read()
+    if contents.lstrip().startswith("{"):
+        return json.loads(contents)["results"]
+    rows = []
+    for row in csv.DictReader(io.StringIO(contents)):
+        row = dict(row, value=float(row["value"]))
+        if row.get("num_calls"):
+            row["num_calls"] = int(row["num_calls"])
+        rows.append(row)
+    return rows
+
+
+def compare(
+    rows: Sequence[Dict[str, Any]],
+    baseline: Sequence[Dict[str, Any]],
+    threshold: float = 0.1,
+) -> List[Dict[str, Any]]:
+    """
+    Compare ``rows`` with the ``baseline`` rows for the same benchmark and
+    return one row per shared benchmark, with the baseline value, the ratio of
+    the new value to it, and whether that ratio exceeds ``1 + threshold``.
+    Lower values are better for every benchmark.
+
+    Values are totals over ``num_calls`` calls, so raises ``ValueError`` if a
+    benchmark was run with a different number of calls in the baseline, e.g.
+    with another ``--scale``.
+    """
+    baseline_rows = {
+        (row["group"], row["case"], row["variant"]): row for row in baseline
+    }
+    comparison = []
+    mismatched = []
+    for row in rows:
+        baseline_row = baseline_rows.get((row["group"], row["case"], row["variant"]))
+        if baseline_row is None or not baseline_row["value"]:
+            continue
+        baseline_num_calls = baseline_row.get("num_calls")
+        if baseline_num_calls is not None and baseline_num_calls != row.get(
+            "num_calls"
+        ):
+            mismatched.append(
+                f"{row['group']}/{row['case']}/{row['variant']}: "
+                f"{row.get('num_calls')} calls, {baseline_num_calls} in the baseline"
+            )
+            continue
+        baseline_value = baseline_row["value"]
+        ratio = row["value"] / baseline_value
+        comparison.append(
+            dict(
+                row,
+                baseline=baseline_value,
+                ratio=ratio,
+                regression=ratio > 1 + threshold,
+            )
+        )
+    if mismatched:
+        raise ValueError(
+            "The baseline was run with a different number of calls, rerun it "
+            "with the same --scale to compare:\n  " + "\n  ".join(mismatched)
+        )
+    return comparison
+
+
+def comparison_table(comparison: Sequence[Dict[str, Any]]) -> str:
+    lines = [
+        "|{:^12}|{:^40}|{:^30}|{:^10}|".format("group", "case", "variant", "ratio"),
+        "-" * 97,
+    ]
+    lines.extend(
+        "|{:^12}|{:^40}|{:^30}|{:^10.3f}|{}".format(
+            row["group"],
+            row["case"],
+            row["variant"],
+            row["ratio"],
+            " REGRESSION" if row["regression"] else "",
+        )
+        for row in comparison
+    )
+    return "\n".join(lines)
+
+
+def main(logger: logging.Logger, argv: Optional[Sequence[str]] = None) -> int:
+    args = parser.parse_args(argv)
+    # each benchmark group logs its own table, silenced unless ``--verbose``
+    group_logger = logging.getLogger(__name__)
+    group_logger.propagate = args.verbose
+    rows = run_suite(group_logger, args.only, args.scale, args.repeat)
+
+    if args.format == "json":
+        output = to_json(rows, args.scale)
+    elif args.format == "csv":
+        output = to_csv(rows)
+    else:
+        output = to_table(rows)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        sys.stdout.write(output + "\n")
+
+    if not args.baseline:
+        return 0
+    try:
+        comparison = compare(rows, load_results(args.baseline), args.threshold)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+    logger.info(comparison_table(comparison))
+    regressions = [row for row in comparison if row["regression"]]
+    if regressions:
+        logger.info(
+            f"{len(regressions)} of {len(comparison)} benchmarks are more than "
+            f"{args.threshold:.0%} slower than the baseline"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stderr))
+
+    sys.exit(main(logger))
@@ -17,3 +17,9 @@ from .caching import (  # NOQA
 from .exception_handling import (  # NOQA
     handle_offchain_lookup,
 )
+from .head_tracker import (  # NOQA
+    AsyncHeadTracker,
+    HeadTracker,
+    get_async_head_tracker,
+    get_head_tracker,
+)
@@ -0,0 +1,231 @@
+"""
+Decode many logs or ``eth_call`` results in a pool of worker processes.
+
+ABI decoding is CPU-bound, so decoding many logs or call results in one process
+keeps one core busy. A ``ParallelDecoder`` splits them into chunks of raw bytes
+that worker processes decode, and returns the results in order. Each worker
+builds its own codec, and keeps the event decoders and call plans it compiled
+(see ``web3._utils.events.get_event_decoder`` and
+``web3._utils.call_plans.get_call_plan``) for the next chunks.
+"""
+
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+)
+import functools
+import itertools
+import json
+from types import (
+    TracebackType,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from eth_abi.codec import (
+    ABICodec,
+)
+from eth_abi.exceptions import (
+    DecodingError,
+)
+from eth_utils.toolz import (
+    partition_all,
+)
+
+from web3._utils.abi import (
+    build_non_strict_registry,
+    build_strict_registry,
+)
+from web3._utils.call_plans import (
+    get_call_plan,
+)
+from web3._utils.events import (
+    _log_entry_data_to_bytes,
+    get_event_decoder,
+)
+from web3.exceptions import (
+    BadFunctionCallOutput,
+)
+from web3.types import (
+    ABIEvent,
+    ABIFunction,
+    EventData,
+    LogReceipt,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_WORKER_ABIS = 1024
+
+RawLog = Tuple[Tuple[bytes, ...], bytes]
+
+
+class ParallelDecoder:
+    """
+    Decodes logs and ``eth_call`` results in worker processes, ``chunk_size``
+    at a time:
+
+    .. code-block:: python
+
+        with ParallelDecoder(w3) as decoder:
+            events = decoder.decode_logs(transfer_abi, logs)
+            balances = decoder.decode_call_results(balance_of_abi, return_data)
+
+    The process pool is started on first use, with ``max_workers`` processes,
+    by default one per CPU, and shut down by ``shutdown`` or at the end of the
+    ``with`` block. Pass ``executor`` to use an existing executor instead,
+    which is left running. Shipping the data to the workers and the results
+    back has a cost, so this only pays off for thousands of logs or results.
+    """
+
+    def __init__(
+        self,
+        w3: Union["AsyncWeb3", "Web3"],
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self.w3 = w3
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> "ParallelDecoder":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Shut the process pool down, if it was started by the decoder.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def decode_logs(
+        self, event_abi: ABIEvent, logs: Iterable[LogReceipt]
+    ) -> List[EventData]:
+        """
+        Decode ``logs``, which must all be logs of the event ``event_abi``, like
+        ``get_event_data``. Raises like it if a log can't be decoded.
+        """
+        logs = list(logs)
+        raw_logs = [
+            (
+                tuple(
+                    bytes(_log_entry_data_to_bytes(topic)) for topic in log["topics"]
+                ),
+                bytes(_log_entry_data_to_bytes(log["data"])),
+            )
+            for log in logs
+        ]
+        decoder = get_event_decoder(self.w3.codec, event_abi)
+        return [
+            decoder.to_event_data(args, log)
+            for args, log in zip(
+                self._map(_decode_logs_args, event_abi, raw_logs), logs
+            )
+        ]
+
+    def decode_call_results(
+        self, fn_abi: ABIFunction, results: Iterable[bytes]
+    ) -> List[Any]:
+        """
+        Decode the return data of calls to the function ``fn_abi``, like
+        ``ContractFunction.call`` does: a single output is returned as is,
+        several as a list. Raises ``BadFunctionCallOutput`` if a result can't
+        be decoded.
+        """
+        return self._map(
+            _decode_call_results, fn_abi, [bytes(result) for result in results]
+        )
+
+    def _map(
+        self,
+        decode_chunk: Callable[[bool, str, Sequence[Any]], List[Any]],
+        abi: Union[ABIEvent, ABIFunction],
+        items: Sequence[Any],
+    ) -> List[Any]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers)
+
+        # the ABI is sent as JSON, so that workers can tell it's one they
+        # already have decoders for
+        abi_json = json.dumps(abi, sort_keys=True)
+        decoded_chunks = self._executor.map(
+            decode_chunk,
+            itertools.repeat(self.w3.strict_bytes_type_checking),
+            itertools.repeat(abi_json),
+            partition_all(self.chunk_size, items),
+        )
+        return list(itertools.chain.from_iterable(decoded_chunks))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_codec(strict_bytes_type_checking: bool) -> ABICodec:
+    if strict_bytes_type_checking:
+        return ABICodec(build_strict_registry())
+    return ABICodec(build_non_strict_registry())
+
+
+@functools.lru_cache(maxsize=MAX_WORKER_ABIS)
+def _load_abi(abi_json: str) -> Any:
+    # the same dict for the same ABI, as decoders are cached by its identity
+    return json.loads(abi_json)
+
+
+def _decode_logs_args(
+    strict_bytes_type_checking: bool, event_abi_json: str, raw_logs: Sequence[RawLog]
+) -> List[Dict[str, Any]]:
+    decoder = get_event_decoder(
+        _get_codec(strict_bytes_type_checking), _load_abi(event_abi_json)
+    )
+    return [
+        decoder.decode_args(cast(LogReceipt, {"topics": topics, "data": data}))
+        for topics, data in raw_logs
+    ]
+
+
+def _decode_call_results(
+    strict_bytes_type_checking: bool, fn_abi_json: str, results: Sequence[bytes]
+) -> List[Any]:
+    codec = _get_codec(strict_bytes_type_checking)
+    call_plan = get_call_plan(_load_abi(fn_abi_json))
+    decoded_results = []
+    for return_data in results:
+        try:
+            decoded_results.append(call_plan.decode_output(codec, return_data))
+        except DecodingError as e:
+            raise BadFunctionCallOutput(
+                f"Could not decode contract function call to "
+                f"{call_plan.fn_abi.get('name')} with return data: "
+                f"{str(return_data)}, output_types: {call_plan.output_types}"
+            ) from e
+    return decoded_results
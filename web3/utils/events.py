@@ -0,0 +1,212 @@
+"""
+Decode logs of any of the events of one or more contract ABIs, or logs of one
+event into columns.
+
+Decoding arbitrary logs by trying the ``process_log`` of every event of a
+contract is quadratic. An ``EventLogDecoder`` indexes the event decoders (see
+``web3._utils.events.get_event_decoder``) by event topic once, so each log is
+decoded by looking up its first topic.
+
+``decode_logs_columnar`` decodes many logs of one event into a list or NumPy
+array per argument, for analytics, without building an ``AttributeDict`` per
+log.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from eth_abi import (
+    grammar,
+)
+from eth_abi.codec import (
+    ABICodec,
+)
+from eth_typing import (
+    TypeStr,
+)
+from eth_utils import (
+    encode_hex,
+)
+
+from web3._utils.abi import (
+    filter_by_type,
+)
+from web3._utils.events import (
+    EventDecoder,
+    _log_entry_data_to_bytes,
+    get_event_decoder,
+    process_logs,
+)
+from web3.exceptions import (
+    LogTopicError,
+    MismatchedABI,
+)
+from web3.logs import (
+    WARN,
+    EventLogErrorFlags,
+)
+from web3.types import (
+    ABI,
+    ABIEvent,
+    EventData,
+    LogReceipt,
+    TxReceipt,
+)
+
+
+class EventLogDecoder:
+    """
+    Decodes logs of any of the non-anonymous events of ``abis``, with
+    ``abi_codec``, usually ``w3.codec``:
+
+    .. code-block:: python
+
+        decoder = EventLogDecoder(w3.codec, pool_abi, router_abi)
+        events = decoder.process_receipt(receipt, errors=DISCARD)
+
+    Events of different ABIs with the same signature, but different indexed
+    arguments, like the ERC-20 and ERC-721 ``Transfer`` events, are told apart
+    by their number of topics. Logs of anonymous events have no event topic,
+    so they can't be decoded.
+    """
+
+    def __init__(self, abi_codec: ABICodec, *abis: ABI) -> None:
+        decoders: Dict[bytes, List[EventDecoder]] = {}
+        for abi in abis:
+            for event_abi in filter_by_type("event", abi):
+                if event_abi.get("anonymous", False):
+                    continue
+                decoder = get_event_decoder(abi_codec, event_abi)
+                same_topic_decoders = decoders.setdefault(decoder.topic, [])
+                if all(other.event_abi != event_abi for other in same_topic_decoders):
+                    same_topic_decoders.append(decoder)
+        self._decoders: Dict[bytes, Tuple[EventDecoder, ...]] = {
+            topic: tuple(same_topic_decoders)
+            for topic, same_topic_decoders in decoders.items()
+        }
+
+    def process_log(self, log: LogReceipt) -> EventData:
+        """
+        Decode ``log`` with the event whose topic is its first topic. Raises
+        ``MismatchedABI`` if there is no such event.
+        """
+        if not log["topics"]:
+            raise MismatchedABI("Expected non-anonymous event to have 1 or more topics")
+
+        topic = _log_entry_data_to_bytes(log["topics"][0])
+        decoders = self._decoders.get(topic)
+        if decoders is None:
+            raise MismatchedABI(
+                f"The event signature {encode_hex(topic)} did not match any event "
+                "of the provided ABIs"
+            )
+
+        for decoder in decoders[:-1]:
+            try:
+                return decoder.decode(log)
+            except LogTopicError:
+                # an event with the same signature and other indexed arguments
+                continue
+        return decoders[-1].decode(log)
+
+    def process_logs(
+        self, logs: Iterable[LogReceipt], errors: EventLogErrorFlags = WARN
+    ) -> Tuple[EventData, ...]:
+        """
+        Decode ``logs``, in one pass. Logs that can't be decoded are handled as
+        by ``ContractEvent.process_receipt``.
+        """
+        return process_logs(logs, self.process_log, errors)
+
+    def process_receipt(
+        self, txn_receipt: TxReceipt, errors: EventLogErrorFlags = WARN
+    ) -> Tuple[EventData, ...]:
+        """
+        Decode the logs of ``txn_receipt``, like ``process_logs``.
+        """
+        return self.process_logs(txn_receipt["logs"], errors)
+
+
+def decode_logs_columnar(
+    abi_codec: ABICodec,
+    event_abi: ABIEvent,
+    logs: Iterable[LogReceipt],
+    as_numpy: bool = False,
+) -> Dict[str, Any]:
+    """
+    Decode ``logs``, which must all be logs of the event ``event_abi``, into a
+    dict of columns: one per event argument and per log field (``address``,
+    ``blockHash``, ``blockNumber``, ``logIndex``, ``transactionHash`` and
+    ``transactionIndex``), keyed by name.
+
+    Columns are lists, or NumPy arrays with ``as_numpy=True``, which requires
+    the ``numpy`` package. Addresses, hashes and ``bytesN`` values are
+    ``bytes``, or fixed-width byte string arrays (``S20``, ``S32``...), whose
+    items NumPy returns without their trailing zero bytes: use ``tobytes`` or
+    a ``uint8`` view of the array for the exact bytes.
+    Integers are Python integers, or ``int64`` arrays when they all fit,
+    ``uint64`` arrays when they don't but are all unsigned and fit, and object
+    arrays otherwise. Other values are as eth-abi decodes them, in object
+    arrays.
+
+    Raises like ``get_event_data`` if a log isn't a log of the event.
+    """
+    decoder = get_event_decoder(abi_codec, event_abi)
+    columns = decoder.decode_columns(logs)
+    if not as_numpy:
+        return columns
+
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "as_numpy=True requires the numpy package: pip install numpy"
+        ) from exc
+
+    return {
+        name: _to_array(numpy, decoder.column_types[name], values)
+        for name, values in columns.items()
+    }
+
+
+def _to_array(numpy: Any, type_str: TypeStr, values: Sequence[Any]) -> Any:
+    abi_type = grammar.parse(type_str)
+    if isinstance(abi_type, grammar.BasicType) and not abi_type.is_array:
+        if abi_type.base == "address":
+            return numpy.array(values, dtype="S20")
+        elif abi_type.base == "bytes" and abi_type.sub is not None:
+            return numpy.array(values, dtype=f"S{abi_type.sub}")
+        elif abi_type.base == "bool":
+            return numpy.array(values, dtype=bool)
+        elif abi_type.base in ("int", "uint"):
+            return _to_int_array(numpy, values)
+
+    return _to_object_array(numpy, values)
+
+
+def _to_int_array(numpy: Any, values: Sequence[Any]) -> Any:
+    try:
+        low, high = min(values, default=0), max(values, default=0)
+    except TypeError:
+        # e.g. the ``None`` block numbers of pending logs
+        return _to_object_array(numpy, values)
+
+    if -(2**63) <= low and high < 2**63:
+        return numpy.array(values, dtype=numpy.int64)
+    elif 0 <= low and high < 2**64:
+        return numpy.array(values, dtype=numpy.uint64)
+    return _to_object_array(numpy, values)
+
+
+def _to_object_array(numpy: Any, values: Sequence[Any]) -> Any:
+    array = numpy.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        # assigned one by one, so that tuples and lists aren't made dimensions
+        array[index] = value
+    return array
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Union,
+)
+
+from web3.types import (
+    BlockData,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.providers import (  # noqa: F401
+        AsyncBaseProvider,
+        BaseProvider,
+    )
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class _BaseHeadTracker:
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.poll_interval = poll_interval
+        self.head: Optional[BlockData] = None
+        self.updated_at: Optional[float] = None
+
+    def update(self, block: BlockData) -> None:
+        """
+        Set the head, e.g. to a block header received from a ``newHeads``
+        subscription. It counts as current for ``poll_interval`` seconds.
+        """
+        self.head = block
+        self.updated_at = time.monotonic()
+
+    def is_current(self) -> bool:
+        return (
+            self.head is not None
+            and self.updated_at is not None
+            and time.monotonic() - self.updated_at < self.poll_interval
+        )
+
+
+class HeadTracker(_BaseHeadTracker):
+    """
+    The latest block of a connection, fetched at most once per
+    ``poll_interval`` seconds and shared by everything reading it.
+    """
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(poll_interval)
+        self._lock = threading.Lock()
+
+    def latest(self, w3: "Web3") -> BlockData:
+        if not self.is_current():
+            with self._lock:
+                if not self.is_current():
+                    self.update(w3.eth.get_block("latest"))
+        return self.head
+
+
+class AsyncHeadTracker(_BaseHeadTracker):
+    """
+    The latest block of a connection, fetched at most once per
+    ``poll_interval`` seconds and shared by everything reading it.
+    """
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(poll_interval)
+        self._lock = asyncio.Lock()
+
+    async def latest(self, async_w3: "AsyncWeb3") -> BlockData:
+        if not self.is_current():
+            async with self._lock:
+                if not self.is_current():
+                    self.update(await async_w3.eth.get_block("latest"))
+        return self.head
+
+
+def _provider_head_tracker(
+    provider: Union["BaseProvider", "AsyncBaseProvider"],
+    tracker_class: type,
+) -> Union[HeadTracker, AsyncHeadTracker]:
+    head_tracker = getattr(provider, "_head_tracker", None)
+    if not isinstance(head_tracker, tracker_class):
+        head_tracker = tracker_class()
+        provider._head_tracker = head_tracker
+    return head_tracker
+
+
+def get_head_tracker(w3: "Web3") -> HeadTracker:
+    """
+    The head tracker of the ``w3`` provider. It is created on first use.
+    """
+    return _provider_head_tracker(w3.provider, HeadTracker)
+
+
+def get_async_head_tracker(async_w3: "AsyncWeb3") -> AsyncHeadTracker:
+    """
+    The head tracker of the ``async_w3`` provider. It is created on first use.
+    """
+    return _provider_head_tracker(async_w3.provider, AsyncHeadTracker)
@@ -0,0 +1,373 @@
+"""
+Batch contract reads into a single ``eth_call`` to Multicall3's ``aggregate3``.
+
+Multicall3 is deployed at the same address on most EVM chains. Each call is
+encoded, and its result decoded, with the call plan of the contract function
+(see ``web3._utils.call_plans``), so results are the same as the ones of
+``ContractFunction.call``.
+"""
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from eth_abi.exceptions import (
+    DecodingError,
+)
+from eth_typing import (
+    ChecksumAddress,
+)
+from eth_utils import (
+    encode_hex,
+    to_checksum_address,
+)
+from eth_utils.toolz import (
+    partition_all,
+)
+
+from web3._utils.call_plans import (
+    CallPlan,
+    get_call_plan,
+)
+from web3._utils.contracts import (
+    async_parse_block_identifier,
+    parse_block_identifier,
+)
+from web3.exceptions import (
+    BadFunctionCallOutput,
+)
+from web3.types import (
+    BlockIdentifier,
+    TxParams,
+)
+
+if TYPE_CHECKING:
+    from web3.contract.async_contract import (  # noqa: F401
+        AsyncContractFunction,
+    )
+    from web3.contract.contract import (  # noqa: F401
+        ContractFunction,
+    )
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+MULTICALL3_ADDRESS = ChecksumAddress("0xcA11bde05977b3631167028862bE2a173976CA11")
+# aggregate3((address target, bool allowFailure, bytes callData)[] calls)
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+AGGREGATE3_INPUT_TYPES = ["(address,bool,bytes)[]"]
+AGGREGATE3_OUTPUT_TYPES = ["(bool,bytes)[]"]
+DEFAULT_BATCH_SIZE = 500
+
+
+class MulticallCall(NamedTuple):
+    target: ChecksumAddress
+    allow_failure: bool
+    call_data: bytes
+    call_plan: CallPlan
+    decode_tuples: bool
+
+
+class _BaseMulticall:
+    def __init__(
+        self,
+        w3: Union["AsyncWeb3", "Web3"],
+        address: ChecksumAddress = MULTICALL3_ADDRESS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self.w3 = w3
+        self.address = to_checksum_address(address)
+        self.batch_size = batch_size
+        self.calls: List[MulticallCall] = []
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    def _prepare_call(
+        self,
+        function: Union["AsyncContractFunction", "ContractFunction"],
+        allow_failure: bool,
+    ) -> MulticallCall:
+        if function.address is None:
+            raise ValueError(
+                "Please ensure that this contract instance has an address."
+            )
+        call_plan = get_call_plan(function.abi, function._return_data_normalizers)
+        call_data = call_plan.encode_input(self.w3, function.args, function.kwargs)
+        return MulticallCall(
+            function.address,
+            allow_failure,
+            bytes.fromhex(call_data[2:]),
+            call_plan,
+            bool(function.decode_tuples),
+        )
+
+    def _build_transaction(self, calls: Sequence[MulticallCall]) -> TxParams:
+        aggregated_calls = [
+            (call.target, call.allow_failure, call.call_data) for call in calls
+        ]
+        return {
+            "to": self.address,
+            "data": encode_hex(
+                AGGREGATE3_SELECTOR
+                + self.w3.codec.encode(AGGREGATE3_INPUT_TYPES, [aggregated_calls])
+            ),
+        }
+
+    def _decode_results(
+        self, calls: Sequence[MulticallCall], return_data: bytes
+    ) -> List[Tuple[bool, bytes]]:
+        try:
+            (results,) = self.w3.codec.decode(AGGREGATE3_OUTPUT_TYPES, return_data)
+        except DecodingError as e:
+            if not return_data:
+                msg = (
+                    f"Could not call Multicall3 at {self.address}, is Multicall3 "
+                    "deployed at this address on this chain?"
+                )
+            else:
+                msg = (
+                    f"Could not decode the aggregate3 call to Multicall3 at "
+                    f"{self.address} with return data: {str(return_data)}"
+                )
+            raise BadFunctionCallOutput(msg) from e
+        if len(results) != len(calls):
+            raise BadFunctionCallOutput(
+                f"Multicall3 at {self.address} returned {len(results)} results "
+                f"for {len(calls)} calls"
+            )
+        return results
+
+    def _decode_result(
+        self, call: MulticallCall, success: bool, return_data: bytes
+    ) -> Any:
+        """
+        Decode the result of one call, or return ``None`` if it failed and
+        is allowed to fail. Multicall3 reverts if a call that is not allowed to
+        fail reverts, so ``success`` is only false for the ones that are.
+        """
+        if not success:
+            return None
+        try:
+            return call.call_plan.decode_output(
+                self.w3.codec, return_data, call.decode_tuples
+            )
+        except DecodingError as e:
+            if call.allow_failure:
+                return None
+            raise BadFunctionCallOutput(
+                f"Could not decode contract function call to "
+                f"{call.call_plan.fn_abi.get('name')} at {call.target} with return "
+                f"data: {str(return_data)}, output_types: "
+                f"{call.call_plan.output_types}"
+            ) from e
+
+
+class Multicall(_BaseMulticall):
+    """
+    Contract reads collected with ``add`` and sent, ``batch_size`` calls at a
+    time, as ``eth_call`` requests to Multicall3's ``aggregate3``:
+
+    .. code-block:: python
+
+        multicall = w3.multicall()
+        multicall.add(token.functions.balanceOf(holder))
+        multicall.add(pair.functions.getReserves(), allow_failure=True)
+        balance, reserves = multicall.call()
+
+    The calls are kept, so ``call`` can be run again, e.g. for every new block.
+    """
+
+    w3: "Web3"
+
+    def add(
+        self, function: "ContractFunction", allow_failure: bool = False
+    ) -> "Multicall":
+        """
+        Add the call of a contract function, with its arguments bound. The
+        result of a call that is allowed to fail is ``None`` if it reverts or
+        its return data can't be decoded.
+        """
+        self.calls.append(self._prepare_call(function, allow_failure))
+        return self
+
+    def call(self, block_identifier: Optional[BlockIdentifier] = None) -> List[Any]:
+        """
+        Make the calls and return their results, in the order they were added.
+        """
+        block_id = parse_block_identifier(self.w3, block_identifier)
+        batches = list(partition_all(self.batch_size, self.calls))
+        if len(batches) > 1 and block_id == "latest":
+            # read every batch from the same block
+            block_id = self.w3.eth.block_number
+
+        results = []
+        for batch in batches:
+            return_data = self.w3.eth.call(
+                self._build_transaction(batch), block_identifier=block_id
+            )
+            for call, (success, call_return_data) in zip(
+                batch, self._decode_results(batch, return_data)
+            ):
+                results.append(self._decode_result(call, success, call_return_data))
+        return results
+
+
+class AsyncMulticall(_BaseMulticall):
+    """
+    Contract reads collected with ``add`` and sent, ``batch_size`` calls at a
+    time, as ``eth_call`` requests to Multicall3's ``aggregate3``.
+
+    Calls can also be batched automatically with ``load``: the calls loaded in
+    the same iteration of the event loop, e.g. by coroutines run with
+    ``asyncio.gather``, are sent together once the iteration is over:
+
+    .. code-block:: python
+
+        multicall = async_w3.multicall()
+        balances = await asyncio.gather(
+            *(multicall.load(token.functions.balanceOf(h)) for h in holders)
+        )
+    """
+
+    w3: "AsyncWeb3"
+
+    def __init__(
+        self,
+        w3: "AsyncWeb3",
+        address: ChecksumAddress = MULTICALL3_ADDRESS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        super().__init__(w3, address, batch_size)
+        self._pending: Dict[
+            Hashable, List[Tuple[MulticallCall, "asyncio.Future[Any]"]]
+        ] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def add(
+        self, function: "AsyncContractFunction", allow_failure: bool = False
+    ) -> "AsyncMulticall":
+        """
+        Add the call of a contract function, with its arguments bound. The
+        result of a call that is allowed to fail is ``None`` if it reverts or
+        its return data can't be decoded.
+        """
+        self.calls.append(self._prepare_call(function, allow_failure))
+        return self
+
+    async def call(
+        self, block_identifier: Optional[BlockIdentifier] = None
+    ) -> List[Any]:
+        """
+        Make the calls and return their results, in the order they were added.
+        """
+        block_id = await async_parse_block_identifier(self.w3, block_identifier)
+        batches = list(partition_all(self.batch_size, self.calls))
+        if len(batches) > 1 and block_id == "latest":
+            # read every batch from the same block
+            block_id = await self.w3.eth.block_number
+
+        results = []
+        for batch in batches:
+            for call, (success, call_return_data) in zip(
+                batch, await self._call_batch(batch, block_id)
+            ):
+                results.append(self._decode_result(call, success, call_return_data))
+        return results
+
+    def load(
+        self,
+        function: "AsyncContractFunction",
+        allow_failure: bool = False,
+        block_identifier: Optional[BlockIdentifier] = None,
+    ) -> "asyncio.Future[Any]":
+        """
+        Return a future for the result of a contract function call, which is
+        sent with the other calls loaded in the same iteration of the event
+        loop, in a single ``aggregate3`` call per block identifier and
+        ``batch_size`` calls.
+        """
+        call = self._prepare_call(function, allow_failure)
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+        future = loop.create_future()
+        self._pending.setdefault(block_identifier, []).append((call, future))
+        return future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        for block_identifier, loaded in pending.items():
+            task = asyncio.ensure_future(self._resolve(loaded, block_identifier))
+            # keep a reference to the task until it is done
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(
+        self,
+        loaded: Sequence[Tuple[MulticallCall, "asyncio.Future[Any]"]],
+        block_identifier: Optional[BlockIdentifier],
+    ) -> None:
+        batches = list(partition_all(self.batch_size, loaded))
+        try:
+            block_id = await async_parse_block_identifier(self.w3, block_identifier)
+            if len(batches) > 1 and block_id == "latest":
+                # read every batch from the same block
+                block_id = await self.w3.eth.block_number
+        except Exception as e:
+            self._set_exception(loaded, e)
+            return
+
+        await asyncio.gather(
+            *(self._resolve_batch(batch, block_id) for batch in batches)
+        )
+
+    async def _resolve_batch(
+        self,
+        loaded: Sequence[Tuple[MulticallCall, "asyncio.Future[Any]"]],
+        block_id: BlockIdentifier,
+    ) -> None:
+        try:
+            results = await self._call_batch([call for call, _ in loaded], block_id)
+        except Exception as e:
+            self._set_exception(loaded, e)
+            return
+
+        for (call, future), (success, return_data) in zip(loaded, results):
+            if future.done():
+                # cancelled
+                continue
+            try:
+                future.set_result(self._decode_result(call, success, return_data))
+            except Exception as e:
+                future.set_exception(e)
+
+    @staticmethod
+    def _set_exception(
+        loaded: Sequence[Tuple[MulticallCall, "asyncio.Future[Any]"]], e: Exception
+    ) -> None:
+        for _, future in loaded:
+            if not future.done():
+                future.set_exception(e)
+
+    async def _call_batch(
+        self, calls: Sequence[MulticallCall], block_id: BlockIdentifier
+    ) -> List[Tuple[bool, bytes]]:
+        return_data = await self.w3.eth.call(
+            self._build_transaction(calls), block_identifier=block_id
+        )
+        return self._decode_results(calls, return_data)